@@ -3,7 +3,17 @@ from flask_cors import CORS
 from flask_migrate import Migrate
 
 from app.utils.database import db
+from app.utils.availability import availability_store
+from app.utils.background import register_periodic_task, start_periodic_tasks
+from app.utils.columnar import columnar_station_index
+from app.utils.events import event_broadcaster
+from app.utils.heartbeats import heartbeat_monitor
+from app.utils.search import station_search_index, station_suggest_index
+from app.utils.station_filters import station_statement_cache
+from app.utils.snapshots import snapshot_writer
+from app.utils.telemetry import telemetry_buffer
 from app.routes import register_blueprints
+from app.cli import register_commands
 from app.middlewares.error_handlers import register_error_handlers
 from config import config
 
@@ -20,6 +30,15 @@ def create_app(config_name=None):
     db.init_app(app)
     migrate = Migrate(app, db)
     CORS(app)
+    availability_store.init_app(app)
+    event_broadcaster.init_app(app)
+    heartbeat_monitor.init_app(app)
+    snapshot_writer.init_app(app)
+    station_search_index.init_app(app)
+    station_suggest_index.init_app(app)
+    columnar_station_index.init_app(app)
+    station_statement_cache.init_app(app)
+    telemetry_buffer.init_app(app)
     
 
     register_blueprints(app)
@@ -27,6 +46,10 @@ def create_app(config_name=None):
 
     register_error_handlers(app)
     
+    register_commands(app)
+    
+    _register_background_tasks(app)
+    
 
     with app.app_context():
         db.create_all()
@@ -43,3 +66,30 @@ def _create_default_admin():
         admin_user.set_password('admin123')
         db.session.add(admin_user)
         db.session.commit()
+
+
+def _register_background_tasks(app):
+    from app.services.charging_station_service import ChargingStationService
+    from app.services.station_change_service import StationChangeService
+    from app.services.telemetry_service import TelemetryService
+    
+    register_periodic_task(
+        app,
+        'heartbeat-sweep',
+        app.config['HEARTBEAT_SWEEP_INTERVAL'],
+        ChargingStationService.sweep_stale_stations
+    )
+    register_periodic_task(
+        app,
+        'telemetry-downsample',
+        app.config['TELEMETRY_DOWNSAMPLE_INTERVAL'],
+        TelemetryService.downsample
+    )
+    register_periodic_task(
+        app,
+        'change-log-compact',
+        app.config['CHANGE_LOG_COMPACT_INTERVAL'],
+        StationChangeService.compact
+    )
+
+    app.before_request(lambda: start_periodic_tasks(app))
@@ -0,0 +1,233 @@
+import gc
+import os
+import time
+import tracemalloc
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import click
+from flask.cli import AppGroup
+
+from app.models.charging_station import ChargingStation
+from app.models.import_checkpoint import ImportCheckpoint
+from app.services.charging_station_service import ChargingStationService
+from app.services.station_sync_service import StationSyncService
+from app.utils.database import db
+from app.utils.generators import generate_stations
+from app.utils.helpers import chunked
+from app.utils.importers import ImportFormatError, detect_format, iter_station_records
+from app.utils.station_filters import StationFilterSpec
+
+stations_cli = AppGroup('stations', help='Charging station maintenance commands.')
+
+
+@stations_cli.command('import')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--format', 'file_format', type=click.Choice(['csv', 'geojson']),
+              help='File format. Detected from the extension when omitted.')
+@click.option('--chunk-size', default=5000, show_default=True,
+              help='Rows validated and inserted per transaction.')
+@click.option('--workers', default=0, show_default=True,
+              help='Validate chunks in a process pool of this size.')
+@click.option('--resume/--no-resume', default=True, show_default=True,
+              help='Continue from the checkpoint left by an interrupted import.')
+@click.option('--max-errors', default=20, show_default=True,
+              help='Number of row errors printed.')
+def import_stations(path, file_format, chunk_size, workers, resume, max_errors):
+    try:
+        file_format = file_format or detect_format(path)
+    except ImportFormatError as e:
+        raise click.ClickException(str(e))
+    
+    source = os.path.abspath(path)
+    checkpoint = ImportCheckpoint.query.filter_by(source=source).first()
+    
+    if checkpoint is not None and not resume:
+        db.session.delete(checkpoint)
+        db.session.commit()
+        checkpoint = None
+    
+    if checkpoint is None:
+        checkpoint = ImportCheckpoint(source=source, byte_offset=0, rows=0, created=0, failed=0)
+    elif checkpoint.rows:
+        click.echo(f"Resuming {path} after {checkpoint.rows} rows")
+    
+    started_at = time.monotonic()
+    imported_rows = 0
+    reported_errors = 0
+    
+    try:
+        records = iter_station_records(path, file_format, checkpoint.byte_offset)
+        chunks = _iter_chunks(records, chunk_size, checkpoint.rows)
+        
+        for valid_rows, errors, row_count, end_offset in _prepare_chunks(chunks, workers):
+            checkpoint.created += len(valid_rows)
+            checkpoint.failed += len(errors)
+            checkpoint.rows += row_count
+            checkpoint.byte_offset = end_offset
+            db.session.add(checkpoint)
+            
+            if valid_rows:
+                ChargingStationService.insert_bulk_rows(valid_rows)
+            else:
+                db.session.commit()
+            
+            for error in errors[:max(max_errors - reported_errors, 0)]:
+                messages = '; '.join(row_error['message'] for row_error in error['errors'])
+                click.echo(f"Row {error['index']}: {messages}", err=True)
+            reported_errors += len(errors)
+            
+            imported_rows += row_count
+            elapsed = max(time.monotonic() - started_at, 1e-6)
+            click.echo(
+                f"{checkpoint.rows} rows processed, {checkpoint.created} created, "
+                f"{checkpoint.failed} failed ({imported_rows / elapsed:,.0f} rows/s)"
+            )
+    except ImportFormatError as e:
+        raise click.ClickException(str(e))
+    
+    created, failed = checkpoint.created, checkpoint.failed
+    
+    if checkpoint.id is not None:
+        db.session.delete(checkpoint)
+        db.session.commit()
+    
+    click.echo(f"Import finished: {created} created, {failed} failed")
+
+
+@stations_cli.command('generate')
+@click.argument('count', type=click.IntRange(min=1))
+@click.option('--seed', default=0, show_default=True,
+              help='Random seed. The same seed always produces the same stations.')
+@click.option('--batch-size', default=10000, show_default=True,
+              help='Rows generated and inserted per transaction.')
+def generate_stations_command(count, seed, batch_size):
+    started_at = time.monotonic()
+    created = 0
+    
+    for batch in generate_stations(count, seed=seed, batch_size=batch_size):
+        created += ChargingStationService.insert_bulk_rows(batch)
+        
+        elapsed = max(time.monotonic() - started_at, 1e-6)
+        click.echo(f'{created} of {count} stations created ({created / elapsed:,.0f} rows/s)')
+    
+    click.echo(f'Generated {created} stations in {time.monotonic() - started_at:.1f}s')
+
+
+@stations_cli.command('sync')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--source', required=True, help='Feed identifier that scopes external ids.')
+@click.option('--format', 'file_format', type=click.Choice(['csv', 'geojson']),
+              help='File format. Detected from the extension when omitted.')
+@click.option('--dry-run', is_flag=True, help='Only print the reconciliation plan.')
+@click.option('--delete-missing', is_flag=True,
+              help='Delete stations of this source that are absent from the feed.')
+def sync_stations(path, source, file_format, dry_run, delete_missing):
+    try:
+        file_format = file_format or detect_format(path)
+        records = (record for record, _ in iter_station_records(path, file_format))
+        result = StationSyncService.sync(source, records, dry_run=dry_run, delete_missing=delete_missing)
+    except (ImportFormatError, ValueError) as e:
+        raise click.ClickException(str(e))
+    
+    for error in result['errors'][:20]:
+        messages = '; '.join(row_error['message'] for row_error in error['errors'])
+        click.echo(f"Row {error['index']}: {messages}", err=True)
+    
+    prefix = 'Planned' if dry_run else 'Applied'
+    click.echo(
+        f"{prefix}: {result['inserted']} inserts, {result['updated']} updates, "
+        f"{result['deleted']} deletes, {result['unchanged']} unchanged, {result['failed']} failed"
+    )
+
+
+@stations_cli.command('refresh-keys')
+@click.option('--batch-size', default=5000, show_default=True,
+              help='Rows updated per transaction.')
+def refresh_keys(batch_size):
+    refreshed = ChargingStationService.refresh_city_keys(batch_size=batch_size)
+    click.echo(f'Refreshed search keys of {refreshed} stations')
+
+
+@stations_cli.command('bench-reads')
+@click.option('--rows', default=100000, show_default=True, type=click.IntRange(min=1),
+              help='Stations read by each strategy.')
+def bench_reads(rows):
+    available = StationFilterSpec().count()
+    if available < rows:
+        raise click.ClickException(
+            f'Only {available} stations stored; run "flask stations generate {rows}" first'
+        )
+    
+    strategies = {
+        'orm': lambda: ChargingStation.query.order_by(ChargingStation.id).limit(rows).all(),
+        'dto': lambda: StationFilterSpec().fetch(limit=rows)
+    }
+    
+    for name, load in strategies.items():
+        elapsed = _measure_read(load, trace=False)[0]
+        retained, peak = _measure_read(load, trace=True)[1:]
+        
+        click.echo(
+            f'{name}: {elapsed * 1000:,.0f} ms, {elapsed / rows * 1e6:.2f} us/row, '
+            f'{retained / rows:,.0f} B/row retained, {peak / rows:,.0f} B/row peak'
+        )
+
+
+def _measure_read(load, trace):
+    db.session.expunge_all()
+    gc.collect()
+    
+    if trace:
+        tracemalloc.start()
+    
+    started_at = time.perf_counter()
+    items = load()
+    payload = [item.to_dict() for item in items]
+    elapsed = time.perf_counter() - started_at
+    del payload
+    
+    retained = peak = 0
+    if trace:
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    
+    del items
+    db.session.expunge_all()
+    
+    return elapsed, retained, peak
+
+
+def _iter_chunks(records, chunk_size, start_index):
+    for chunk in chunked(records, chunk_size):
+        yield start_index, [record for record, _ in chunk], chunk[-1][1]
+        start_index += len(chunk)
+
+
+def _prepare_chunk(chunk):
+    start_index, records, end_offset = chunk
+    valid_rows, errors = ChargingStationService.prepare_bulk_rows(records, start_index)
+    return valid_rows, errors, len(records), end_offset
+
+
+def _prepare_chunks(chunks, workers):
+    if workers <= 1:
+        for chunk in chunks:
+            yield _prepare_chunk(chunk)
+        return
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        
+        for chunk in chunks:
+            pending.append(executor.submit(_prepare_chunk, chunk))
+            
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        
+        while pending:
+            yield pending.popleft().result()
+
+
+def register_commands(app):
+    app.cli.add_command(stations_cli)
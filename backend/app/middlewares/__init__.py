@@ -1,4 +1,6 @@
-from .auth_middleware import token_required, admin_required, optional_auth
+from .auth_middleware import token_required, admin_required, optional_auth, station_key_required
 from .error_handlers import register_error_handlers
 
-__all__ = ['token_required', 'admin_required', 'optional_auth', 'register_error_handlers']
\ No newline at end of file
+__all__ = [
+    'token_required', 'admin_required', 'optional_auth', 'station_key_required', 'register_error_handlers'
+]
\ No newline at end of file
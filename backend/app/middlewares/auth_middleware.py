@@ -69,4 +69,20 @@ def admin_required(f):
         
         return f(current_user, *args, **kwargs)
     
+    return decorated
+
+
+def station_key_required(f):
+    @wraps(f)
+    def decorated(*args, **kwargs):
+        station_key = request.headers.get('X-Station-Key')
+        
+        if not AuthService.verify_station_key(kwargs.get('station_id'), station_key):
+            return jsonify({
+                'error': 'Invalid station key',
+                'message': 'Please provide the station key in the X-Station-Key header'
+            }), 401
+        
+        return f(*args, **kwargs)
+    
     return decorated
\ No newline at end of file
@@ -1,5 +1,10 @@
 
 from .user import User
-from .charging_station import ChargingStation
+from .charging_station import ChargingStation, StationRow
+from .station_spot import StationSpot
+from .meter_reading import MeterReading, MeterRollup, MeterRollupMark
+from .station_change import StationChange
+from .import_checkpoint import ImportCheckpoint
 
-__all__ = ['User', 'ChargingStation']
+__all__ = ['User', 'ChargingStation', 'StationSpot', 'MeterReading', 'MeterRollup', 'StationChange', 'StationRow',
+           'ImportCheckpoint', 'MeterRollupMark']
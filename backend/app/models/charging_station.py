@@ -1,15 +1,45 @@
+import hashlib
+import json
+from dataclasses import dataclass, fields
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DDL, event
+
 from app.utils.database import db
+from app.utils.helpers import normalize_search_key
 from .base import BaseModel
 
+_hash_encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
 
 class ChargingStation(BaseModel):
     __tablename__ = 'charging_stations'
+    __table_args__ = (
+        db.UniqueConstraint('source', 'external_id', name='uq_charging_stations_source_external_id'),
+        db.Index('ix_charging_stations_state_charger_type_power_kw', 'state', 'charger_type', 'power_kw'),
+        db.Index('ix_charging_stations_status_charger_type_power_kw', 'status', 'charger_type', 'power_kw'),
+        db.Index('ix_charging_stations_state_city_key', 'state', 'city_key'),
+        db.Index('ix_charging_stations_updated_at', 'updated_at'),
+        db.Index(
+            'ix_charging_stations_city_key_pattern',
+            'city_key',
+            postgresql_ops={'city_key': 'varchar_pattern_ops'}
+        ).ddl_if(dialect='postgresql'),
+        db.Index(
+            'ix_charging_stations_city_key_trgm',
+            'city_key',
+            postgresql_using='gin',
+            postgresql_ops={'city_key': 'gin_trgm_ops'}
+        ).ddl_if(dialect='postgresql'),
+    )
     
     name = db.Column(db.String(255), nullable=False)
     latitude = db.Column(db.Float, nullable=False)
     longitude = db.Column(db.Float, nullable=False)
     state = db.Column(db.String(2), nullable=False, index=True)
     city = db.Column(db.String(255), nullable=False, index=True)
+    city_key = db.Column(db.String(255), nullable=True, index=True)
     charger_type = db.Column(
         db.Enum('AC', 'DC', 'BOTH', name='charger_types'), 
         nullable=False,
@@ -22,41 +52,114 @@ class ChargingStation(BaseModel):
         nullable=False,
         index=True
     )
+    source = db.Column(db.String(64), nullable=True)
+    external_id = db.Column(db.String(255), nullable=True)
+    content_hash = db.Column(db.String(32), nullable=True)
+    available_spots = db.Column(db.Integer, nullable=True, index=True)
+    
+    data_fields = [
+        'name', 'latitude', 'longitude', 'charger_type', 'power_kw',
+        'num_spots', 'status', 'state', 'city'
+    ]
     
     def to_dict(self):
-        return {
-            'id': self.id,
-            'name': self.name,
-            'latitude': self.latitude,
-            'longitude': self.longitude,
-            'charger_type': self.charger_type,
-            'power_kw': self.power_kw,
-            'num_spots': self.num_spots,
-            'status': self.status,
-            'state': self.state,
-            'city': self.city,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+        return _station_dict(self)
+    
+    @classmethod
+    def compute_content_hash(cls, data):
+        values = [
+            data['name'],
+            float(data['latitude']),
+            float(data['longitude']),
+            data['charger_type'],
+            float(data['power_kw']),
+            int(data['num_spots']),
+            data['status'],
+            data['state'],
+            data['city']
+        ]
+        payload = _hash_encoder.encode(values)
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def refresh_content_hash(self):
+        self.content_hash = self.compute_content_hash(
+            {field: getattr(self, field) for field in self.data_fields}
+        )
+    
+    @classmethod
+    def compute_city_key(cls, city):
+        return normalize_search_key(city) if city else None
     
     @classmethod
-    def get_by_location(cls, state=None, city=None):
-        query = cls.query
+    def get_by_location(cls, state=None, city=None, city_match='contains'):
+        from app.utils.station_filters import StationFilterSpec
         
-        if state:
-            query = query.filter(cls.state == state.upper())
-        if city:
-            query = query.filter(cls.city.ilike(f'%{city}%'))
-            
-        return query
+        filters = {'state': state, 'city': city, 'city_match': city_match}
+        return StationFilterSpec({name: value for name, value in filters.items() if value}).apply(cls.query)
     
     @classmethod
     def get_by_status(cls, status):
-        return cls.query.filter(cls.status == status.upper())
+        from app.utils.station_filters import StationFilterSpec
+        
+        return StationFilterSpec({'status': status}).apply(cls.query)
     
     @classmethod
     def get_by_charger_type(cls, charger_type):
-        return cls.query.filter(cls.charger_type == charger_type.upper())
+        from app.utils.station_filters import StationFilterSpec
+        
+        return StationFilterSpec({'type': charger_type}).apply(cls.query)
     
     def __repr__(self):
         return f'<ChargingStation {self.name} - {self.city}/{self.state}>'
+
+
+@dataclass(slots=True)
+class StationRow:
+    id: int
+    name: str
+    latitude: float
+    longitude: float
+    charger_type: str
+    power_kw: float
+    num_spots: int
+    available_spots: Optional[int]
+    status: str
+    state: str
+    city: str
+    source: Optional[str]
+    external_id: Optional[str]
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+    
+    @classmethod
+    def columns(cls):
+        return [getattr(ChargingStation, field.name) for field in fields(cls)]
+    
+    def to_dict(self):
+        return _station_dict(self)
+
+
+STATION_FIELDS = tuple(field.name for field in fields(StationRow))
+
+
+def _station_dict(station):
+    data = {name: getattr(station, name) for name in STATION_FIELDS}
+    
+    for name in ('created_at', 'updated_at'):
+        data[name] = data[name].isoformat() if data[name] else None
+    
+    return data
+
+
+@event.listens_for(ChargingStation, 'before_insert')
+@event.listens_for(ChargingStation, 'before_update')
+def _refresh_station_content_hash(mapper, connection, target):
+    target.refresh_content_hash()
+    target.city_key = ChargingStation.compute_city_key(target.city)
+
+
+event.listen(
+    ChargingStation.__table__,
+    'before_create',
+    DDL('CREATE EXTENSION IF NOT EXISTS pg_trgm').execute_if(dialect='postgresql')
+)
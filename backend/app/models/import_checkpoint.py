@@ -0,0 +1,15 @@
+from app.utils.database import db
+from .base import BaseModel
+
+
+class ImportCheckpoint(BaseModel):
+    __tablename__ = 'import_checkpoints'
+    
+    source = db.Column(db.String(1024), nullable=False, unique=True)
+    byte_offset = db.Column(db.BigInteger, nullable=False, default=0)
+    rows = db.Column(db.Integer, nullable=False, default=0)
+    created = db.Column(db.Integer, nullable=False, default=0)
+    failed = db.Column(db.Integer, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f'<ImportCheckpoint {self.source} @{self.byte_offset}>'
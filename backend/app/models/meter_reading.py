@@ -0,0 +1,101 @@
+from app.utils.database import db, dialect_insert
+
+
+class MeterReading(db.Model):
+    __tablename__ = 'meter_readings'
+    __table_args__ = (
+        db.Index('ix_meter_readings_station_recorded_at', 'station_id', 'recorded_at'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    station_id = db.Column(
+        db.Integer,
+        db.ForeignKey('charging_stations.id', ondelete='CASCADE'),
+        nullable=False
+    )
+    recorded_at = db.Column(db.Integer, nullable=False, index=True)
+    energy_kwh = db.Column(db.Float, nullable=False)
+    power_kw = db.Column(db.Float, nullable=False)
+    
+    def to_dict(self):
+        return {
+            'station_id': self.station_id,
+            'recorded_at': self.recorded_at,
+            'energy_kwh': self.energy_kwh,
+            'power_kw': self.power_kw
+        }
+    
+    def __repr__(self):
+        return f'<MeterReading {self.station_id}@{self.recorded_at}>'
+
+
+class MeterRollup(db.Model):
+    __tablename__ = 'meter_rollups'
+    __table_args__ = (
+        db.UniqueConstraint('station_id', 'resolution', 'bucket_start', name='uq_meter_rollups_bucket'),
+        db.Index('ix_meter_rollups_resolution_bucket_start', 'resolution', 'bucket_start'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    station_id = db.Column(
+        db.Integer,
+        db.ForeignKey('charging_stations.id', ondelete='CASCADE'),
+        nullable=False
+    )
+    resolution = db.Column(db.String(2), nullable=False)
+    bucket_start = db.Column(db.Integer, nullable=False)
+    energy_kwh = db.Column(db.Float, nullable=False)
+    power_sum = db.Column(db.Float, nullable=False)
+    power_max = db.Column(db.Float, nullable=False)
+    samples = db.Column(db.Integer, nullable=False)
+    
+    resolutions = {'1m': 60, '1h': 3600, '1d': 86400}
+    
+    def to_dict(self):
+        return {
+            'bucket_start': self.bucket_start,
+            'energy_kwh': round(self.energy_kwh, 6),
+            'avg_power_kw': round(self.power_sum / self.samples, 3) if self.samples else None,
+            'max_power_kw': self.power_max,
+            'samples': self.samples
+        }
+    
+    def __repr__(self):
+        return f'<MeterRollup {self.station_id} {self.resolution}@{self.bucket_start}>'
+
+
+class MeterRollupMark(db.Model):
+    __tablename__ = 'meter_rollup_marks'
+    __table_args__ = (
+        db.UniqueConstraint('station_id', 'resolution', 'bucket_start', name='uq_meter_rollup_marks_bucket'),
+        db.Index('ix_meter_rollup_marks_resolution_bucket_start', 'resolution', 'bucket_start'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    station_id = db.Column(
+        db.Integer,
+        db.ForeignKey('charging_stations.id', ondelete='CASCADE'),
+        nullable=False
+    )
+    resolution = db.Column(db.String(2), nullable=False)
+    bucket_start = db.Column(db.Integer, nullable=False)
+    generation = db.Column(db.Integer, nullable=False, default=1)
+    
+    @classmethod
+    def mark(cls, executor, resolution, buckets):
+        if not buckets:
+            return
+        
+        table = cls.__table__
+        statement = dialect_insert(table)
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.station_id, table.c.resolution, table.c.bucket_start],
+            set_={'generation': table.c.generation + 1}
+        )
+        executor.execute(statement, [
+            {'station_id': station_id, 'resolution': resolution, 'bucket_start': bucket_start, 'generation': 1}
+            for station_id, bucket_start in buckets
+        ])
+    
+    def __repr__(self):
+        return f'<MeterRollupMark {self.station_id} {self.resolution}@{self.bucket_start}>'
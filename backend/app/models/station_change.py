@@ -0,0 +1,66 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import event, func, insert
+
+from app.utils.database import db
+from .charging_station import ChargingStation
+
+
+class StationChange(db.Model):
+    __tablename__ = 'station_changes'
+    __table_args__ = (
+        db.Index('ix_station_changes_station_version', 'station_id', 'version'),
+        {'sqlite_autoincrement': True}
+    )
+    
+    version = db.Column(db.Integer, primary_key=True)
+    station_id = db.Column(db.Integer, nullable=False)
+    operation = db.Column(
+        db.Enum('UPSERT', 'DELETE', name='station_change_operations'),
+        nullable=False
+    )
+    changed_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)
+    
+    @classmethod
+    def record(cls, executor, station_ids, operation):
+        if not station_ids:
+            return
+        
+        now = datetime.utcnow()
+        executor.execute(
+            insert(cls.__table__),
+            [
+                {'station_id': station_id, 'operation': operation, 'changed_at': now}
+                for station_id in station_ids
+            ]
+        )
+    
+    @classmethod
+    def current_version(cls):
+        return db.session.query(func.max(cls.version)).scalar() or 0
+    
+    @classmethod
+    def safe_version(cls, commit_lag):
+        if commit_lag > 0:
+            recent = db.session.query(func.min(cls.version)).filter(
+                cls.changed_at > datetime.utcnow() - timedelta(seconds=commit_lag)
+            ).scalar()
+            
+            if recent is not None:
+                return recent - 1
+        
+        return cls.current_version()
+    
+    def __repr__(self):
+        return f'<StationChange {self.version} {self.operation} {self.station_id}>'
+
+
+@event.listens_for(ChargingStation, 'after_insert')
+@event.listens_for(ChargingStation, 'after_update')
+def _record_station_upsert(mapper, connection, target):
+    StationChange.record(connection, [target.id], 'UPSERT')
+
+
+@event.listens_for(ChargingStation, 'after_delete')
+def _record_station_delete(mapper, connection, target):
+    StationChange.record(connection, [target.id], 'DELETE')
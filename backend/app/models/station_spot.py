@@ -0,0 +1,34 @@
+from app.utils.database import db
+from .base import BaseModel
+
+
+class StationSpot(BaseModel):
+    __tablename__ = 'station_spots'
+    __table_args__ = (
+        db.UniqueConstraint('station_id', 'spot_number', name='uq_station_spots_station_spot'),
+    )
+    
+    station_id = db.Column(
+        db.Integer,
+        db.ForeignKey('charging_stations.id', ondelete='CASCADE'),
+        nullable=False,
+        index=True
+    )
+    spot_number = db.Column(db.Integer, nullable=False)
+    state = db.Column(
+        db.Enum('AVAILABLE', 'OCCUPIED', 'OUT_OF_ORDER', name='spot_states'),
+        nullable=False
+    )
+    
+    states = ['AVAILABLE', 'OCCUPIED', 'OUT_OF_ORDER']
+    
+    def to_dict(self):
+        return {
+            'station_id': self.station_id,
+            'spot_number': self.spot_number,
+            'state': self.state,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+    
+    def __repr__(self):
+        return f'<StationSpot {self.station_id}#{self.spot_number} {self.state}>'
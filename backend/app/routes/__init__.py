@@ -1,4 +1,6 @@
 from .auth_routes import auth_bp
+from .batch_routes import batch_bp
+from .bootstrap_routes import bootstrap_bp
 from .charging_station_routes import stations_bp
 from .health_routes import health_bp
 
@@ -6,7 +8,9 @@ from .health_routes import health_bp
 def register_blueprints(app):
     app.register_blueprint(auth_bp, url_prefix='/auth')
     app.register_blueprint(stations_bp, url_prefix='/api')
+    app.register_blueprint(bootstrap_bp, url_prefix='/api')
+    app.register_blueprint(batch_bp, url_prefix='/api')
     app.register_blueprint(health_bp, url_prefix='/health')
 
 
-__all__ = ['register_blueprints', 'auth_bp', 'stations_bp', 'health_bp']
\ No newline at end of file
+__all__ = ['register_blueprints', 'auth_bp', 'batch_bp', 'bootstrap_bp', 'stations_bp', 'health_bp']
\ No newline at end of file
@@ -158,11 +158,7 @@ def get_user_permissions():
         
         if user:
             return jsonify({
-                'permissions': {
-                    'can_view_stations': user.can_view_stations(),
-                    'can_manage_stations': user.can_manage_stations(),
-                    'is_admin': user.is_admin()
-                },
+                'permissions': AuthService.get_permissions(user),
                 'role': user.role
             }), 200
         else:
@@ -0,0 +1,146 @@
+import time
+from urllib.parse import parse_qsl, urlencode
+
+from flask import Blueprint, current_app, request, jsonify
+from werkzeug.exceptions import HTTPException
+from werkzeug.test import EnvironBuilder
+
+from app.utils.database import db
+
+batch_bp = Blueprint('batch', __name__)
+
+BATCH_BLUEPRINTS = ('stations', 'auth')
+
+BATCH_EXCLUDED_ENDPOINTS = ('stations.stream_station_events', 'stations.get_charging_station_snapshot')
+
+
+@batch_bp.route('/batch', methods=['POST'])
+def dispatch_batch():
+    try:
+        data = request.get_json(silent=True)
+        sub_requests = data.get('requests') if isinstance(data, dict) else None
+        max_requests = current_app.config['BATCH_MAX_REQUESTS']
+        
+        if not isinstance(sub_requests, list) or not sub_requests:
+            return jsonify({
+                'error': 'Invalid request',
+                'message': 'Request body must be a JSON object with a non-empty requests list'
+            }), 400
+        
+        if len(sub_requests) > max_requests:
+            return jsonify({
+                'error': 'Batch too large',
+                'message': f'A batch may contain at most {max_requests} requests'
+            }), 400
+        
+        environs = [_build_environ(index, sub_request) for index, sub_request in enumerate(sub_requests)]
+        
+        max_bytes = current_app.config['BATCH_MAX_RESPONSE_BYTES']
+        deadline = time.monotonic() + current_app.config['BATCH_MAX_DURATION']
+        total_bytes = 0
+        responses = []
+        
+        for sub_request, environ in zip(sub_requests, environs):
+            if total_bytes >= max_bytes or time.monotonic() >= deadline:
+                responses.append({
+                    'path': sub_request['path'],
+                    'status': 503,
+                    'body': {
+                        'error': 'Batch budget exceeded',
+                        'message': 'The request was skipped because the batch ran out of time or response size'
+                    }
+                })
+                continue
+            
+            response = _dispatch(environ)
+            total_bytes += len(response['raw'])
+            responses.append({
+                'path': sub_request['path'],
+                'status': response['status'],
+                'body': response['body']
+            })
+        
+        return jsonify({'responses': responses}), 200
+        
+    except ValueError as e:
+        return jsonify({
+            'error': 'Validation error',
+            'message': str(e)
+        }), 400
+    
+    except Exception as e:
+        return jsonify({
+            'error': 'Batch failed',
+            'message': 'An unexpected error occurred while processing the batch'
+        }), 500
+
+
+def _build_environ(index, sub_request):
+    if not isinstance(sub_request, dict) or not isinstance(sub_request.get('path'), str):
+        raise ValueError(f'Request {index} must be an object with a path')
+    
+    method = str(sub_request.get('method', 'GET')).upper()
+    if method != 'GET':
+        raise ValueError(f'Request {index}: only GET requests can be batched')
+    
+    query = sub_request.get('query') or {}
+    if not isinstance(query, (dict, str)):
+        raise ValueError(f'Request {index}: query must be an object or a query string')
+    
+    path, _, query_string = sub_request['path'].partition('?')
+    args = parse_qsl(query_string, keep_blank_values=True)
+    
+    if isinstance(query, str):
+        args += parse_qsl(query.lstrip('?'), keep_blank_values=True)
+    else:
+        args += [
+            (key, value)
+            for key, values in query.items()
+            for value in (values if isinstance(values, list) else [values])
+        ]
+    
+    headers = {'Accept': 'application/json'}
+    if request.headers.get('Authorization'):
+        headers['Authorization'] = request.headers['Authorization']
+    
+    builder = EnvironBuilder(
+        path=path,
+        base_url=request.host_url,
+        method=method,
+        query_string=urlencode(args),
+        headers=headers
+    )
+    environ = builder.get_environ()
+    
+    try:
+        endpoint, _ = current_app.url_map.bind_to_environ(environ).match(method=method)
+    except HTTPException as e:
+        raise ValueError(f"Request {index}: {sub_request['path']} cannot be batched ({e.code})")
+    
+    if endpoint.split('.')[0] not in BATCH_BLUEPRINTS or endpoint in BATCH_EXCLUDED_ENDPOINTS:
+        raise ValueError(f"Request {index}: {sub_request['path']} cannot be batched")
+    
+    return environ
+
+
+def _dispatch(environ):
+    with current_app.request_context(environ):
+        try:
+            response = current_app.full_dispatch_request()
+        except Exception:
+            response = jsonify({
+                'error': 'Internal server error',
+                'message': 'An unexpected error occurred while processing the request'
+            })
+            response.status_code = 500
+        
+        if response.status_code >= 500:
+            db.session.rollback()
+    
+    raw = response.get_data()
+    
+    return {
+        'status': response.status_code,
+        'raw': raw,
+        'body': response.get_json(silent=True) if response.is_json else raw.decode('utf-8', errors='replace')
+    }
@@ -0,0 +1,50 @@
+from flask import Blueprint, request, jsonify
+
+from app.routes.charging_station_routes import FILTER_PARAMS
+from app.services.auth_service import AuthService
+from app.services.bootstrap_service import BootstrapService
+from app.utils.serializers import serialize_response
+
+bootstrap_bp = Blueprint('bootstrap', __name__)
+
+
+@bootstrap_bp.route('/bootstrap', methods=['GET'])
+def get_bootstrap():
+    try:
+        token = request.headers.get('Authorization')
+        user = AuthService.verify_token(token) if token else None
+        
+        filters = {param: request.args[param] for param in FILTER_PARAMS if request.args.get(param)}
+        
+        result = BootstrapService.build(
+            user,
+            include=_split_list(request.args.get('include')),
+            page=request.args.get('page', 1, type=int),
+            per_page=min(request.args.get('per_page', 50, type=int), 100),
+            filters=filters or None,
+            facets=_split_list(request.args.get('facets')),
+            sort=request.args.get('sort')
+        )
+        
+        response = serialize_response(result, 200)
+        response.headers['Server-Timing'] = ', '.join(
+            [f'{name};dur={duration}' for name, duration in result['timings']['parts'].items()]
+            + [f"total;dur={result['timings']['elapsed']}"]
+        )
+        return response
+        
+    except ValueError as e:
+        return jsonify({
+            'error': 'Validation error',
+            'message': str(e)
+        }), 400
+    
+    except Exception as e:
+        return jsonify({
+            'error': 'Bootstrap failed',
+            'message': 'An unexpected error occurred while loading the dashboard'
+        }), 500
+
+
+def _split_list(value):
+    return [item.strip() for item in (value or '').split(',') if item.strip()]
@@ -1,32 +1,90 @@
-from flask import Blueprint, request, jsonify
+import json
+import time
+
+from flask import Blueprint, Response, current_app, request, jsonify, send_file, stream_with_context
 
 from app.services.charging_station_service import ChargingStationService
-from app.middlewares.auth_middleware import admin_required
+from app.services.station_change_service import StationChangeService
+from app.services.station_sync_service import StationSyncService
+from app.middlewares.auth_middleware import admin_required, station_key_required, token_required
+from app.services.auth_service import AuthService
+from app.services.telemetry_service import TelemetryService
+from app.utils.events import RESET_MESSAGE, event_broadcaster
+from app.utils.serializers import JSONSerializer, negotiate_serializer, serialize_response, wants_columnar
+from app.utils.snapshots import snapshot_writer
 
 stations_bp = Blueprint('stations', __name__)
 
+NDJSON_MIMETYPES = ('application/x-ndjson', 'application/ndjson', 'application/jsonlines')
+
+FILTER_PARAMS = [
+    'type', 'status', 'state', 'city', 'city_match', 'min_power', 'max_power',
+    'min_spots', 'max_spots', 'created_after', 'updated_after', 'available'
+]
+
 
 @stations_bp.route('/cargas', methods=['GET'])
 def get_charging_stations():
     try:
+        if 'ids' in request.args:
+            result = ChargingStationService.get_stations_by_ids(_parse_id_list(request.args['ids']))
+            return serialize_response(result, 200)
+        
         page = request.args.get('page', 1, type=int)
         per_page = min(request.args.get('per_page', 50, type=int), 100)
         
         filters = {}
-        filter_params = ['type', 'status', 'state', 'city', 'min_power', 'max_power']
         
-        for param in filter_params:
+        for param in FILTER_PARAMS:
             value = request.args.get(param)
             if value:
                 filters[param] = value
         
+        facets = [facet.strip() for facet in request.args.get('facets', '').split(',') if facet.strip()]
+        
         result = ChargingStationService.get_stations_with_filters(
             page=page,
             per_page=per_page,
-            filters=filters if filters else None
+            filters=filters if filters else None,
+            facets=facets,
+            sort=request.args.get('sort')
         )
         
-        return jsonify(result), 200
+        return serialize_response(result, 200)
+        
+    except ValueError as e:
+        return jsonify({
+            'error': 'Validation error',
+            'message': str(e)
+        }), 400
+        
+    except Exception as e:
+        return jsonify({
+            'error': 'Failed to retrieve stations',
+            'message': 'An unexpected error occurred while retrieving charging stations'
+        }), 500
+
+
+@stations_bp.route('/cargas/batch-get', methods=['POST'])
+def batch_get_charging_stations():
+    try:
+        data = request.get_json(silent=True)
+        
+        if not isinstance(data, dict):
+            return jsonify({
+                'error': 'Invalid request',
+                'message': 'Request body must be a JSON object with an ids list'
+            }), 400
+        
+        result = ChargingStationService.get_stations_by_ids(data.get('ids'))
+        
+        return serialize_response(result, 200)
+        
+    except ValueError as e:
+        return jsonify({
+            'error': 'Validation error',
+            'message': str(e)
+        }), 400
         
     except Exception as e:
         return jsonify({
@@ -35,6 +93,134 @@ def get_charging_stations():
         }), 500
 
 
+@stations_bp.route('/cargas/search', methods=['GET'])
+def search_charging_stations():
+    try:
+        result = ChargingStationService.search_stations(
+            request.args.get('q'),
+            request.args.get('limit', None, type=int)
+        )
+        
+        return serialize_response(result, 200)
+        
+    except ValueError as e:
+        return jsonify({
+            'error': 'Validation error',
+            'message': str(e)
+        }), 400
+    
+    except Exception as e:
+        return jsonify({
+            'error': 'Search failed',
+            'message': 'An unexpected error occurred while searching charging stations'
+        }), 500
+
+
+@stations_bp.route('/cargas/suggest', methods=['GET'])
+def suggest_charging_stations():
+    try:
+        result = ChargingStationService.suggest(
+            request.args.get('prefix'),
+            request.args.get('limit', None, type=int),
+            request.args.get('field')
+        )
+        
+        return serialize_response(result, 200)
+        
+    except ValueError as e:
+        return jsonify({
+            'error': 'Validation error',
+            'message': str(e)
+        }), 400
+    
+    except Exception as e:
+        return jsonify({
+            'error': 'Suggest failed',
+            'message': 'An unexpected error occurred while building suggestions'
+        }), 500
+
+
+@stations_bp.route('/cargas/changes', methods=['GET'])
+def get_charging_station_changes():
+    try:
+        since = request.args.get('since', 0, type=int)
+        limit = request.args.get('limit', None, type=int)
+        
+        result = StationChangeService.get_changes(since, limit)
+        
+        return serialize_response(result, 200)
+        
+    except ValueError as e:
+        return jsonify({
+            'error': 'Validation error',
+            'message': str(e)
+        }), 400
+    
+    except Exception as e:
+        return jsonify({
+            'error': 'Failed to retrieve changes',
+            'message': 'An unexpected error occurred while retrieving station changes'
+        }), 500
+
+
+@stations_bp.route('/cargas/snapshot', methods=['GET'])
+def get_charging_station_snapshot():
+    shape = 'columnar' if request.args.get('shape', '').lower() == 'columnar' else 'rows'
+    
+    try:
+        manifest = snapshot_writer.ensure()
+    except Exception as e:
+        return jsonify({
+            'error': 'Snapshot unavailable',
+            'message': 'An unexpected error occurred while generating the station snapshot'
+        }), 503
+    
+    encoding = 'gzip' if 'gzip' in request.accept_encodings else 'plain'
+    variant = manifest['files'][shape][encoding]
+    
+    response = send_file(
+        snapshot_writer.file_path(variant['name']),
+        mimetype='application/json',
+        etag=variant['etag'],
+        conditional=True,
+        max_age=0
+    )
+    
+    if encoding == 'gzip':
+        response.headers['Content-Encoding'] = 'gzip'
+    
+    response.headers['X-Snapshot-Version'] = str(manifest['version'])
+    response.vary.add('Accept-Encoding')
+    return response
+
+
+@stations_bp.route('/cargas/events', methods=['GET'])
+def stream_station_events():
+    try:
+        event_filter = _parse_event_filter(request.args)
+    except ValueError as e:
+        return jsonify({
+            'error': 'Validation error',
+            'message': str(e)
+        }), 400
+    
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    cursor, reset = event_broadcaster.resume(last_event_id)
+    
+    stream = _iter_station_events(
+        cursor,
+        reset,
+        event_filter,
+        current_app.config['EVENTS_HEARTBEAT_INTERVAL'],
+        current_app.config['EVENTS_STREAM_MAX_DURATION']
+    )
+    
+    return Response(stream, mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+
 @stations_bp.route('/cargas/<int:station_id>', methods=['GET'])
 def get_charging_station(station_id):
     try:
@@ -80,6 +266,320 @@ def create_charging_station(current_user):
         }), 500
 
 
+@stations_bp.route('/cargas/bulk', methods=['POST'])
+@admin_required
+def bulk_create_charging_stations(current_user):
+    try:
+        batch_size = request.args.get('batch_size', type=int)
+        if batch_size is not None:
+            batch_size = max(1, min(batch_size, current_app.config['BULK_MAX_BATCH_SIZE']))
+        
+        if request.mimetype in NDJSON_MIMETYPES:
+            rows = _iter_ndjson(request.stream)
+        else:
+            rows = request.get_json(silent=True)
+            
+            if not isinstance(rows, list):
+                return jsonify({
+                    'error': 'Invalid request',
+                    'message': 'Request body must be a JSON array or NDJSON stream of stations'
+                }), 400
+        
+        result = ChargingStationService.bulk_create_stations(rows, batch_size=batch_size)
+        
+        if result['created']:
+            result['message'] = 'Charging stations created successfully'
+            return serialize_response(result, 201)
+        
+        result['message'] = 'No valid charging stations were provided'
+        return serialize_response(result, 400)
+    
+    except Exception as e:
+        return jsonify({
+            'error': 'Bulk station creation failed',
+            'message': 'An unexpected error occurred while creating the charging stations'
+        }), 500
+
+
+@stations_bp.route('/cargas/upsert', methods=['POST'])
+@admin_required
+def upsert_charging_stations(current_user):
+    try:
+        if request.mimetype in NDJSON_MIMETYPES:
+            source = request.args.get('source')
+            rows = _iter_ndjson(request.stream)
+        else:
+            data = request.get_json(silent=True)
+            
+            if not isinstance(data, dict) or not isinstance(data.get('stations'), list):
+                return jsonify({
+                    'error': 'Invalid request',
+                    'message': 'Request body must contain a source and a stations array'
+                }), 400
+            
+            source = data.get('source')
+            rows = data['stations']
+        
+        result = ChargingStationService.upsert_stations(source, rows)
+        result['message'] = 'Charging stations synchronized successfully'
+        
+        return serialize_response(result, 200)
+        
+    except ValueError as e:
+        return jsonify({
+            'error': 'Validation error',
+            'message': str(e)
+        }), 400
+    
+    except Exception as e:
+        return jsonify({
+            'error': 'Station upsert failed',
+            'message': 'An unexpected error occurred while synchronizing the charging stations'
+        }), 500
+
+
+@stations_bp.route('/cargas/sync', methods=['POST'])
+@admin_required
+def sync_charging_stations(current_user):
+    try:
+        dry_run = request.args.get('dry_run', 'false').lower() == 'true'
+        delete_missing = request.args.get('delete_missing', 'false').lower() == 'true'
+        
+        if request.mimetype in NDJSON_MIMETYPES:
+            source = request.args.get('source')
+            rows = _iter_ndjson(request.stream)
+        else:
+            data = request.get_json(silent=True)
+            
+            if not isinstance(data, dict) or not isinstance(data.get('stations'), list):
+                return jsonify({
+                    'error': 'Invalid request',
+                    'message': 'Request body must contain a source and a stations array'
+                }), 400
+            
+            source = data.get('source')
+            rows = data['stations']
+        
+        result = StationSyncService.sync(
+            source,
+            rows,
+            dry_run=dry_run,
+            delete_missing=delete_missing
+        )
+        
+        return serialize_response(result, 200)
+        
+    except ValueError as e:
+        return jsonify({
+            'error': 'Validation error',
+            'message': str(e)
+        }), 400
+    
+    except Exception as e:
+        return jsonify({
+            'error': 'Station sync failed',
+            'message': 'An unexpected error occurred while reconciling the charging stations'
+        }), 500
+
+
+@stations_bp.route('/cargas/status', methods=['PATCH'])
+@admin_required
+def bulk_update_charging_station_status(current_user):
+    try:
+        data = request.get_json(silent=True)
+        
+        if not data or not data.get('status'):
+            return jsonify({
+                'error': 'Invalid request',
+                'message': 'Request body must contain a status'
+            }), 400
+        
+        raw_filters = data.get('filters') or {}
+        ids = data.get('ids') or []
+        
+        if not isinstance(raw_filters, dict) or not isinstance(ids, list) or \
+                not all(type(station_id) is int for station_id in ids):
+            return jsonify({
+                'error': 'Invalid request',
+                'message': 'filters must be an object and ids a list of integers'
+            }), 400
+        
+        unknown = [param for param in raw_filters if param not in FILTER_PARAMS]
+        if unknown:
+            return jsonify({
+                'error': 'Invalid request',
+                'message': f"Unknown filters: {', '.join(unknown)}. Valid filters: {', '.join(FILTER_PARAMS)}"
+            }), 400
+        
+        filters = {
+            param: str(raw_filters[param])
+            for param in FILTER_PARAMS
+            if raw_filters.get(param) not in (None, '')
+        }
+        
+        updated = ChargingStationService.bulk_update_status(
+            data['status'],
+            filters=filters,
+            ids=ids
+        )
+        
+        return jsonify({
+            'message': 'Charging station status updated successfully',
+            'status': data['status'].upper(),
+            'updated': updated
+        }), 200
+        
+    except ValueError as e:
+        return jsonify({
+            'error': 'Validation error',
+            'message': str(e)
+        }), 400
+    
+    except Exception as e:
+        return jsonify({
+            'error': 'Bulk status update failed',
+            'message': 'An unexpected error occurred while updating the charging stations'
+        }), 500
+
+
+@stations_bp.route('/cargas/<int:station_id>/spots/<int:spot_number>/state', methods=['POST'])
+@station_key_required
+def update_spot_state(station_id, spot_number):
+    try:
+        data = request.get_json(silent=True)
+        
+        if not data or 'state' not in data:
+            return jsonify({
+                'error': 'Invalid request',
+                'message': 'Request body must contain a state'
+            }), 400
+        
+        ChargingStationService.record_spot_state(station_id, spot_number, data['state'])
+        
+        return jsonify({
+            'message': 'Spot state accepted',
+            'station_id': station_id,
+            'spot_number': spot_number,
+            'state': data['state'].upper()
+        }), 202
+        
+    except ValueError as e:
+        return jsonify({
+            'error': 'Validation error',
+            'message': str(e)
+        }), 400
+    
+    except Exception as e:
+        return jsonify({
+            'error': 'Spot state update failed',
+            'message': 'An unexpected error occurred while updating the spot state'
+        }), 500
+
+
+@stations_bp.route('/cargas/<int:station_id>/heartbeat', methods=['POST'])
+@station_key_required
+def station_heartbeat(station_id):
+    try:
+        ChargingStationService.record_heartbeat(station_id)
+        return '', 204
+        
+    except Exception as e:
+        return jsonify({
+            'error': 'Heartbeat failed',
+            'message': 'An unexpected error occurred while recording the heartbeat'
+        }), 500
+
+
+@stations_bp.route('/cargas/<int:station_id>/telemetry', methods=['POST'])
+@station_key_required
+def ingest_station_telemetry(station_id):
+    try:
+        data = request.get_json(silent=True)
+        
+        if not data or 'readings' not in data:
+            return jsonify({
+                'error': 'Invalid request',
+                'message': 'Request body must contain a readings list'
+            }), 400
+        
+        accepted = TelemetryService.ingest_readings(station_id, data['readings'])
+        
+        return jsonify({
+            'message': 'Readings accepted',
+            'station_id': station_id,
+            'accepted': accepted
+        }), 202
+        
+    except ValueError as e:
+        return jsonify({
+            'error': 'Validation error',
+            'message': str(e)
+        }), 400
+    
+    except Exception as e:
+        return jsonify({
+            'error': 'Telemetry ingestion failed',
+            'message': 'An unexpected error occurred while storing the readings'
+        }), 500
+
+
+@stations_bp.route('/cargas/<int:station_id>/telemetry', methods=['GET'])
+@token_required
+def get_station_telemetry(current_user, station_id):
+    try:
+        ChargingStationService.get_by_id_or_404(station_id)
+    except Exception as e:
+        return jsonify({
+            'error': 'Station not found',
+            'message': f'Charging station with ID {station_id} was not found'
+        }), 404
+    
+    try:
+        resolution = request.args.get('resolution', '1h')
+        points = TelemetryService.get_series(
+            station_id,
+            resolution,
+            start=request.args.get('start'),
+            end=request.args.get('end')
+        )
+        
+        return jsonify({
+            'station_id': station_id,
+            'resolution': resolution,
+            'points': points
+        }), 200
+        
+    except ValueError as e:
+        return jsonify({
+            'error': 'Validation error',
+            'message': str(e)
+        }), 400
+    
+    except Exception as e:
+        return jsonify({
+            'error': 'Failed to retrieve telemetry',
+            'message': 'An unexpected error occurred while retrieving the telemetry'
+        }), 500
+
+
+@stations_bp.route('/cargas/<int:station_id>/key', methods=['GET'])
+@admin_required
+def get_station_key(current_user, station_id):
+    try:
+        ChargingStationService.get_by_id_or_404(station_id)
+        
+        return jsonify({
+            'station_id': station_id,
+            'station_key': AuthService.generate_station_key(station_id)
+        }), 200
+        
+    except Exception as e:
+        return jsonify({
+            'error': 'Station not found',
+            'message': f'Charging station with ID {station_id} was not found'
+        }), 404
+
+
 @stations_bp.route('/cargas/<int:station_id>', methods=['PUT'])
 @admin_required
 def update_charging_station(current_user, station_id):
@@ -147,16 +647,23 @@ def get_stations_by_location():
     try:
         state = request.args.get('state')
         city = request.args.get('city')
+        city_match = request.args.get('city_match', 'contains')
         
         stations = ChargingStationService.get_stations_by_location(
             state=state,
-            city=city
+            city=city,
+            city_match=city_match,
+            limit=request.args.get('limit', None, type=int),
+            cursor=request.args.get('cursor', None, type=int)
         )
         
+        return _stream_station_list(stations)
+        
+    except ValueError as e:
         return jsonify({
-            'stations': stations,
-            'count': len(stations)
-        }), 200
+            'error': 'Validation error',
+            'message': str(e)
+        }), 400
         
     except Exception as e:
         return jsonify({
@@ -168,13 +675,19 @@ def get_stations_by_location():
 @stations_bp.route('/cargas/by-status/<status>', methods=['GET'])
 def get_stations_by_status(status):
     try:
-        stations = ChargingStationService.get_stations_by_status(status)
+        stations = ChargingStationService.get_stations_by_status(
+            status,
+            limit=request.args.get('limit', None, type=int),
+            cursor=request.args.get('cursor', None, type=int)
+        )
         
+        return _stream_station_list(stations, status=status.upper())
+        
+    except ValueError as e:
         return jsonify({
-            'stations': stations,
-            'count': len(stations),
-            'status': status.upper()
-        }), 200
+            'error': 'Validation error',
+            'message': str(e)
+        }), 400
         
     except Exception as e:
         return jsonify({
@@ -186,16 +699,152 @@ def get_stations_by_status(status):
 @stations_bp.route('/cargas/by-type/<charger_type>', methods=['GET'])
 def get_stations_by_type(charger_type):
     try:
-        stations = ChargingStationService.get_stations_by_charger_type(charger_type)
+        stations = ChargingStationService.get_stations_by_charger_type(
+            charger_type,
+            limit=request.args.get('limit', None, type=int),
+            cursor=request.args.get('cursor', None, type=int)
+        )
         
+        return _stream_station_list(stations, charger_type=charger_type.upper())
+        
+    except ValueError as e:
         return jsonify({
-            'stations': stations,
-            'count': len(stations),
-            'charger_type': charger_type.upper()
-        }), 200
+            'error': 'Validation error',
+            'message': str(e)
+        }), 400
         
     except Exception as e:
         return jsonify({
             'error': 'Failed to retrieve stations by charger type',
             'message': 'An unexpected error occurred while filtering stations by charger type'
-        }), 500
\ No newline at end of file
+        }), 500
+
+
+def _stream_station_list(stations, **fields):
+    if negotiate_serializer().mimetype != JSONSerializer.mimetype or wants_columnar():
+        result = {'stations': [station.to_dict() for station in stations]}
+        result.update(fields, count=stations.count, next_cursor=stations.next_cursor)
+        return serialize_response(result, 200)
+    
+    dumps = current_app.json.dumps
+    
+    def generate():
+        yield '{"stations":['
+        
+        chunk = []
+        for station in stations:
+            chunk.append(dumps(station.to_dict()))
+            
+            if len(chunk) == 500:
+                yield (',' if stations.count > len(chunk) else '') + ','.join(chunk)
+                chunk = []
+        
+        if chunk:
+            yield (',' if stations.count > len(chunk) else '') + ','.join(chunk)
+        
+        fields.update(count=stations.count, next_cursor=stations.next_cursor)
+        yield '],' + dumps(fields)[1:]
+    
+    response = Response(stream_with_context(generate()), mimetype='application/json')
+    response.vary.add('Accept')
+    return response
+
+
+def _parse_id_list(value):
+    try:
+        return [int(item) for item in value.split(',') if item.strip()]
+    except ValueError:
+        raise ValueError('ids must be a comma-separated list of integers')
+
+
+def _iter_ndjson(stream):
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        
+        try:
+            yield json.loads(line)
+        except ValueError:
+            yield ValueError('Row is not valid JSON')
+
+
+def _parse_event_filter(args):
+    event_filter = {}
+    
+    for field in ('state', 'status'):
+        if args.get(field):
+            event_filter[field] = args[field].strip().upper()
+    
+    if args.get('bbox'):
+        try:
+            min_lon, min_lat, max_lon, max_lat = (float(value) for value in args['bbox'].split(','))
+        except ValueError:
+            raise ValueError('bbox must be min_lon,min_lat,max_lon,max_lat')
+        
+        if min_lon > max_lon or min_lat > max_lat:
+            raise ValueError('bbox minimums must not exceed its maximums')
+        
+        event_filter['bbox'] = (min_lon, min_lat, max_lon, max_lat)
+    
+    return event_filter
+
+
+def _render_event(event, event_filter):
+    if event['type'] == 'reset' or not event_filter:
+        return event['message']
+    
+    if event['type'] != 'batch':
+        return event['message'] if _station_matches(event['data'], event_filter) else None
+    
+    stations = [station for station in event['data']['stations'] if _station_matches(station, event_filter)]
+    if not stations:
+        return None
+    
+    data = dict(event['data'], count=len(stations), stations=stations)
+    return event_broadcaster.format_message(event['id'], event['type'], data)
+
+
+def _station_matches(data, event_filter):
+    for field in ('state', 'status'):
+        if field in event_filter and data.get(field) != event_filter[field]:
+            return False
+    
+    if 'bbox' in event_filter:
+        min_lon, min_lat, max_lon, max_lat = event_filter['bbox']
+        
+        if not (min_lon <= data['longitude'] <= max_lon and min_lat <= data['latitude'] <= max_lat):
+            return False
+    
+    return True
+
+
+def _iter_station_events(cursor, reset, event_filter, heartbeat_interval, max_duration):
+    event_broadcaster.connect()
+    
+    try:
+        yield 'retry: 5000\n\n'
+        
+        if reset:
+            yield RESET_MESSAGE
+        
+        deadline = time.monotonic() + max_duration
+        last_write = time.monotonic()
+        
+        while True:
+            now = time.monotonic()
+            if now >= deadline:
+                return
+            
+            timeout = min(deadline, last_write + heartbeat_interval) - now
+            cursor, events = event_broadcaster.wait_for_events(cursor, max(timeout, 0))
+            messages = [message for message in (_render_event(event, event_filter) for event in events) if message]
+            
+            if messages:
+                last_write = time.monotonic()
+                yield ''.join(messages)
+            elif time.monotonic() - last_write >= heartbeat_interval:
+                last_write = time.monotonic()
+                yield ': heartbeat\n\n'
+    finally:
+        event_broadcaster.disconnect()
@@ -2,6 +2,8 @@ from flask import Blueprint, jsonify
 from datetime import datetime
 
 from app.utils.database import db
+from app.utils.events import event_broadcaster
+from app.utils.station_filters import station_statement_cache
 
 health_bp = Blueprint('health', __name__)
 
@@ -35,7 +37,9 @@ def detailed_health_check():
         'checks': {
             'database': 'unknown',
             'application': 'healthy'
-        }
+        },
+        'event_stream_connections': event_broadcaster.connection_count(),
+        'statement_cache': station_statement_cache.stats()
     }
     
     try:
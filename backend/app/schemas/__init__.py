@@ -1,9 +1,12 @@
 from .user_schema import UserCreateSchema, UserLoginSchema
-from .charging_station_schema import ChargingStationCreateSchema, ChargingStationUpdateSchema
+from .charging_station_schema import (
+    ChargingStationCreateSchema, ChargingStationUpdateSchema, ChargingStationUpsertSchema
+)
 
 __all__ = [
     'UserCreateSchema', 
     'UserLoginSchema',
     'ChargingStationCreateSchema', 
-    'ChargingStationUpdateSchema'
+    'ChargingStationUpdateSchema',
+    'ChargingStationUpsertSchema'
 ]
\ No newline at end of file
@@ -27,7 +27,8 @@ class BaseSchema:
             return False
         
         if field_type and not isinstance(self.data[field], field_type):
-            self.add_error(field, f'{field} must be of type {field_type.__name__}')
+            type_names = field_type if isinstance(field_type, tuple) else (field_type,)
+            self.add_error(field, f"{field} must be of type {' or '.join(t.__name__ for t in type_names)}")
             return False
             
         return True
@@ -1,6 +1,18 @@
 from .base_schema import BaseSchema
 
 
+def _validate_external_reference(schema):
+    if schema.data.get('source') is not None:
+        schema.require_field('source', str)
+        schema.validate_string_length('source', min_length=1, max_length=64)
+    
+    if schema.data.get('external_id') is not None:
+        schema.require_field('external_id', (str, int))
+        if isinstance(schema.data['external_id'], bool):
+            schema.add_error('external_id', 'external_id must be of type str or int')
+        schema.validate_string_length('external_id', min_length=1, max_length=255)
+
+
 class ChargingStationCreateSchema(BaseSchema):
     
     def validate(self):
@@ -43,6 +55,8 @@ class ChargingStationCreateSchema(BaseSchema):
         if 'status' in self.data:
             self.validate_choice('status', ['OPERATIONAL', 'MAINTENANCE', 'INACTIVE'])
 
+        _validate_external_reference(self)
+
 
 class ChargingStationUpdateSchema(BaseSchema):
     
@@ -85,5 +99,14 @@ class ChargingStationUpdateSchema(BaseSchema):
             self.require_field('status', str)
             self.validate_choice('status', ['OPERATIONAL', 'MAINTENANCE', 'INACTIVE'])
 
+        _validate_external_reference(self)
+
+
+class ChargingStationUpsertSchema(ChargingStationCreateSchema):
+    
+    def validate(self):
+        super().validate()
+        self.require_field('external_id', (str, int))
+
 
 ChargingStationSchema = ChargingStationCreateSchema
\ No newline at end of file
@@ -1,5 +1,12 @@
 
 from .auth_service import AuthService
+from .bootstrap_service import BootstrapService
 from .charging_station_service import ChargingStationService
+from .station_change_service import StationChangeService
+from .station_sync_service import StationSyncService
+from .telemetry_service import TelemetryService
 
-__all__ = ['AuthService', 'ChargingStationService']
+__all__ = [
+    'AuthService', 'BootstrapService', 'ChargingStationService', 'StationChangeService',
+    'StationSyncService', 'TelemetryService'
+]
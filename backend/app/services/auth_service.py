@@ -1,6 +1,9 @@
+import hashlib
+import hmac
+
 import jwt
-from flask import current_app
-from typing import Tuple, Optional
+from flask import current_app, g
+from typing import Dict, Tuple, Optional
 
 from app.models.user import User
 from app.schemas.user_schema import UserCreateSchema, UserLoginSchema
@@ -48,6 +51,15 @@ class AuthService(BaseService):
     
     @classmethod
     def verify_token(cls, token: str) -> Optional[User]:
+        verified = g.setdefault('verified_tokens', {})
+        
+        if token not in verified:
+            verified[token] = cls._decode_token(token)
+        
+        return verified[token]
+    
+    @classmethod
+    def _decode_token(cls, token: str) -> Optional[User]:
         try:
             if token.startswith('Bearer '):
                 token = token[7:]
@@ -63,6 +75,14 @@ class AuthService(BaseService):
         except (jwt.InvalidTokenError, KeyError):
             return None
     
+    @classmethod
+    def get_permissions(cls, user: User) -> Dict[str, bool]:
+        return {
+            'can_view_stations': user.can_view_stations(),
+            'can_manage_stations': user.can_manage_stations(),
+            'is_admin': user.is_admin()
+        }
+    
     @classmethod
     def _generate_token(cls, user: User) -> str:
         payload = {
@@ -76,6 +96,21 @@ class AuthService(BaseService):
             algorithm='HS256'
         )
     
+    @classmethod
+    def generate_station_key(cls, station_id: int) -> str:
+        return hmac.new(
+            current_app.config['SECRET_KEY'].encode('utf-8'),
+            f'station:{station_id}'.encode('utf-8'),
+            hashlib.sha256
+        ).hexdigest()
+    
+    @classmethod
+    def verify_station_key(cls, station_id: int, key: Optional[str]) -> bool:
+        if not key:
+            return False
+        
+        return hmac.compare_digest(cls.generate_station_key(station_id), key)
+    
     @classmethod
     def get_user_by_username(cls, username: str) -> Optional[User]:
         return User.query.filter_by(username=username).first()
\ No newline at end of file
@@ -0,0 +1,93 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from flask import current_app
+
+from app.models.user import User
+from app.utils.database import db
+from .auth_service import AuthService
+from .charging_station_service import ChargingStationService
+
+
+class BootstrapService:
+    
+    parts = ['stations', 'facets', 'stats', 'permissions']
+    
+    default_facets = ['type', 'status', 'state']
+    
+    @classmethod
+    def build(cls, user: Optional[User], include: Optional[List[str]] = None, page: int = 1,
+              per_page: int = 50, filters: Optional[Dict[str, str]] = None,
+              facets: Optional[List[str]] = None, sort: Optional[str] = None) -> Dict[str, Any]:
+        include = cls._validate_include(include)
+        facets = facets or cls.default_facets
+        
+        tasks = {
+            'stations': lambda: ChargingStationService.get_stations_with_filters(
+                page=page, per_page=per_page, filters=filters, sort=sort
+            ),
+            'facets': lambda: ChargingStationService.get_facet_counts(filters or {}, facets),
+            'stats': ChargingStationService.get_station_stats
+        }
+        tasks = {name: task for name, task in tasks.items() if name in include}
+        
+        started_at = time.perf_counter()
+        concurrent = len(tasks) > 1 and cls.runs_concurrently()
+        
+        if concurrent:
+            app = current_app._get_current_object()
+            
+            with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+                futures = {name: executor.submit(cls._run_in_context, app, task) for name, task in tasks.items()}
+                outcomes = {name: future.result() for name, future in futures.items()}
+        else:
+            outcomes = {name: cls._run(task) for name, task in tasks.items()}
+        
+        if 'permissions' in include:
+            outcomes['permissions'] = cls._run(lambda: cls._permissions(user))
+        
+        elapsed = time.perf_counter() - started_at
+        
+        result = {name: value for name, (value, _) in outcomes.items()}
+        result['timings'] = {
+            'parts': {name: round(duration * 1000, 2) for name, (_, duration) in outcomes.items()},
+            'sum': round(sum(duration for _, duration in outcomes.values()) * 1000, 2),
+            'elapsed': round(elapsed * 1000, 2),
+            'concurrent': concurrent
+        }
+        
+        return result
+    
+    @classmethod
+    def runs_concurrently(cls) -> bool:
+        return current_app.config['BOOTSTRAP_CONCURRENT'] and db.engine.dialect.name != 'sqlite'
+    
+    @classmethod
+    def _validate_include(cls, include: Optional[List[str]]) -> List[str]:
+        if not include:
+            return list(cls.parts)
+        
+        unknown = [part for part in include if part not in cls.parts]
+        if unknown:
+            raise ValueError(f"Unknown bootstrap parts: {', '.join(unknown)}. Valid parts: {', '.join(cls.parts)}")
+        
+        return include
+    
+    @classmethod
+    def _permissions(cls, user: Optional[User]) -> Optional[Dict[str, Any]]:
+        if user is None:
+            return None
+        
+        return {'role': user.role, **AuthService.get_permissions(user)}
+    
+    @classmethod
+    def _run(cls, task: Callable[[], Any]) -> Tuple[Any, float]:
+        started_at = time.perf_counter()
+        value = task()
+        return value, time.perf_counter() - started_at
+    
+    @classmethod
+    def _run_in_context(cls, app, task: Callable[[], Any]) -> Tuple[Any, float]:
+        with app.app_context():
+            return cls._run(task)
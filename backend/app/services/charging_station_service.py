@@ -1,7 +1,24 @@
-from typing import Dict, Any, Optional
+import math
+from datetime import datetime
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 
-from app.models.charging_station import ChargingStation
-from app.schemas.charging_station_schema import ChargingStationCreateSchema, ChargingStationUpdateSchema
+from flask import current_app
+from sqlalchemy import func, insert, select, update
+
+from app.models.charging_station import ChargingStation, StationRow
+from app.models.station_change import StationChange
+from app.models.station_spot import StationSpot
+from app.utils.availability import availability_store
+from app.utils.columnar import columnar_station_index
+from app.utils.database import db, dialect_insert
+from app.utils.events import event_broadcaster
+from app.utils.heartbeats import heartbeat_monitor
+from app.utils.helpers import chunked
+from app.utils.search import station_search_index, station_suggest_index
+from app.utils.station_filters import StationFilterSpec, StationStream
+from app.schemas.charging_station_schema import (
+    ChargingStationCreateSchema, ChargingStationUpdateSchema, ChargingStationUpsertSchema
+)
 from .base_service import BaseService
 
 
@@ -9,6 +26,17 @@ class ChargingStationService(BaseService):
     
     model = ChargingStation
     
+    station_fields = ChargingStation.data_fields
+    
+    event_fields = ('id', 'status', 'state', 'city', 'latitude', 'longitude')
+    
+    facet_columns = {
+        'type': ChargingStation.charger_type,
+        'status': ChargingStation.status,
+        'state': ChargingStation.state,
+        'city': ChargingStation.city
+    }
+    
     @classmethod
     def create_station(cls, data: Dict[str, Any]) -> ChargingStation:
         schema = ChargingStationCreateSchema(data)
@@ -18,8 +46,11 @@ class ChargingStationService(BaseService):
             raise ValueError('; '.join(error_messages))
         
         normalized_data = cls._normalize_station_data(data)
+        station = cls.create(normalized_data)
+        
+        event_broadcaster.publish('created', station.to_dict())
         
-        return cls.create(normalized_data)
+        return station
     
     @classmethod
     def update_station(cls, station_id: int, data: Dict[str, Any]) -> ChargingStation:
@@ -30,80 +61,557 @@ class ChargingStationService(BaseService):
             raise ValueError('; '.join(error_messages))
         
         normalized_data = cls._normalize_station_data(data)
+        station = cls.update(station_id, normalized_data)
+        
+        event_broadcaster.publish('updated', station.to_dict())
         
-        return cls.update(station_id, normalized_data)
+        return station
     
     @classmethod
-    def get_stations_with_filters(cls, page: int = 1, per_page: int = 50, 
-                                filters: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
-        query = ChargingStation.query
+    def delete(cls, station_id: int) -> bool:
+        station = cls.get_by_id_or_404(station_id)
+        data = station.to_dict()
         
-        if filters:
-            if filters.get('type'):
-                query = query.filter(
-                    ChargingStation.charger_type == filters['type'].upper()
-                )
+        station.delete()
+        event_broadcaster.publish('deleted', {field: data[field] for field in cls.event_fields})
+        
+        return True
+    
+    @classmethod
+    def publish_batch(cls, operation: str, rows: List[Dict[str, Any]]) -> None:
+        if not rows:
+            return
+        
+        event_broadcaster.publish('batch', {
+            'operation': operation,
+            'count': len(rows),
+            'stations': [{field: row[field] for field in cls.event_fields} for row in rows]
+        })
+    
+    @classmethod
+    def bulk_create_stations(cls, rows: Iterable[Any], batch_size: Optional[int] = None) -> Dict[str, Any]:
+        batch_size = batch_size or current_app.config['BULK_INSERT_BATCH_SIZE']
+        max_reported_errors = current_app.config['BULK_MAX_REPORTED_ERRORS']
+        
+        created = 0
+        failed = 0
+        errors = []
+        start_index = 0
+        
+        for chunk in chunked(rows, batch_size):
+            valid_rows, chunk_errors = cls.prepare_bulk_rows(chunk, start_index)
+            start_index += len(chunk)
             
-            if filters.get('status'):
-                query = query.filter(
-                    ChargingStation.status == filters['status'].upper()
-                )
+            failed += len(chunk_errors)
+            errors.extend(chunk_errors[:max(max_reported_errors - len(errors), 0)])
+            
+            if valid_rows:
+                created += cls.insert_bulk_rows(valid_rows)
+                cls.publish_batch('created', valid_rows)
+        
+        return {
+            'created': created,
+            'failed': failed,
+            'errors': errors
+        }
+    
+    @classmethod
+    def prepare_bulk_rows(cls, rows: List[Any], start_index: int = 0,
+                          schema_class=ChargingStationCreateSchema) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        valid_rows = []
+        errors = []
+        
+        for offset, data in enumerate(rows):
+            row_errors = cls._validate_bulk_row(data, schema_class)
             
-            if filters.get('state'):
-                query = query.filter(
-                    ChargingStation.state == filters['state'].upper()
+            if row_errors:
+                errors.append({'index': start_index + offset, 'errors': row_errors})
+            else:
+                valid_rows.append(cls._build_insert_row(data))
+        
+        return valid_rows, errors
+    
+    @classmethod
+    def _validate_bulk_row(cls, data: Any, schema_class=ChargingStationCreateSchema) -> List[Dict[str, str]]:
+        if isinstance(data, Exception):
+            return [{'field': None, 'message': str(data)}]
+        
+        if not isinstance(data, dict):
+            return [{'field': None, 'message': 'Row must be a JSON object'}]
+        
+        schema = schema_class(data)
+        
+        if not schema.is_valid():
+            return schema.get_errors()
+        
+        return []
+    
+    @classmethod
+    def _build_insert_row(cls, data: Dict[str, Any]) -> Dict[str, Any]:
+        normalized_data = cls._normalize_station_data(data)
+        
+        row = {field: normalized_data[field] for field in cls.station_fields}
+        row['source'] = normalized_data.get('source')
+        row['external_id'] = normalized_data.get('external_id')
+        row['content_hash'] = ChargingStation.compute_content_hash(row)
+        row['city_key'] = ChargingStation.compute_city_key(row['city'])
+        return row
+    
+    @classmethod
+    def insert_bulk_rows(cls, batch: List[Dict[str, Any]]) -> int:
+        now = datetime.utcnow()
+        for row in batch:
+            if 'content_hash' not in row:
+                row['content_hash'] = ChargingStation.compute_content_hash(row)
+            if 'city_key' not in row:
+                row['city_key'] = ChargingStation.compute_city_key(row['city'])
+            for field in ('source', 'external_id', 'available_spots'):
+                row.setdefault(field, None)
+            row['created_at'] = now
+            row['updated_at'] = now
+        
+        ordered = db.session.get_bind().dialect.name != 'sqlite'
+        
+        try:
+            station_ids = db.session.scalars(
+                insert(ChargingStation.__table__).returning(ChargingStation.id, sort_by_parameter_order=ordered),
+                batch
+            ).all()
+            if not ordered:
+                station_ids.sort()
+            StationChange.record(db.session, station_ids, 'UPSERT')
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        
+        for row, station_id in zip(batch, station_ids):
+            row['id'] = station_id
+        
+        return len(batch)
+    
+    @classmethod
+    def upsert_stations(cls, source: str, rows: Iterable[Any], batch_size: Optional[int] = None) -> Dict[str, Any]:
+        if not isinstance(source, str) or not source.strip() or len(source.strip()) > 64:
+            raise ValueError('source must be a non-empty string of at most 64 characters')
+        
+        source = source.strip()
+        batch_size = batch_size or current_app.config['BULK_INSERT_BATCH_SIZE']
+        max_reported_errors = current_app.config['BULK_MAX_REPORTED_ERRORS']
+        
+        result = {
+            'inserted': 0,
+            'updated': 0,
+            'unchanged': 0,
+            'failed': 0,
+            'errors': []
+        }
+        start_index = 0
+        seen = set()
+        
+        for chunk in chunked(rows, batch_size):
+            valid_rows, chunk_errors = cls.prepare_bulk_rows(
+                chunk, start_index, schema_class=ChargingStationUpsertSchema
+            )
+            failed_indexes = {error['index'] for error in chunk_errors}
+            valid_indexes = [
+                index for index in range(start_index, start_index + len(chunk)) if index not in failed_indexes
+            ]
+            start_index += len(chunk)
+            
+            batch = []
+            for index, row in zip(valid_indexes, valid_rows):
+                if row['external_id'] in seen:
+                    chunk_errors.append({
+                        'index': index,
+                        'errors': [{'field': 'external_id', 'message': 'Duplicate external_id in request'}]
+                    })
+                    continue
+                
+                seen.add(row['external_id'])
+                row['source'] = source
+                batch.append(row)
+            
+            if batch:
+                inserted, updated = cls._upsert_batch(source, batch)
+                result['inserted'] += inserted
+                result['updated'] += updated
+                result['unchanged'] += len(batch) - inserted - updated
+            
+            chunk_errors.sort(key=lambda error: error['index'])
+            result['failed'] += len(chunk_errors)
+            result['errors'].extend(chunk_errors[:max(max_reported_errors - len(result['errors']), 0)])
+        
+        return result
+    
+    @classmethod
+    def _upsert_batch(cls, source: str, batch: List[Dict[str, Any]]) -> Tuple[int, int]:
+        now = datetime.utcnow()
+        for row in batch:
+            row['created_at'] = now
+            row['updated_at'] = now
+        
+        table = ChargingStation.__table__
+        statement = dialect_insert(table)
+        
+        update_columns = {field: statement.excluded[field] for field in cls.station_fields}
+        update_columns['content_hash'] = statement.excluded.content_hash
+        update_columns['city_key'] = statement.excluded.city_key
+        update_columns['updated_at'] = statement.excluded.updated_at
+        
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.source, table.c.external_id],
+            set_=update_columns,
+            where=table.c.content_hash.is_distinct_from(statement.excluded.content_hash)
+        ).returning(table.c.id, table.c.external_id)
+        
+        try:
+            existing = {
+                external_id for (external_id,) in db.session.query(ChargingStation.external_id).filter(
+                    ChargingStation.source == source,
+                    ChargingStation.external_id.in_([row['external_id'] for row in batch])
                 )
+            }
             
-            if filters.get('city'):
-                query = query.filter(
-                    ChargingStation.city.ilike(f"%{filters['city']}%")
+            written_rows = db.session.execute(statement, batch).all()
+            StationChange.record(db.session, [row.id for row in written_rows], 'UPSERT')
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        
+        rows = {row['external_id']: row for row in batch}
+        for written_row in written_rows:
+            rows[written_row.external_id]['id'] = written_row.id
+        
+        written = {row.external_id for row in written_rows}
+        cls.publish_batch('created', [rows[external_id] for external_id in written - existing])
+        cls.publish_batch('updated', [rows[external_id] for external_id in written & existing])
+        
+        return len(written - existing), len(written & existing)
+    
+    @classmethod
+    def bulk_update_status(cls, status: str, filters: Optional[Dict[str, str]] = None,
+                           ids: Optional[List[int]] = None) -> int:
+        schema = ChargingStationUpdateSchema({'status': status})
+        
+        if not schema.is_valid():
+            error_messages = [error['message'] for error in schema.get_errors()]
+            raise ValueError('; '.join(error_messages))
+        
+        spec = StationFilterSpec(filters)
+        
+        if not spec.shape and not ids:
+            raise ValueError('A filter or a list of station ids is required')
+        
+        status = status.upper()
+        query = spec.apply(ChargingStation.query.filter(ChargingStation.status != status))
+        
+        if ids:
+            query = query.filter(ChargingStation.id.in_(ids))
+        
+        updated_at = datetime.utcnow()
+        statement = (
+            update(ChargingStation)
+            .where(query.whereclause)
+            .values(status=status, updated_at=updated_at)
+            .returning(ChargingStation.id, *[getattr(ChargingStation, field) for field in ChargingStation.data_fields])
+        )
+        
+        try:
+            rows = [
+                row._asdict()
+                for row in db.session.execute(statement, execution_options={'synchronize_session': False})
+            ]
+            
+            if rows:
+                db.session.execute(
+                    update(ChargingStation),
+                    [{'id': row['id'], 'content_hash': ChargingStation.compute_content_hash(row)} for row in rows]
                 )
             
-            if filters.get('min_power'):
-                try:
-                    min_power = float(filters['min_power'])
-                    query = query.filter(ChargingStation.power_kw >= min_power)
-                except ValueError:
-                    pass
+            StationChange.record(db.session, [row['id'] for row in rows], 'UPSERT')
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        
+        cls.publish_batch('status', rows)
+        
+        return len(rows)
+    
+    @classmethod
+    def record_spot_state(cls, station_id: int, spot_number: int, state: Any) -> None:
+        if not isinstance(state, str) or state.upper() not in StationSpot.states:
+            raise ValueError(f"state must be one of: {', '.join(StationSpot.states)}")
+        
+        if not 1 <= spot_number <= 50:
+            raise ValueError('spot_number must be between 1 and 50')
+        
+        if availability_store.record(station_id, spot_number, state.upper()):
+            availability_store.flush()
+    
+    @classmethod
+    def record_heartbeat(cls, station_id: int) -> None:
+        if heartbeat_monitor.beat(station_id):
+            cls.sweep_stale_stations()
+    
+    @classmethod
+    def sweep_stale_stations(cls) -> Dict[str, int]:
+        stale_status = current_app.config['HEARTBEAT_STALE_STATUS']
+        expired, revived = heartbeat_monitor.collect()
+        result = {'stale': 0, 'revived': 0}
+        
+        try:
+            if expired:
+                result['stale'] = cls.bulk_update_status(
+                    stale_status,
+                    filters={'status': 'OPERATIONAL'},
+                    ids=expired
+                )
             
-            if filters.get('max_power'):
-                try:
-                    max_power = float(filters['max_power'])
-                    query = query.filter(ChargingStation.power_kw <= max_power)
-                except ValueError:
-                    pass
-        
-        paginated = query.paginate(
-            page=page,
-            per_page=per_page,
-            error_out=False
+            if revived:
+                result['revived'] = cls.bulk_update_status(
+                    'OPERATIONAL',
+                    filters={'status': stale_status},
+                    ids=revived
+                )
+        except Exception:
+            heartbeat_monitor.restore(expired, revived)
+            raise
+        
+        return result
+    
+    @classmethod
+    def get_stations_with_filters(cls, page: int = 1, per_page: int = 50, 
+                                filters: Optional[Dict[str, str]] = None,
+                                facets: Optional[List[str]] = None,
+                                sort: Optional[str] = None) -> Dict[str, Any]:
+        if facets:
+            facets = cls._validate_facets(facets)
+        
+        spec = StationFilterSpec(filters, sort)
+        
+        if not sort and columnar_station_index.supports(filters):
+            return cls._get_stations_from_index(page, per_page, filters, facets)
+        
+        current_page = max(page, 1)
+        page_size = per_page if per_page >= 1 else 20
+        
+        stations = spec.fetch(limit=page_size, offset=(current_page - 1) * page_size)
+        result = cls._build_page(stations, spec.count(), page, per_page)
+        
+        if facets:
+            result['facets'] = cls._count_facets(spec, facets)
+        
+        return result
+    
+    @classmethod
+    def _get_stations_from_index(cls, page: int, per_page: int, filters: Optional[Dict[str, str]],
+                                 facets: Optional[List[str]]) -> Dict[str, Any]:
+        current_page = max(page, 1)
+        page_size = per_page if per_page >= 1 else 20
+        
+        columnar_station_index.sync()
+        found = columnar_station_index.query(filters, current_page, page_size, facets)
+        
+        rows = db.session.execute(
+            select(*StationRow.columns()).where(ChargingStation.id.in_(found['ids']))
         )
+        stations = {row.id: StationRow(*row) for row in rows}
+        
+        result = cls._build_page(
+            [stations[station_id] for station_id in found['ids'] if station_id in stations],
+            found['total'], page, per_page
+        )
+        
+        if facets:
+            result['facets'] = cls._rank_facets(found['facets'])
+        
+        return result
+    
+    @classmethod
+    def _build_page(cls, stations: List[StationRow], total: int, page: int, per_page: int) -> Dict[str, Any]:
+        current_page = max(page, 1)
+        page_size = per_page if per_page >= 1 else 20
+        pages = math.ceil(total / page_size)
         
         return {
-            'stations': [station.to_dict() for station in paginated.items],
-            'total': paginated.total,
-            'pages': paginated.pages,
+            'stations': [station.to_dict() for station in stations],
+            'total': total,
+            'pages': pages,
             'current_page': page,
             'per_page': per_page,
-            'has_next': paginated.has_next,
-            'has_prev': paginated.has_prev
+            'has_next': current_page < pages,
+            'has_prev': current_page > 1
+        }
+    
+    @classmethod
+    def get_facet_counts(cls, filters: Dict[str, str], facets: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        return cls._count_facets(StationFilterSpec(filters), cls._validate_facets(facets))
+        
+    @classmethod
+    def _count_facets(cls, spec: StationFilterSpec, facets: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        counts = {facet: [] for facet in facets}
+        for facet, value, count in spec.facet_counts(cls.facet_columns, facets):
+            counts[facet].append({'value': value, 'count': count})
+        
+        return cls._rank_facets(counts)
+    
+    @classmethod
+    def _validate_facets(cls, facets: List[str]) -> List[str]:
+        unknown = [facet for facet in facets if facet not in cls.facet_columns]
+        if unknown:
+            raise ValueError(f"Unknown facets: {', '.join(unknown)}. Valid facets: {', '.join(cls.facet_columns)}")
+        
+        return list(dict.fromkeys(facets))
+    
+    @classmethod
+    def _rank_facets(cls, counts: Dict[str, List[Dict[str, Any]]]) -> Dict[str, List[Dict[str, Any]]]:
+        max_values = current_app.config['FACET_MAX_VALUES']
+        
+        for values in counts.values():
+            values.sort(key=lambda item: (-item['count'], item['value']))
+            del values[max_values:]
+        
+        return counts
+    
+    @classmethod
+    def get_stations_by_location(cls, state: Optional[str] = None, city: Optional[str] = None,
+                                 city_match: str = 'contains', limit: Optional[int] = None,
+                                 cursor: Optional[int] = None) -> StationStream:
+        return cls._stream_stations({'state': state, 'city': city, 'city_match': city_match}, limit, cursor)
+    
+    @classmethod
+    def search_stations(cls, query: Any, limit: Optional[int] = None) -> Dict[str, Any]:
+        max_results = current_app.config['SEARCH_MAX_RESULTS']
+        limit = min(limit or current_app.config['SEARCH_DEFAULT_LIMIT'], max_results)
+        
+        if not isinstance(query, str) or not query.strip():
+            raise ValueError('q must be a non-empty search string')
+        
+        if len(query) > 200:
+            raise ValueError('q must be at most 200 characters long')
+        
+        if limit < 1:
+            raise ValueError('limit must be a positive integer')
+        
+        station_search_index.sync()
+        ranked = station_search_index.search(query, limit)
+        
+        stations = {
+            station.id: station
+            for station in ChargingStation.query.filter(ChargingStation.id.in_([station_id for station_id, _ in ranked]))
+        }
+        
+        results = []
+        for station_id, score in ranked:
+            if station_id in stations:
+                result = stations[station_id].to_dict()
+                result['score'] = score
+                results.append(result)
+        
+        return {
+            'query': query,
+            'results': results,
+            'count': len(results)
         }
     
     @classmethod
-    def get_stations_by_location(cls, state: Optional[str] = None, 
-                               city: Optional[str] = None) -> list:
-        query = ChargingStation.get_by_location(state=state, city=city)
-        return [station.to_dict() for station in query.all()]
+    def suggest(cls, prefix: Any, limit: Optional[int] = None, field: Optional[str] = None) -> Dict[str, Any]:
+        max_results = current_app.config['SUGGEST_MAX_RESULTS']
+        limit = min(limit or current_app.config['SUGGEST_DEFAULT_LIMIT'], max_results)
+        
+        if not isinstance(prefix, str) or not prefix.strip():
+            raise ValueError('prefix must be a non-empty string')
+        
+        if len(prefix) > 100:
+            raise ValueError('prefix must be at most 100 characters long')
+        
+        if field is not None and field not in ('city', 'name'):
+            raise ValueError('field must be one of: city, name')
+        
+        if limit < 1:
+            raise ValueError('limit must be a positive integer')
+        
+        station_suggest_index.sync()
+        
+        return {
+            'prefix': prefix,
+            'suggestions': station_suggest_index.suggest(prefix, limit, field)
+        }
     
     @classmethod
-    def get_stations_by_status(cls, status: str) -> list:
-        query = ChargingStation.get_by_status(status)
-        return [station.to_dict() for station in query.all()]
+    def refresh_city_keys(cls, batch_size: Optional[int] = None) -> int:
+        batch_size = batch_size or current_app.config['BULK_INSERT_BATCH_SIZE']
+        refreshed = 0
+        last_id = 0
+        
+        while True:
+            rows = db.session.query(ChargingStation.id, ChargingStation.city).filter(
+                ChargingStation.id > last_id
+            ).order_by(ChargingStation.id).limit(batch_size).all()
+            
+            if not rows:
+                return refreshed
+            
+            try:
+                db.session.execute(
+                    update(ChargingStation),
+                    [{'id': station_id, 'city_key': ChargingStation.compute_city_key(city)} for station_id, city in rows]
+                )
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                raise
+            
+            refreshed += len(rows)
+            last_id = rows[-1].id
+    
+    @classmethod
+    def get_stations_by_ids(cls, ids: Any) -> Dict[str, Any]:
+        max_ids = current_app.config['STATION_BATCH_GET_MAX_IDS']
+        
+        if not isinstance(ids, list) or not ids or \
+                not all(isinstance(station_id, int) and not isinstance(station_id, bool) for station_id in ids):
+            raise ValueError('ids must be a non-empty list of integers')
+        
+        ids = list(dict.fromkeys(ids))
+        if len(ids) > max_ids:
+            raise ValueError(f'At most {max_ids} ids can be fetched at once')
+        
+        stations = {station.id: station for station in StationFilterSpec(ids=ids).fetch(limit=len(ids))}
+        
+        return {
+            'stations': [stations[station_id].to_dict() for station_id in ids if station_id in stations],
+            'missing': [station_id for station_id in ids if station_id not in stations],
+            'count': len(stations)
+        }
+    
+    @classmethod
+    def get_stations_by_status(cls, status: str, limit: Optional[int] = None,
+                               cursor: Optional[int] = None) -> StationStream:
+        return cls._stream_stations({'status': status}, limit, cursor)
+    
+    @classmethod
+    def get_stations_by_charger_type(cls, charger_type: str, limit: Optional[int] = None,
+                                     cursor: Optional[int] = None) -> StationStream:
+        return cls._stream_stations({'type': charger_type}, limit, cursor)
     
     @classmethod
-    def get_stations_by_charger_type(cls, charger_type: str) -> list:
-        query = ChargingStation.get_by_charger_type(charger_type)
-        return [station.to_dict() for station in query.all()]
+    def _stream_stations(cls, filters: Dict[str, Any], limit: Optional[int],
+                         cursor: Optional[int]) -> StationStream:
+        max_rows = current_app.config['STATION_LIST_MAX_ROWS']
+        limit = max_rows if limit is None else min(limit, max_rows)
+        
+        if limit < 1:
+            raise ValueError('limit must be a positive integer')
+        
+        if cursor is not None and cursor < 0:
+            raise ValueError('cursor must be a non-negative station id')
+        
+        spec = StationFilterSpec(filters, after_id=cursor)
+        return spec.stream(limit, current_app.config['STATION_LIST_FETCH_SIZE'])
     
     @classmethod
     def get_station_stats(cls) -> Dict[str, Any]:
@@ -117,7 +625,6 @@ class ChargingStationService(BaseService):
         dc_stations = ChargingStation.query.filter_by(charger_type='DC').count()
         both_stations = ChargingStation.query.filter_by(charger_type='BOTH').count()
         
-        from sqlalchemy import func
         top_states = ChargingStation.query.with_entities(
             ChargingStation.state,
             func.count(ChargingStation.id).label('count')
@@ -152,4 +659,7 @@ class ChargingStationService(BaseService):
             if field in normalized and isinstance(normalized[field], str):
                 normalized[field] = normalized[field].upper()
         
+        if normalized.get('external_id') is not None:
+            normalized['external_id'] = str(normalized['external_id'])
+        
         return normalized
\ No newline at end of file
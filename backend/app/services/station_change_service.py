@@ -0,0 +1,88 @@
+from typing import Any, Dict, Optional
+
+from flask import current_app
+from sqlalchemy import delete, func, select
+
+from app.models.charging_station import ChargingStation
+from app.models.station_change import StationChange
+from app.utils.database import db
+
+
+class StationChangeService:
+    
+    @classmethod
+    def current_version(cls) -> int:
+        return StationChange.current_version()
+    
+    @classmethod
+    def safe_version(cls) -> int:
+        return StationChange.safe_version(current_app.config['CHANGES_COMMIT_LAG'])
+    
+    @classmethod
+    def get_changes(cls, since: int, limit: Optional[int] = None) -> Dict[str, Any]:
+        max_page_size = current_app.config['CHANGES_MAX_PAGE_SIZE']
+        limit = min(limit or current_app.config['CHANGES_PAGE_SIZE'], max_page_size)
+        
+        if since < 0:
+            raise ValueError('since must be a non-negative version')
+        
+        if limit < 1:
+            raise ValueError('limit must be a positive integer')
+        
+        safe_version = cls.safe_version()
+        
+        if since == 0 or since > cls.current_version():
+            return {
+                'version': safe_version,
+                'reset': True,
+                'has_more': False,
+                'changes': [],
+                'deleted': []
+            }
+        
+        latest_version = func.max(StationChange.version).label('latest_version')
+        rows = db.session.execute(
+            select(StationChange.station_id, latest_version)
+            .where(StationChange.version > since, StationChange.version <= safe_version)
+            .group_by(StationChange.station_id)
+            .order_by(latest_version)
+            .limit(limit + 1)
+        ).all()
+        
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        
+        station_ids = [row.station_id for row in rows]
+        stations = {
+            station.id: station
+            for station in ChargingStation.query.filter(ChargingStation.id.in_(station_ids))
+        }
+        
+        return {
+            'version': rows[-1].latest_version if rows else since,
+            'reset': False,
+            'has_more': has_more,
+            'changes': [stations[station_id].to_dict() for station_id in station_ids if station_id in stations],
+            'deleted': [station_id for station_id in station_ids if station_id not in stations]
+        }
+    
+    @classmethod
+    def compact(cls) -> int:
+        newer = StationChange.__table__.alias('newer')
+        latest = (
+            select(func.max(newer.c.version))
+            .where(newer.c.station_id == StationChange.station_id)
+            .scalar_subquery()
+        )
+        
+        try:
+            deleted = db.session.execute(
+                delete(StationChange).where(StationChange.version < latest),
+                execution_options={'synchronize_session': False}
+            ).rowcount
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        
+        return deleted
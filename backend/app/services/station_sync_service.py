@@ -0,0 +1,178 @@
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from flask import current_app
+from sqlalchemy import delete, update
+
+from app.models.charging_station import ChargingStation
+from app.models.station_change import StationChange
+from app.schemas.charging_station_schema import ChargingStationUpsertSchema
+from app.utils.database import db
+from app.utils.helpers import chunked
+from .charging_station_service import ChargingStationService
+
+
+class StationSyncService:
+    
+    @classmethod
+    def load_hash_map(cls, source: str) -> Dict[str, Tuple[int, Optional[str]]]:
+        rows = db.session.query(
+            ChargingStation.external_id,
+            ChargingStation.id,
+            ChargingStation.content_hash
+        ).filter(
+            ChargingStation.source == source,
+            ChargingStation.external_id.isnot(None)
+        )
+        
+        return {external_id: (station_id, content_hash) for external_id, station_id, content_hash in rows}
+    
+    @classmethod
+    def plan(cls, source: str, rows: Iterable[Any], delete_missing: bool = False) -> Dict[str, Any]:
+        if not isinstance(source, str) or not source.strip() or len(source.strip()) > 64:
+            raise ValueError('source must be a non-empty string of at most 64 characters')
+        
+        source = source.strip()
+        max_reported_errors = current_app.config['BULK_MAX_REPORTED_ERRORS']
+        
+        known = cls.load_hash_map(source)
+        seen = set()
+        
+        plan = {
+            'source': source,
+            'inserts': [],
+            'updates': [],
+            'deletes': [],
+            'unchanged': 0,
+            'failed': 0,
+            'errors': []
+        }
+        
+        for index, data in enumerate(rows):
+            valid_rows, errors = ChargingStationService.prepare_bulk_rows(
+                [data], index, schema_class=ChargingStationUpsertSchema
+            )
+            
+            if valid_rows and valid_rows[0]['external_id'] in seen:
+                errors = [{
+                    'index': index,
+                    'errors': [{'field': 'external_id', 'message': 'Duplicate external_id in feed'}]
+                }]
+            
+            if errors:
+                plan['failed'] += 1
+                if len(plan['errors']) < max_reported_errors:
+                    plan['errors'].extend(errors)
+                continue
+            
+            row = valid_rows[0]
+            row['source'] = source
+            seen.add(row['external_id'])
+            current = known.get(row['external_id'])
+            
+            if current is None:
+                plan['inserts'].append(row)
+            elif current[1] != row['content_hash']:
+                row['id'] = current[0]
+                plan['updates'].append(row)
+            else:
+                plan['unchanged'] += 1
+        
+        if delete_missing:
+            plan['deletes'] = [
+                station_id for external_id, (station_id, _) in known.items()
+                if external_id not in seen
+            ]
+        
+        return plan
+    
+    @classmethod
+    def apply(cls, plan: Dict[str, Any], batch_size: Optional[int] = None) -> Dict[str, int]:
+        batch_size = batch_size or current_app.config['BULK_INSERT_BATCH_SIZE']
+        
+        for batch in chunked(plan['inserts'], batch_size):
+            ChargingStationService.insert_bulk_rows(batch)
+            ChargingStationService.publish_batch('created', batch)
+        
+        for batch in chunked(plan['updates'], batch_size):
+            cls._update_batch(batch)
+            ChargingStationService.publish_batch('updated', batch)
+        
+        for batch in chunked(plan['deletes'], batch_size):
+            ChargingStationService.publish_batch('deleted', cls._delete_batch(batch))
+        
+        return {
+            'inserted': len(plan['inserts']),
+            'updated': len(plan['updates']),
+            'deleted': len(plan['deletes'])
+        }
+    
+    @classmethod
+    def sync(cls, source: str, rows: Iterable[Any], dry_run: bool = False,
+             delete_missing: bool = False, batch_size: Optional[int] = None) -> Dict[str, Any]:
+        plan = cls.plan(source, rows, delete_missing=delete_missing)
+        
+        result = cls.summarize(plan)
+        result['dry_run'] = dry_run
+        
+        if not dry_run:
+            cls.apply(plan, batch_size=batch_size)
+        
+        return result
+    
+    @classmethod
+    def summarize(cls, plan: Dict[str, Any]) -> Dict[str, Any]:
+        preview_size = current_app.config['SYNC_PLAN_PREVIEW_SIZE']
+        
+        return {
+            'source': plan['source'],
+            'inserted': len(plan['inserts']),
+            'updated': len(plan['updates']),
+            'deleted': len(plan['deletes']),
+            'unchanged': plan['unchanged'],
+            'failed': plan['failed'],
+            'errors': plan['errors'],
+            'preview': {
+                'inserts': [row['external_id'] for row in plan['inserts'][:preview_size]],
+                'updates': [row['external_id'] for row in plan['updates'][:preview_size]],
+                'deletes': plan['deletes'][:preview_size]
+            }
+        }
+    
+    @classmethod
+    def _update_batch(cls, batch: List[Dict[str, Any]]) -> None:
+        now = datetime.utcnow()
+        rows = []
+        
+        for row in batch:
+            values = {field: row[field] for field in ChargingStationService.station_fields}
+            values['id'] = row['id']
+            values['content_hash'] = row['content_hash']
+            values['city_key'] = row['city_key']
+            values['updated_at'] = now
+            rows.append(values)
+        
+        try:
+            db.session.execute(update(ChargingStation), rows)
+            StationChange.record(db.session, [row['id'] for row in rows], 'UPSERT')
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+    
+    @classmethod
+    def _delete_batch(cls, station_ids: List[int]) -> List[Dict[str, Any]]:
+        columns = [getattr(ChargingStation, field) for field in ChargingStationService.event_fields]
+        
+        try:
+            deleted = db.session.execute(
+                delete(ChargingStation).where(ChargingStation.id.in_(station_ids)).returning(*columns),
+                execution_options={'synchronize_session': False}
+            ).all()
+            StationChange.record(db.session, station_ids, 'DELETE')
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+        return [row._asdict() for row in deleted]
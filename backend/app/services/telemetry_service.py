@@ -0,0 +1,263 @@
+import math
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from flask import current_app
+from sqlalchemy import and_, bindparam, delete, func, literal, literal_column, select
+
+from app.models.meter_reading import MeterReading, MeterRollup, MeterRollupMark
+from app.utils.database import db, dialect_insert
+from app.utils.telemetry import telemetry_buffer
+
+
+class TelemetryService:
+    
+    rollup_levels = [('1m', 'raw'), ('1h', '1m'), ('1d', '1h')]
+    
+    rollup_columns = ['station_id', 'resolution', 'bucket_start', 'energy_kwh', 'power_sum', 'power_max', 'samples']
+    
+    @classmethod
+    def ingest_readings(cls, station_id: int, readings: Any) -> int:
+        max_batch_size = current_app.config['TELEMETRY_MAX_BATCH_SIZE']
+        
+        if not isinstance(readings, list) or not readings:
+            raise ValueError('readings must be a non-empty list')
+        
+        if len(readings) > max_batch_size:
+            raise ValueError(f'A batch may contain at most {max_batch_size} readings')
+        
+        now = time.time()
+        oldest = cls._oldest_accepted(now)
+        rows = [cls._parse_reading(station_id, reading, index, now, oldest) for index, reading in enumerate(readings)]
+        
+        if telemetry_buffer.record(rows):
+            telemetry_buffer.flush()
+        
+        return len(rows)
+    
+    @classmethod
+    def parse_timestamp(cls, value: Any) -> Optional[int]:
+        if isinstance(value, bool):
+            return None
+        
+        if isinstance(value, (int, float)):
+            return int(value) if math.isfinite(value) else None
+        
+        if isinstance(value, str):
+            if value.strip().isdigit():
+                return int(value)
+            
+            try:
+                parsed = datetime.fromisoformat(value.strip().replace('Z', '+00:00'))
+            except ValueError:
+                return None
+            
+            if parsed.tzinfo is None:
+                parsed = parsed.replace(tzinfo=timezone.utc)
+            
+            return int(parsed.timestamp())
+        
+        return None
+    
+    @classmethod
+    def _parse_reading(cls, station_id: int, reading: Any, index: int, now: float,
+                       oldest: Optional[int] = None) -> Dict[str, Any]:
+        if not isinstance(reading, dict):
+            raise ValueError(f'Reading {index} must be an object')
+        
+        recorded_at = cls.parse_timestamp(reading.get('timestamp'))
+        
+        if recorded_at is None:
+            raise ValueError(f'Reading {index}: timestamp must be epoch seconds or an ISO 8601 timestamp')
+        
+        if recorded_at > now + 300:
+            raise ValueError(f'Reading {index}: timestamp is in the future')
+        
+        if oldest is not None and recorded_at < oldest:
+            raise ValueError(f'Reading {index}: timestamp is older than the raw retention window')
+        
+        values = {}
+        for field in ('energy_kwh', 'power_kw'):
+            value = reading.get(field)
+            
+            if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value) or value < 0:
+                raise ValueError(f'Reading {index}: {field} must be a non-negative number')
+            
+            values[field] = float(value)
+        
+        return {
+            'station_id': station_id,
+            'recorded_at': recorded_at,
+            'energy_kwh': values['energy_kwh'],
+            'power_kw': values['power_kw']
+        }
+    
+    @classmethod
+    def _oldest_accepted(cls, now: float) -> Optional[int]:
+        retention = current_app.config['TELEMETRY_RETENTION'].get('raw')
+        if retention is None:
+            return None
+        
+        width = MeterRollup.resolutions['1m']
+        oldest = int(now) - retention
+        return oldest - oldest % width + width
+    
+    @classmethod
+    def get_series(cls, station_id: int, resolution: str, start: Any = None, end: Any = None) -> List[Dict[str, Any]]:
+        if resolution not in MeterRollup.resolutions:
+            raise ValueError(f"resolution must be one of: {', '.join(MeterRollup.resolutions)}")
+        
+        max_points = current_app.config['TELEMETRY_MAX_POINTS']
+        width = MeterRollup.resolutions[resolution]
+        
+        end_ts = int(time.time()) if end is None else cls.parse_timestamp(end)
+        start_ts = end_ts - width * max_points if start is None and end_ts is not None else cls.parse_timestamp(start)
+        
+        if start_ts is None or end_ts is None:
+            raise ValueError('start and end must be epoch seconds or ISO 8601 timestamps')
+        
+        if start_ts > end_ts:
+            raise ValueError('start must not be after end')
+        
+        rollups = MeterRollup.query.filter(
+            MeterRollup.station_id == station_id,
+            MeterRollup.resolution == resolution,
+            MeterRollup.bucket_start >= start_ts,
+            MeterRollup.bucket_start < end_ts
+        ).order_by(MeterRollup.bucket_start).limit(max_points)
+        
+        return [rollup.to_dict() for rollup in rollups]
+    
+    @classmethod
+    def downsample(cls, now: Optional[float] = None) -> Dict[str, Dict[str, int]]:
+        now = int(time.time() if now is None else now)
+        cutoff = now - current_app.config['TELEMETRY_ROLLUP_GRACE']
+        retention = current_app.config['TELEMETRY_RETENTION']
+        parents = {source: resolution for resolution, source in cls.rollup_levels}
+        
+        result = {'rolled': {}, 'deleted': {}}
+        
+        try:
+            for resolution, source in cls.rollup_levels:
+                width = MeterRollup.resolutions[resolution]
+                result['rolled'][resolution] = cls._rollup(resolution, source, cutoff - cutoff % width)
+            
+            for level in ['raw'] + list(MeterRollup.resolutions):
+                if retention.get(level) is None:
+                    continue
+                
+                horizon = now - retention[level]
+                parent = parents.get(level)
+                
+                if parent is not None:
+                    pending = db.session.query(func.min(MeterRollupMark.bucket_start)).filter(
+                        MeterRollupMark.resolution == parent
+                    ).scalar()
+                    if pending is not None:
+                        horizon = min(horizon, pending)
+                    
+                    horizon -= horizon % MeterRollup.resolutions[parent]
+                
+                result['deleted'][level] = cls._delete_before(level, horizon)
+            
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        
+        return result
+    
+    @classmethod
+    def _rollup(cls, resolution: str, source: str, end: int) -> int:
+        width = MeterRollup.resolutions[resolution]
+        
+        marks = db.session.execute(
+            select(MeterRollupMark.station_id, MeterRollupMark.bucket_start, MeterRollupMark.generation)
+            .where(MeterRollupMark.resolution == resolution, MeterRollupMark.bucket_start < end)
+        ).all()
+        
+        if not marks:
+            return 0
+        
+        width_sql = literal_column(str(width))
+        mark = MeterRollupMark
+        
+        if source == 'raw':
+            bucket = (MeterReading.recorded_at // width_sql) * width_sql
+            query = select(
+                MeterReading.station_id,
+                literal(resolution),
+                bucket,
+                func.sum(MeterReading.energy_kwh),
+                func.sum(MeterReading.power_kw),
+                func.max(MeterReading.power_kw),
+                func.count(MeterReading.id)
+            ).join(mark, and_(
+                mark.station_id == MeterReading.station_id,
+                MeterReading.recorded_at >= mark.bucket_start,
+                MeterReading.recorded_at < mark.bucket_start + width_sql
+            )).group_by(MeterReading.station_id, bucket)
+        else:
+            bucket = (MeterRollup.bucket_start // width_sql) * width_sql
+            query = select(
+                MeterRollup.station_id,
+                literal(resolution),
+                bucket,
+                func.sum(MeterRollup.energy_kwh),
+                func.sum(MeterRollup.power_sum),
+                func.max(MeterRollup.power_max),
+                func.sum(MeterRollup.samples)
+            ).join(mark, and_(
+                mark.station_id == MeterRollup.station_id,
+                MeterRollup.bucket_start >= mark.bucket_start,
+                MeterRollup.bucket_start < mark.bucket_start + width_sql
+            )).where(
+                MeterRollup.resolution == source
+            ).group_by(MeterRollup.station_id, bucket)
+        
+        query = query.where(mark.resolution == resolution, mark.bucket_start < end)
+        
+        table = MeterRollup.__table__
+        statement = dialect_insert(table).from_select(cls.rollup_columns, query)
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.station_id, table.c.resolution, table.c.bucket_start],
+            set_={column: statement.excluded[column] for column in cls.rollup_columns[3:]}
+        )
+        rolled = db.session.execute(statement).rowcount
+        
+        parent = next((level for level, level_source in cls.rollup_levels if level_source == resolution), None)
+        if parent is not None:
+            parent_width = MeterRollup.resolutions[parent]
+            MeterRollupMark.mark(db.session, parent, sorted({
+                (row.station_id, row.bucket_start - row.bucket_start % parent_width) for row in marks
+            }))
+    
+        marks_table = MeterRollupMark.__table__
+        db.session.execute(
+            marks_table.delete().where(
+                marks_table.c.station_id == bindparam('mark_station_id'),
+                marks_table.c.resolution == resolution,
+                marks_table.c.bucket_start == bindparam('mark_bucket_start'),
+                marks_table.c.generation == bindparam('mark_generation')
+            ),
+            [
+                {'mark_station_id': row.station_id, 'mark_bucket_start': row.bucket_start,
+                 'mark_generation': row.generation}
+                for row in marks
+            ]
+        )
+        
+        return rolled
+    
+    @classmethod
+    def _delete_before(cls, level: str, horizon: int) -> int:
+        if level == 'raw':
+            statement = delete(MeterReading).where(MeterReading.recorded_at < horizon)
+        else:
+            statement = delete(MeterRollup).where(
+                MeterRollup.resolution == level,
+                MeterRollup.bucket_start < horizon
+            )
+        
+        return db.session.execute(statement, execution_options={'synchronize_session': False}).rowcount
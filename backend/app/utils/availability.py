@@ -0,0 +1,128 @@
+import atexit
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Tuple
+
+from sqlalchemy import func, select, update
+
+from app.models.charging_station import ChargingStation
+from app.models.station_change import StationChange
+from app.models.station_spot import StationSpot
+from app.utils.background import register_periodic_task
+from app.utils.database import db, dialect_insert
+
+
+class AvailabilityStore:
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending: Dict[Tuple[int, int], Tuple[str, datetime]] = {}
+        self._last_flush = time.monotonic()
+        self.flush_interval = 2.0
+        self.max_pending = 5000
+    
+    def init_app(self, app):
+        self.flush_interval = app.config['AVAILABILITY_FLUSH_INTERVAL']
+        self.max_pending = app.config['AVAILABILITY_MAX_PENDING']
+        self._pending = {}
+        app.extensions['availability_store'] = self
+        
+        register_periodic_task(app, 'availability-flush', self.flush_interval, self.flush)
+        
+        if app.config.get('BACKGROUND_TASKS_ENABLED'):
+            atexit.register(self._flush_on_exit, app)
+    
+    def record(self, station_id: int, spot_number: int, state: str) -> bool:
+        with self._lock:
+            self._pending[(station_id, spot_number)] = (state, datetime.utcnow())
+            
+            return (
+                len(self._pending) >= self.max_pending
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            )
+    
+    def pending_count(self) -> int:
+        return len(self._pending)
+    
+    def flush(self) -> int:
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                self._last_flush = time.monotonic()
+            
+            if not pending:
+                return 0
+            
+            try:
+                written = self._write(pending)
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                with self._lock:
+                    for key, value in pending.items():
+                        self._pending.setdefault(key, value)
+                raise
+            
+            return written
+    
+    def _write(self, pending: Dict[Tuple[int, int], Tuple[str, datetime]]) -> int:
+        station_ids = {station_id for station_id, _ in pending}
+        num_spots = dict(
+            db.session.query(ChargingStation.id, ChargingStation.num_spots)
+            .filter(ChargingStation.id.in_(station_ids))
+        )
+        
+        rows = [
+            {
+                'station_id': station_id,
+                'spot_number': spot_number,
+                'state': state,
+                'created_at': updated_at,
+                'updated_at': updated_at
+            }
+            for (station_id, spot_number), (state, updated_at) in pending.items()
+            if spot_number <= num_spots.get(station_id, 0)
+        ]
+        
+        if not rows:
+            return 0
+        
+        table = StationSpot.__table__
+        statement = dialect_insert(table)
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.station_id, table.c.spot_number],
+            set_={
+                'state': statement.excluded.state,
+                'updated_at': statement.excluded.updated_at
+            }
+        )
+        db.session.execute(statement, rows)
+        
+        available = (
+            select(func.count(StationSpot.id))
+            .where(
+                StationSpot.station_id == ChargingStation.id,
+                StationSpot.spot_number <= ChargingStation.num_spots,
+                StationSpot.state == 'AVAILABLE'
+            )
+            .scalar_subquery()
+        )
+        station_ids = db.session.scalars(
+            update(ChargingStation)
+            .where(ChargingStation.id.in_({row['station_id'] for row in rows}))
+            .values(available_spots=available, updated_at=ChargingStation.updated_at)
+            .returning(ChargingStation.id),
+            execution_options={'synchronize_session': False}
+        ).all()
+        StationChange.record(db.session, station_ids, 'UPSERT')
+        
+        return len(rows)
+    
+    def _flush_on_exit(self, app):
+        with app.app_context():
+            self.flush()
+
+
+availability_store = AvailabilityStore()
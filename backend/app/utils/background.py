@@ -0,0 +1,59 @@
+import threading
+from typing import Callable
+
+
+class PeriodicTask:
+    
+    def __init__(self, app, name: str, interval: float, func: Callable[[], None]):
+        self.app = app
+        self.name = name
+        self.interval = interval
+        self.func = func
+        self._stopped = threading.Event()
+        self._thread = None
+    
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        self._stopped.set()
+    
+    def run_once(self):
+        with self.app.app_context():
+            try:
+                self.func()
+            except Exception:
+                self.app.logger.exception(f'Background task {self.name} failed')
+    
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            self.run_once()
+
+
+def register_periodic_task(app, name: str, interval: float, func: Callable[[], None]) -> PeriodicTask:
+    tasks = app.extensions.setdefault('periodic_tasks', {})
+    task = PeriodicTask(app, name, interval, func)
+    tasks[name] = task
+    return task
+    
+
+_start_lock = threading.Lock()
+
+
+def start_periodic_tasks(app):
+    if app.extensions.get('periodic_tasks_started') or not app.config.get('BACKGROUND_TASKS_ENABLED'):
+        return
+    
+    with _start_lock:
+        if app.extensions.get('periodic_tasks_started'):
+            return
+        
+        for task in app.extensions.get('periodic_tasks', {}).values():
+            task.start()
+    
+        app.extensions['periodic_tasks_started'] = True
@@ -0,0 +1,77 @@
+import threading
+import time
+from typing import Optional
+
+from flask import current_app
+
+from app.models.charging_station import ChargingStation
+from app.models.station_change import StationChange
+from app.utils.database import db
+
+
+class StationChangeIndex:
+    
+    columns = ('id', 'name', 'city')
+    
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._last_sync = 0.0
+        self.version: Optional[int] = None
+        self.sync_interval = 0.0
+    
+    def reset(self):
+        with self._lock:
+            self.clear()
+            self.version = None
+    
+    def update(self, station_id: int, *values):
+        with self._lock:
+            self.remove(station_id)
+            self.add(station_id, *values)
+    
+    def sync(self) -> int:
+        with self._lock:
+            if self.version is None:
+                return self._build()
+            
+            if time.monotonic() - self._last_sync < self.sync_interval:
+                return 0
+            
+            self._last_sync = time.monotonic()
+            safe_version = StationChange.safe_version(current_app.config['CHANGES_COMMIT_LAG'])
+            
+            if safe_version <= self.version:
+                return 0
+            
+            station_ids = [
+                station_id for station_id, in db.session.query(StationChange.station_id).filter(
+                    StationChange.version > self.version,
+                    StationChange.version <= safe_version
+                ).distinct()
+            ]
+            rows = {
+                row[0]: row[1:]
+                for row in self.query_rows().filter(ChargingStation.id.in_(station_ids))
+            }
+            
+            for station_id in station_ids:
+                if station_id in rows:
+                    self.update(station_id, *rows[station_id])
+                else:
+                    self.remove(station_id)
+            
+            self.version = safe_version
+            return len(station_ids)
+    
+    def _build(self) -> int:
+        self.reset()
+        self._last_sync = time.monotonic()
+        self.version = StationChange.safe_version(current_app.config['CHANGES_COMMIT_LAG'])
+        
+        for row in self.query_rows().order_by(ChargingStation.id).yield_per(5000):
+            self.add(*row)
+        
+        return self.document_count()
+    
+    def query_rows(self):
+        return db.session.query(*[getattr(ChargingStation, column) for column in self.columns])
@@ -0,0 +1,236 @@
+import math
+from typing import Any, Dict, List, Optional
+
+from app.models.charging_station import ChargingStation
+from app.utils.change_index import StationChangeIndex
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+DICTIONARY_COLUMNS = {
+    'charger_type': 'int16',
+    'status': 'int16',
+    'state': 'int16',
+    'city': 'int32',
+    'city_key': 'int32'
+}
+
+FILTER_COLUMNS = {'type': 'charger_type', 'status': 'status', 'state': 'state'}
+
+FACET_COLUMNS = {'type': 'charger_type', 'status': 'status', 'state': 'state', 'city': 'city'}
+
+RANGE_FILTERS = {
+    'min_power': ('power_kw', float, 'greater_equal'),
+    'max_power': ('power_kw', float, 'less_equal'),
+    'min_spots': ('num_spots', int, 'greater_equal'),
+    'max_spots': ('num_spots', int, 'less_equal')
+}
+
+SUPPORTED_FILTERS = {'type', 'status', 'state', 'city', 'city_match'} | set(RANGE_FILTERS)
+
+
+class _Dictionary:
+    
+    def __init__(self):
+        self.values: List[Any] = []
+        self.codes: Dict[Any, int] = {}
+    
+    def encode(self, value: Any) -> int:
+        code = self.codes.get(value)
+        
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        
+        return code
+
+
+class ColumnarStationIndex(StationChangeIndex):
+    
+    columns = ('id', 'charger_type', 'status', 'state', 'city', 'city_key', 'power_kw', 'num_spots')
+    
+    def __init__(self):
+        super().__init__()
+        self.enabled = False
+        self.clear()
+    
+    def init_app(self, app):
+        engine = app.config['STATION_READ_ENGINE']
+        
+        if engine == 'columnar' and np is None:
+            app.logger.warning('STATION_READ_ENGINE is columnar but numpy is not installed; using sql')
+        
+        self.enabled = engine == 'columnar' and np is not None
+        self.reset()
+        app.extensions['columnar_station_index'] = self
+    
+    def clear(self):
+        self._positions: Dict[int, int] = {}
+        self._dictionaries = {column: _Dictionary() for column in DICTIONARY_COLUMNS}
+        self._arrays: Dict[str, Any] = {}
+        self._size = 0
+        self._dead = 0
+        self._ordered = True
+        
+        if np is not None:
+            self._allocate(1024)
+    
+    def document_count(self) -> int:
+        return len(self._positions)
+    
+    def supports(self, filters: Optional[Dict[str, str]]) -> bool:
+        return self.enabled and set(filters or {}) <= SUPPORTED_FILTERS
+    
+    def add(self, station_id: int, *values):
+        with self._lock:
+            if self._size == len(self._arrays['id']):
+                self._allocate(len(self._arrays['id']) * 2)
+            
+            if self._size and station_id < self._arrays['id'][self._size - 1]:
+                self._ordered = False
+            
+            position = self._size
+            self._size += 1
+            self._positions[station_id] = position
+            self._arrays['id'][position] = station_id
+            self._arrays['alive'][position] = True
+            self._write(position, values)
+    
+    def update(self, station_id: int, *values):
+        with self._lock:
+            position = self._positions.get(station_id)
+            
+            if position is None:
+                self.add(station_id, *values)
+            else:
+                self._write(position, values)
+    
+    def remove(self, station_id: int):
+        with self._lock:
+            position = self._positions.pop(station_id, None)
+            if position is None:
+                return
+            
+            self._arrays['alive'][position] = False
+            self._dead += 1
+            
+            if self._dead > 1024 and self._dead * 4 > self._size:
+                self._compact()
+    
+    def query(self, filters: Optional[Dict[str, str]], page: int, per_page: int,
+              facets: Optional[List[str]] = None) -> Dict[str, Any]:
+        with self._lock:
+            filters = filters or {}
+            mask = self._mask(filters)
+            positions = np.flatnonzero(mask)
+            
+            ids = self._arrays['id'][positions]
+            if not self._ordered:
+                ids = np.sort(ids)
+            
+            start = (page - 1) * per_page
+            total = len(ids)
+            
+            result = {
+                'ids': ids[start:start + per_page].tolist(),
+                'total': total,
+                'pages': math.ceil(total / per_page) if total else 0
+            }
+            
+            if facets:
+                result['facets'] = {facet: self._facet_counts(filters, facet, mask) for facet in facets}
+            
+            return result
+    
+    def _allocate(self, capacity: int):
+        arrays = {
+            'id': np.zeros(capacity, dtype='int64'),
+            'alive': np.zeros(capacity, dtype=bool),
+            'power_kw': np.zeros(capacity, dtype='float64'),
+            'num_spots': np.zeros(capacity, dtype='int32')
+        }
+        for column, dtype in DICTIONARY_COLUMNS.items():
+            arrays[column] = np.zeros(capacity, dtype=dtype)
+        
+        for name, array in self._arrays.items():
+            arrays[name][:self._size] = array[:self._size]
+        
+        self._arrays = arrays
+    
+    def _write(self, position: int, values):
+        row = dict(zip(self.columns[1:], values))
+        
+        for column in DICTIONARY_COLUMNS:
+            self._arrays[column][position] = self._dictionaries[column].encode(row[column])
+        
+        self._arrays['power_kw'][position] = row['power_kw']
+        self._arrays['num_spots'][position] = row['num_spots']
+    
+    def _compact(self):
+        alive = self._arrays['alive'][:self._size]
+        order = np.flatnonzero(alive)
+        order = order[np.argsort(self._arrays['id'][order], kind='stable')]
+        
+        arrays = {name: array[order] for name, array in self._arrays.items()}
+        self._size = len(order)
+        self._dead = 0
+        self._ordered = True
+        self._positions = {int(station_id): position for position, station_id in enumerate(arrays['id'])}
+        self._arrays = {}
+        self._allocate(max(1024, self._size * 2))
+        
+        for name, array in arrays.items():
+            self._arrays[name][:self._size] = array
+    
+    def _mask(self, filters: Dict[str, str], exclude: Optional[str] = None):
+        size = self._size
+        mask = self._arrays['alive'][:size].copy()
+        
+        for key, column in FILTER_COLUMNS.items():
+            values = {value.strip().upper() for value in (filters.get(key) or '').split(',') if value.strip()}
+                
+            if key != exclude and values:
+                codes = self._dictionaries[column].codes
+                wanted = [codes[value] for value in values if value in codes]
+                
+                mask &= np.isin(self._arrays[column][:size], np.array(wanted, dtype=self._arrays[column].dtype))
+        
+        if exclude != 'city' and filters.get('city'):
+            mask &= np.isin(self._arrays['city_key'][:size], self._city_codes(filters))
+        
+        for key, (column, value_type, compare) in RANGE_FILTERS.items():
+            if filters.get(key):
+                mask &= getattr(np, compare)(self._arrays[column][:size], value_type(filters[key]))
+        
+        return mask
+    
+    def _city_codes(self, filters: Dict[str, str]):
+        key = ChargingStation.compute_city_key(filters['city']) or ''
+        match = filters.get('city_match', 'contains')
+        dictionary = self._dictionaries['city_key']
+        
+        if match == 'exact':
+            codes = [dictionary.codes[key]] if key in dictionary.codes else []
+        elif match == 'prefix':
+            codes = [code for code, value in enumerate(dictionary.values) if value and value.startswith(key)]
+        else:
+            codes = [code for code, value in enumerate(dictionary.values) if value and key in value]
+        
+        return np.array(codes, dtype='int32')
+    
+    def _facet_counts(self, filters: Dict[str, str], facet: str, mask) -> List[Dict[str, Any]]:
+        column = FACET_COLUMNS[facet]
+        facet_mask = self._mask(filters, exclude=facet) if filters.get(facet) else mask
+        
+        dictionary = self._dictionaries[column]
+        counts = np.bincount(self._arrays[column][:self._size][facet_mask], minlength=len(dictionary.values))
+        
+        return [
+            {'value': dictionary.values[code], 'count': int(counts[code])}
+            for code in np.flatnonzero(counts)
+        ]
+
+
+columnar_station_index = ColumnarStationIndex()
@@ -1,3 +1,16 @@
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.dialects import postgresql, sqlite
 
-db = SQLAlchemy()
\ No newline at end of file
+db = SQLAlchemy()
+
+
+def dialect_insert(table):
+    dialect = db.session.get_bind().dialect.name
+    
+    if dialect == 'postgresql':
+        return postgresql.insert(table)
+    
+    if dialect == 'sqlite':
+        return sqlite.insert(table)
+    
+    raise NotImplementedError(f'Upsert is not supported on {dialect}')
@@ -0,0 +1,109 @@
+import json
+import threading
+import time
+from collections import deque
+from itertools import islice
+from typing import Any, Dict, List, Optional, Tuple
+
+RESET_MESSAGE = 'event: reset\ndata: {}\n\n'
+
+
+class EventBroadcaster:
+    
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._buffer = deque()
+        self._buffer_bytes = 0
+        self.max_events = 1000
+        self.max_bytes = 4 * 1024 * 1024
+        self._sequence = 0
+        self._connections = 0
+        self.epoch = str(int(time.time()))
+    
+    def init_app(self, app):
+        with self._condition:
+            self._buffer = deque()
+            self._buffer_bytes = 0
+            self.max_events = app.config['EVENTS_REPLAY_SIZE']
+            self.max_bytes = app.config['EVENTS_REPLAY_MAX_BYTES']
+            self._sequence = 0
+            self._connections = 0
+            self.epoch = str(int(time.time()))
+        
+        app.extensions['event_broadcaster'] = self
+    
+    def publish(self, event_type: str, data: Dict[str, Any]) -> str:
+        with self._condition:
+            self._sequence += 1
+            event_id = f'{self.epoch}:{self._sequence}'
+            message = self.format_message(event_id, event_type, data)
+            
+            self._buffer.append({
+                'id': event_id,
+                'sequence': self._sequence,
+                'type': event_type,
+                'data': data,
+                'message': message,
+                'size': len(message)
+            })
+            self._buffer_bytes += len(message)
+            self._trim()
+            self._condition.notify_all()
+        
+        return event_id
+    
+    def _trim(self):
+        while len(self._buffer) > 1 and (len(self._buffer) > self.max_events or self._buffer_bytes > self.max_bytes):
+            self._buffer_bytes -= self._buffer.popleft()['size']
+    
+    @staticmethod
+    def format_message(event_id: str, event_type: str, data: Dict[str, Any]) -> str:
+        return f'id: {event_id}\nevent: {event_type}\ndata: {json.dumps(data)}\n\n'
+    
+    def resume(self, last_event_id: Optional[str]) -> Tuple[int, bool]:
+        with self._condition:
+            if not last_event_id:
+                return self._sequence, False
+            
+            epoch, _, sequence = last_event_id.partition(':')
+            
+            if epoch != self.epoch or not sequence.isdigit() or int(sequence) > self._sequence:
+                return self._sequence, True
+            
+            oldest = self._buffer[0]['sequence'] if self._buffer else self._sequence + 1
+            
+            if int(sequence) < oldest - 1:
+                return self._sequence, True
+            
+            return int(sequence), False
+    
+    def wait_for_events(self, cursor: int, timeout: float) -> Tuple[int, List[Dict[str, Any]]]:
+        with self._condition:
+            if self._sequence <= cursor:
+                self._condition.wait(timeout)
+            
+            if self._sequence <= cursor:
+                return cursor, []
+            
+            if self._buffer and self._buffer[0]['sequence'] > cursor + 1:
+                return self._sequence, [{'type': 'reset', 'data': {}, 'message': RESET_MESSAGE}]
+            
+            start = cursor + 1 - self._buffer[0]['sequence']
+            return self._sequence, list(islice(self._buffer, start, None))
+    
+    def connect(self):
+        with self._condition:
+            self._connections += 1
+    
+    def disconnect(self):
+        with self._condition:
+            self._connections -= 1
+    
+    def connection_count(self) -> int:
+        return self._connections
+    
+    def last_event_id(self) -> str:
+        return f'{self.epoch}:{self._sequence}'
+
+
+event_broadcaster = EventBroadcaster()
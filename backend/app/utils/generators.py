@@ -0,0 +1,120 @@
+import random
+from itertools import accumulate
+from typing import Any, Dict, Iterator, List
+
+from app.utils.helpers import normalize_search_key
+
+STATE_CITIES = {
+    'SP': (21.9, [('São Paulo', -23.5505, -46.6333, 50), ('Campinas', -22.9056, -47.0608, 10),
+                  ('Santos', -23.9608, -46.3336, 6), ('São José dos Campos', -23.1791, -45.8872, 6),
+                  ('Ribeirão Preto', -21.1775, -47.8103, 6), ('Sorocaba', -23.5015, -47.4526, 5)]),
+    'MG': (10.0, [('Belo Horizonte', -19.9167, -43.9345, 40), ('Uberlândia', -18.9186, -48.2772, 12),
+                  ('Juiz de Fora', -21.7642, -43.3503, 8), ('Contagem', -19.9320, -44.0539, 6)]),
+    'RJ': (8.0, [('Rio de Janeiro', -22.9068, -43.1729, 55), ('Niterói', -22.8832, -43.1034, 12),
+                 ('Petrópolis', -22.5112, -43.1779, 5), ('Duque de Caxias', -22.7858, -43.3117, 6)]),
+    'PR': (5.6, [('Curitiba', -25.4284, -49.2733, 45), ('Londrina', -23.3045, -51.1696, 12),
+                 ('Maringá', -23.4210, -51.9331, 10), ('Foz do Iguaçu', -25.5163, -54.5854, 5)]),
+    'RS': (5.2, [('Porto Alegre', -30.0346, -51.2177, 45), ('Caxias do Sul', -29.1678, -51.1794, 12),
+                 ('Pelotas', -31.7654, -52.3376, 8), ('Gramado', -29.3788, -50.8738, 4)]),
+    'SC': (3.7, [('Florianópolis', -27.5954, -48.5480, 30), ('Joinville', -26.3045, -48.8487, 18),
+                 ('Blumenau', -26.9194, -49.0661, 12), ('Balneário Camboriú', -26.9906, -48.6348, 8)]),
+    'DF': (2.6, [('Brasília', -15.7939, -47.8828, 100)]),
+    'GO': (3.3, [('Goiânia', -16.6869, -49.2648, 50), ('Anápolis', -16.3281, -48.9530, 10)]),
+    'BA': (6.9, [('Salvador', -12.9714, -38.5014, 50), ('Feira de Santana', -12.2664, -38.9663, 10),
+                 ('Vitória da Conquista', -14.8619, -40.8444, 6)]),
+    'PE': (4.6, [('Recife', -8.0476, -34.8770, 50), ('Jaboatão dos Guararapes', -8.1130, -35.0151, 10),
+                 ('Caruaru', -8.2760, -35.9819, 6)]),
+    'CE': (4.3, [('Fortaleza', -3.7319, -38.5267, 60), ('Juazeiro do Norte', -7.2131, -39.3151, 8)]),
+    'ES': (1.9, [('Vitória', -20.3155, -40.3128, 35), ('Vila Velha', -20.3297, -40.2925, 20)]),
+    'MS': (1.4, [('Campo Grande', -20.4697, -54.6201, 60), ('Dourados', -22.2231, -54.8120, 12)]),
+    'MT': (1.8, [('Cuiabá', -15.6014, -56.0979, 50), ('Rondonópolis', -16.4673, -54.6372, 10)]),
+    'AM': (2.0, [('Manaus', -3.1190, -60.0217, 100)]),
+    'PA': (4.0, [('Belém', -1.4558, -48.4902, 55), ('Santarém', -2.4430, -54.7083, 8)]),
+    'MA': (3.3, [('São Luís', -2.5307, -44.3068, 60), ('Imperatriz', -5.5263, -47.4825, 10)]),
+    'PB': (1.9, [('João Pessoa', -7.1195, -34.8450, 55), ('Campina Grande', -7.2307, -35.8811, 15)]),
+    'RN': (1.6, [('Natal', -5.7945, -35.2110, 60), ('Mossoró', -5.1878, -37.3442, 10)]),
+    'AL': (1.6, [('Maceió', -9.6498, -35.7089, 70)]),
+    'SE': (1.1, [('Aracaju', -10.9472, -37.0731, 70)]),
+    'PI': (1.6, [('Teresina', -5.0920, -42.8038, 70)]),
+    'TO': (0.8, [('Palmas', -10.2491, -48.3243, 60)]),
+    'RO': (0.8, [('Porto Velho', -8.7612, -63.9004, 60)]),
+    'AC': (0.4, [('Rio Branco', -9.9747, -67.8076, 70)]),
+    'AP': (0.4, [('Macapá', 0.0349, -51.0694, 70)]),
+    'RR': (0.3, [('Boa Vista', 2.8235, -60.6758, 70)])
+}
+
+CHARGER_TYPES = [('AC', 55), ('DC', 30), ('BOTH', 15)]
+
+POWER_LEVELS = {
+    'AC': [(7.4, 30), (11.0, 30), (22.0, 40)],
+    'DC': [(50.0, 35), (60.0, 15), (100.0, 20), (150.0, 20), (350.0, 10)],
+    'BOTH': [(43.0, 30), (50.0, 30), (75.0, 20), (100.0, 20)]
+}
+
+STATUSES = [('OPERATIONAL', 85), ('MAINTENANCE', 10), ('INACTIVE', 5)]
+
+SPOT_COUNTS = [(1, 10), (2, 30), (3, 10), (4, 20), (6, 15), (8, 8), (10, 4), (12, 3)]
+
+NAME_PREFIXES = [
+    'Estação', 'Eletroposto', 'Posto', 'Shopping', 'Supermercado', 'Aeroporto',
+    'Hotel', 'Estacionamento', 'Concessionária', 'Parque'
+]
+
+
+class _WeightedChoice:
+    
+    def __init__(self, weighted_values: List[tuple]):
+        self.values = [value for value, _ in weighted_values]
+        self.cum_weights = list(accumulate(weight for _, weight in weighted_values))
+    
+    def sample(self, rng: random.Random, count: int) -> List[Any]:
+        return rng.choices(self.values, cum_weights=self.cum_weights, k=count)
+
+
+_states = _WeightedChoice([(state, weight) for state, (weight, _) in STATE_CITIES.items()])
+_cities = {
+    state: _WeightedChoice([
+        ((name, normalize_search_key(name), lat, lon), weight) for name, lat, lon, weight in cities
+    ])
+    for state, (_, cities) in STATE_CITIES.items()
+}
+_charger_types = _WeightedChoice(CHARGER_TYPES)
+_power_levels = {charger_type: _WeightedChoice(levels) for charger_type, levels in POWER_LEVELS.items()}
+_statuses = _WeightedChoice(STATUSES)
+_spot_counts = _WeightedChoice(SPOT_COUNTS)
+
+
+def generate_stations(count: int, seed: int = 0, batch_size: int = 10000) -> Iterator[List[Dict[str, Any]]]:
+    rng = random.Random(seed)
+    generated = 0
+    
+    while generated < count:
+        size = min(batch_size, count - generated)
+        
+        states = _states.sample(rng, size)
+        charger_types = _charger_types.sample(rng, size)
+        statuses = _statuses.sample(rng, size)
+        spot_counts = _spot_counts.sample(rng, size)
+        prefixes = rng.choices(NAME_PREFIXES, k=size)
+        
+        batch = []
+        for offset in range(size):
+            state = states[offset]
+            charger_type = charger_types[offset]
+            city, city_key, latitude, longitude = _cities[state].sample(rng, 1)[0]
+            
+            batch.append({
+                'name': f'{prefixes[offset]} {city} {generated + offset + 1}',
+                'latitude': round(latitude + rng.gauss(0, 0.08), 6),
+                'longitude': round(longitude + rng.gauss(0, 0.08), 6),
+                'charger_type': charger_type,
+                'power_kw': _power_levels[charger_type].sample(rng, 1)[0],
+                'num_spots': spot_counts[offset],
+                'status': statuses[offset],
+                'state': state,
+                'city': city,
+                'city_key': city_key
+            })
+        
+        generated += size
+        yield batch
@@ -0,0 +1,92 @@
+import heapq
+import threading
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+
+class HeartbeatMonitor:
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._last_seen: Dict[int, float] = {}
+        self._deadlines: List[Tuple[float, int]] = []
+        self._scheduled: Set[int] = set()
+        self._stale: Set[int] = set()
+        self._revived: Set[int] = set()
+        self._last_sweep = time.monotonic()
+        self.timeout = 300.0
+        self.sweep_interval = 15.0
+    
+    def init_app(self, app):
+        self.timeout = app.config['HEARTBEAT_TIMEOUT']
+        self.sweep_interval = app.config['HEARTBEAT_SWEEP_INTERVAL']
+        self.reset()
+        app.extensions['heartbeat_monitor'] = self
+    
+    def reset(self):
+        with self._lock:
+            self._last_seen.clear()
+            self._deadlines.clear()
+            self._scheduled.clear()
+            self._stale.clear()
+            self._revived.clear()
+    
+    def beat(self, station_id: int, now: Optional[float] = None) -> bool:
+        now = time.monotonic() if now is None else now
+        
+        with self._lock:
+            self._last_seen[station_id] = now
+            
+            if station_id not in self._scheduled:
+                self._scheduled.add(station_id)
+                heapq.heappush(self._deadlines, (now + self.timeout, station_id))
+            
+            if station_id in self._stale:
+                self._stale.discard(station_id)
+                self._revived.add(station_id)
+            
+            return now - self._last_sweep >= self.sweep_interval
+    
+    def last_seen(self, station_id: int) -> Optional[float]:
+        return self._last_seen.get(station_id)
+    
+    def tracked_count(self) -> int:
+        return len(self._scheduled)
+    
+    def collect(self, now: Optional[float] = None) -> Tuple[List[int], List[int]]:
+        now = time.monotonic() if now is None else now
+        expired = []
+        
+        with self._lock:
+            self._last_sweep = now
+            
+            while self._deadlines and self._deadlines[0][0] <= now:
+                _, station_id = heapq.heappop(self._deadlines)
+                deadline = self._last_seen[station_id] + self.timeout
+                
+                if deadline > now:
+                    heapq.heappush(self._deadlines, (deadline, station_id))
+                    continue
+                
+                self._scheduled.discard(station_id)
+                self._stale.add(station_id)
+                expired.append(station_id)
+            
+            revived, self._revived = list(self._revived), set()
+        
+        return expired, revived
+    
+    def restore(self, expired: List[int], revived: List[int]):
+        with self._lock:
+            for station_id in expired:
+                self._stale.discard(station_id)
+                if station_id not in self._scheduled:
+                    self._scheduled.add(station_id)
+                    heapq.heappush(self._deadlines, (self._last_seen[station_id], station_id))
+            
+            for station_id in revived:
+                if station_id not in self._stale:
+                    self._revived.add(station_id)
+
+
+heartbeat_monitor = HeartbeatMonitor()
@@ -1,5 +1,7 @@
 import re
-from typing import Dict, Any, Optional
+import unicodedata
+from itertools import islice
+from typing import Dict, Any, Iterable, Iterator, List, Optional
 from datetime import datetime
 
 
@@ -24,6 +26,13 @@ def sanitize_string(value: str, max_length: Optional[int] = None) -> str:
     return sanitized
 
 
+def normalize_search_key(value: str) -> str:
+    decomposed = unicodedata.normalize('NFKD', value)
+    stripped = ''.join(char for char in decomposed if not unicodedata.combining(char))
+    
+    return ' '.join(stripped.casefold().split())
+
+
 def format_datetime(dt: datetime, format_string: str = '%Y-%m-%d %H:%M:%S') -> str:
     if not isinstance(dt, datetime):
         return str(dt)
@@ -82,6 +91,16 @@ def paginate_query(query, page: int = 1, per_page: int = 50, max_per_page: int =
     )
 
 
+def chunked(iterable: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    iterator = iter(iterable)
+    
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
 def create_response_dict(data: Any, message: str = None, status: str = 'success') -> Dict[str, Any]:
     response = {
         'status': status,
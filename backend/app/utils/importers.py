@@ -0,0 +1,177 @@
+import csv
+import json
+import mmap
+import os
+import re
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+STATION_FIELD_TYPES = {
+    'name': str,
+    'latitude': float,
+    'longitude': float,
+    'charger_type': str,
+    'power_kw': float,
+    'num_spots': int,
+    'status': str,
+    'state': str,
+    'city': str,
+    'external_id': str
+}
+
+_FEATURES_START = re.compile(rb'"features"\s*:\s*\[')
+_JSON_TOKEN = re.compile(rb'"(?:[^"\\]|\\.)*"|[{}\[\]]', re.DOTALL)
+
+
+class ImportFormatError(Exception):
+    pass
+
+
+def detect_format(path: str) -> str:
+    extension = os.path.splitext(path)[1].lower()
+    
+    if extension == '.csv':
+        return 'csv'
+    
+    if extension in ('.geojson', '.json'):
+        return 'geojson'
+    
+    raise ImportFormatError(f'Cannot detect import format from extension: {extension or path}')
+
+
+def coerce_station_fields(record: Dict[str, Any]) -> Dict[str, Any]:
+    station = {}
+    
+    for field, field_type in STATION_FIELD_TYPES.items():
+        value = record.get(field)
+        
+        if isinstance(value, str):
+            value = value.strip()
+            if value == '':
+                value = None
+        
+        if value is not None and field_type is not str and isinstance(value, str):
+            try:
+                value = field_type(value)
+            except ValueError:
+                pass
+        
+        station[field] = value
+    
+    return station
+
+
+def feature_to_station(feature: Any) -> Dict[str, Any]:
+    if not isinstance(feature, dict):
+        raise ImportFormatError('Feature must be a JSON object')
+    
+    record = dict(feature.get('properties') or {})
+    geometry = feature.get('geometry') or {}
+    coordinates = geometry.get('coordinates')
+    
+    if geometry.get('type') == 'Point' and isinstance(coordinates, list) and len(coordinates) >= 2:
+        record['longitude'], record['latitude'] = coordinates[0], coordinates[1]
+    
+    return coerce_station_fields(record)
+
+
+def open_mapped(path: str) -> Optional[mmap.mmap]:
+    with open(path, 'rb') as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            return None
+        return mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def iter_csv_records(path: str, offset: int = 0) -> Iterator[Tuple[Any, int]]:
+    mapped = open_mapped(path)
+    if mapped is None:
+        return
+    
+    def lines():
+        for line in iter(mapped.readline, b''):
+            yield line.decode('utf-8', errors='surrogateescape')
+    
+    try:
+        try:
+            header = next(csv.reader([mapped.readline().decode('utf-8-sig')]))
+        except UnicodeDecodeError:
+            raise ImportFormatError('CSV header is not valid UTF-8')
+        
+        if offset > mapped.tell():
+            mapped.seek(offset)
+        
+        reader = csv.reader(lines())
+            
+        while True:
+            try:
+                values = next(reader)
+            except StopIteration:
+                return
+            except csv.Error as e:
+                yield ImportFormatError(f'Malformed CSV row: {e}'), mapped.tell()
+                continue
+            
+            end_offset = mapped.tell()
+            
+            if len(values) <= 1 and not ''.join(values).strip():
+                continue
+            
+            try:
+                ''.join(values).encode('utf-8')
+            except UnicodeEncodeError:
+                yield ImportFormatError('Row is not valid UTF-8 text'), end_offset
+                continue
+            
+            if len(values) != len(header):
+                yield ImportFormatError('Row has a different number of columns than the header'), end_offset
+                continue
+            
+            yield coerce_station_fields(dict(zip(header, values))), end_offset
+    finally:
+        mapped.close()
+
+
+def iter_geojson_records(path: str, offset: int = 0) -> Iterator[Tuple[Any, int]]:
+    mapped = open_mapped(path)
+    if mapped is None:
+        return
+    
+    try:
+        match = _FEATURES_START.search(mapped)
+        if not match:
+            raise ImportFormatError('GeoJSON file must be a FeatureCollection with a features array')
+        
+        position = max(match.end(), offset)
+        depth = 0
+        feature_start = None
+        
+        for token in _JSON_TOKEN.finditer(mapped, position):
+            value = token.group()
+            
+            if value in (b'{', b'['):
+                if depth == 0:
+                    feature_start = token.start()
+                depth += 1
+            elif value in (b'}', b']'):
+                if depth == 0:
+                    return
+                depth -= 1
+                
+                if depth == 0:
+                    try:
+                        record = feature_to_station(json.loads(mapped[feature_start:token.end()]))
+                    except (ValueError, ImportFormatError) as e:
+                        record = ImportFormatError(f'Invalid feature: {e}')
+                    
+                    yield record, token.end()
+    finally:
+        mapped.close()
+
+
+def iter_station_records(path: str, file_format: str, offset: int = 0) -> Iterator[Tuple[Any, int]]:
+    if file_format == 'csv':
+        return iter_csv_records(path, offset)
+    
+    if file_format == 'geojson':
+        return iter_geojson_records(path, offset)
+    
+    raise ImportFormatError(f'Unsupported import format: {file_format}')
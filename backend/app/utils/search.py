@@ -0,0 +1,243 @@
+import bisect
+import heapq
+import re
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+from app.utils.change_index import StationChangeIndex
+from app.utils.helpers import normalize_search_key
+
+STOPWORDS = {'a', 'o', 'as', 'os', 'de', 'da', 'do', 'das', 'dos', 'e', 'em', 'na', 'no'}
+
+FIELD_WEIGHTS = {'name': 2.0, 'city': 1.0}
+
+_TOKEN = re.compile(r'[a-z0-9]+')
+
+_WORD = re.compile(r'\w+')
+
+
+def tokenize(value: Optional[str]) -> List[str]:
+    if not value:
+        return []
+    
+    return [token for token in _TOKEN.findall(normalize_search_key(value)) if token not in STOPWORDS]
+
+
+def label_tokens(value: Optional[str]) -> Dict[str, str]:
+    labels: Dict[str, str] = {}
+    
+    for word in _WORD.findall(value or ''):
+        tokens = tokenize(word)
+        for token in tokens:
+            labels.setdefault(token, word if len(tokens) == 1 else token)
+    
+    return labels
+
+
+def trigrams(token: str) -> Set[str]:
+    padded = f'  {token} '
+    return {padded[index:index + 3] for index in range(len(padded) - 2)}
+
+
+class StationSearchIndex(StationChangeIndex):
+    
+    def __init__(self):
+        super().__init__()
+        self._token_docs: Dict[str, Dict[int, float]] = {}
+        self._gram_tokens: Dict[str, Set[str]] = defaultdict(set)
+        self._doc_tokens: Dict[int, Dict[str, float]] = {}
+        self.min_similarity = 0.3
+    
+    def init_app(self, app):
+        self.min_similarity = app.config['SEARCH_MIN_SIMILARITY']
+        self.reset()
+        app.extensions['station_search_index'] = self
+    
+    def clear(self):
+        self._token_docs = {}
+        self._gram_tokens = defaultdict(set)
+        self._doc_tokens = {}
+    
+    def document_count(self) -> int:
+        return len(self._doc_tokens)
+    
+    def add(self, station_id: int, name: str, city: str):
+        weights: Dict[str, float] = {}
+        
+        for field, value in (('name', name), ('city', city)):
+            for token in tokenize(value):
+                weights[token] = max(weights.get(token, 0.0), FIELD_WEIGHTS[field])
+        
+        with self._lock:
+            self._doc_tokens[station_id] = weights
+            
+            for token, weight in weights.items():
+                docs = self._token_docs.get(token)
+                
+                if docs is None:
+                    docs = self._token_docs[token] = {}
+                    for gram in trigrams(token):
+                        self._gram_tokens[gram].add(token)
+                
+                docs[station_id] = weight
+    
+    def remove(self, station_id: int):
+        with self._lock:
+            weights = self._doc_tokens.pop(station_id, None)
+            if not weights:
+                return
+            
+            for token in weights:
+                docs = self._token_docs[token]
+                docs.pop(station_id, None)
+                
+                if docs:
+                    continue
+                
+                del self._token_docs[token]
+                for gram in trigrams(token):
+                    tokens = self._gram_tokens[gram]
+                    tokens.discard(token)
+                    if not tokens:
+                        del self._gram_tokens[gram]
+    
+    def match_tokens(self, query_token: str) -> Dict[str, float]:
+        query_grams = trigrams(query_token)
+        shared: Dict[str, int] = defaultdict(int)
+        
+        for gram in query_grams:
+            for token in self._gram_tokens.get(gram, ()):
+                shared[token] += 1
+        
+        matches = {}
+        for token, count in shared.items():
+            similarity = count / (len(query_grams) + len(token) + 1 - count)
+            
+            if token.startswith(query_token):
+                similarity = max(similarity, 0.9 if token != query_token else 1.0)
+            
+            if similarity >= self.min_similarity:
+                matches[token] = similarity
+        
+        return matches
+    
+    def search(self, query: str, limit: int = 20) -> List[Tuple[int, float]]:
+        query_tokens = list(dict.fromkeys(tokenize(query)))
+        if not query_tokens:
+            return []
+        
+        with self._lock:
+            scores: Dict[int, float] = defaultdict(float)
+            matched: Dict[int, int] = defaultdict(int)
+            
+            for query_token in query_tokens:
+                best: Dict[int, float] = {}
+                
+                for token, similarity in self.match_tokens(query_token).items():
+                    for station_id, weight in self._token_docs[token].items():
+                        score = similarity * weight
+                        if score > best.get(station_id, 0.0):
+                            best[station_id] = score
+                
+                for station_id, score in best.items():
+                    scores[station_id] += score
+                    matched[station_id] += 1
+        
+        ranked = heapq.nsmallest(
+            limit,
+            scores,
+            key=lambda station_id: (-matched[station_id], -scores[station_id], station_id)
+        )
+        return [(station_id, round(scores[station_id], 4)) for station_id in ranked]
+    
+
+class StationSuggestIndex(StationChangeIndex):
+    
+    def __init__(self):
+        super().__init__()
+        self._keys: List[Tuple[str, str]] = []
+        self._counts: Dict[Tuple[str, str], int] = {}
+        self._labels: Dict[Tuple[str, str], Dict[str, int]] = {}
+        self._docs: Dict[int, List[Tuple[Tuple[str, str], str]]] = {}
+    
+    def init_app(self, app):
+        self.sync_interval = app.config['SUGGEST_SYNC_INTERVAL']
+        self.reset()
+        app.extensions['station_suggest_index'] = self
+    
+    def clear(self):
+        self._keys = []
+        self._counts = {}
+        self._labels = {}
+        self._docs = {}
+    
+    def document_count(self) -> int:
+        return len(self._docs)
+    
+    def add(self, station_id: int, name: str, city: str):
+        city_key = normalize_search_key(city or '')
+        entries = [((city_key, 'city'), city)] if city_key else []
+        entries += [((token, 'name'), label) for token, label in label_tokens(name).items()]
+        
+        with self._lock:
+            self._docs[station_id] = entries
+            
+            for entry, label in entries:
+                self._increment(entry, label)
+    
+    def remove(self, station_id: int):
+        with self._lock:
+            for entry, label in self._docs.pop(station_id, ()):
+                self._decrement(entry, label)
+    
+    def suggest(self, prefix: str, limit: int = 10, field: Optional[str] = None) -> List[Dict[str, object]]:
+        key = normalize_search_key(prefix)
+        if not key:
+            return []
+        
+        with self._lock:
+            start = bisect.bisect_left(self._keys, (key, ''))
+            end = bisect.bisect_left(self._keys, (key + '\uffff', ''))
+            
+            entries = [entry for entry in self._keys[start:end] if field is None or entry[1] == field]
+            top = heapq.nsmallest(limit, entries, key=lambda entry: (-self._counts[entry], entry))
+            
+            return [
+                {
+                    'text': self._label(entry),
+                    'field': entry[1],
+                    'count': self._counts[entry]
+                }
+                for entry in top
+            ]
+    
+    def _label(self, entry: Tuple[str, str]) -> str:
+        labels = self._labels[entry]
+        return max(labels, key=lambda label: (labels[label], label))
+        
+    def _increment(self, entry: Tuple[str, str], label: str):
+        if entry not in self._counts:
+            self._counts[entry] = 0
+            self._labels[entry] = {}
+            bisect.insort(self._keys, entry)
+        
+        self._counts[entry] += 1
+        labels = self._labels[entry]
+        labels[label] = labels.get(label, 0) + 1
+    
+    def _decrement(self, entry: Tuple[str, str], label: str):
+        self._counts[entry] -= 1
+        labels = self._labels[entry]
+        labels[label] -= 1
+        
+        if not labels[label]:
+            del labels[label]
+        
+        if not self._counts[entry]:
+            del self._counts[entry]
+            del self._labels[entry]
+            del self._keys[bisect.bisect_left(self._keys, entry)]
+
+
+station_search_index = StationSearchIndex()
+station_suggest_index = StationSuggestIndex()
@@ -0,0 +1,106 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+from flask import Response, current_app, request
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+class ResponseSerializer(ABC):
+    
+    mimetype = None
+    
+    @abstractmethod
+    def dumps(self, payload: Any) -> bytes:
+        pass
+
+
+class JSONSerializer(ResponseSerializer):
+    
+    mimetype = 'application/json'
+    
+    def dumps(self, payload: Any) -> bytes:
+        return current_app.json.dumps(payload).encode('utf-8')
+
+
+class MessagePackSerializer(ResponseSerializer):
+    
+    mimetype = 'application/msgpack'
+    
+    def dumps(self, payload: Any) -> bytes:
+        return msgpack.packb(payload, use_bin_type=True, default=str)
+
+
+_serializers: Dict[str, ResponseSerializer] = {}
+_aliases: Dict[str, str] = {}
+
+
+def register_serializer(serializer: ResponseSerializer, aliases: Optional[List[str]] = None):
+    _serializers[serializer.mimetype] = serializer
+    
+    for alias in aliases or []:
+        _aliases[alias] = serializer.mimetype
+
+
+def get_serializer(mimetype: str) -> Optional[ResponseSerializer]:
+    return _serializers.get(_aliases.get(mimetype, mimetype))
+
+
+def available_mimetypes() -> List[str]:
+    return list(_serializers) + list(_aliases)
+
+
+register_serializer(JSONSerializer())
+
+if msgpack is not None:
+    register_serializer(MessagePackSerializer(), aliases=['application/x-msgpack'])
+
+
+def to_columnar(payload: Any) -> Any:
+    if isinstance(payload, dict):
+        return {key: to_columnar(value) for key, value in payload.items()}
+    
+    if isinstance(payload, list) and payload and all(isinstance(row, dict) for row in payload):
+        columns = {}
+        for row in payload:
+            for key in row:
+                if key not in columns:
+                    columns[key] = []
+        
+        for row in payload:
+            for key, values in columns.items():
+                values.append(row.get(key))
+        
+        return columns
+    
+    return payload
+
+
+def negotiate_serializer() -> ResponseSerializer:
+    mimetype = request.accept_mimetypes.best_match(
+        available_mimetypes(),
+        default=JSONSerializer.mimetype
+    )
+    return get_serializer(mimetype) or get_serializer(JSONSerializer.mimetype)
+
+
+def wants_columnar() -> bool:
+    return request.args.get('shape', '').lower() == 'columnar'
+
+
+def serialize_response(payload: Any, status: int = 200) -> Response:
+    serializer = negotiate_serializer()
+    
+    if wants_columnar():
+        payload = to_columnar(payload)
+    
+    response = Response(
+        serializer.dumps(payload),
+        status=status,
+        mimetype=serializer.mimetype
+    )
+    response.vary.add('Accept')
+    return response
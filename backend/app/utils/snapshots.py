@@ -0,0 +1,234 @@
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy import func, select
+
+from app.models.charging_station import ChargingStation, StationRow
+from app.models.station_change import StationChange
+from app.utils.background import register_periodic_task
+from app.utils.database import db
+
+SNAPSHOT_SHAPES = ('rows', 'columnar')
+
+
+class SnapshotWriter:
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._manifest: Optional[Dict[str, Any]] = None
+        self._manifest_mtime = None
+        self.directory = None
+        self.debounce = 5.0
+        self.max_delay = 60.0
+    
+    def init_app(self, app):
+        self.directory = app.config['SNAPSHOT_DIR'] or os.path.join(app.instance_path, 'snapshots')
+        self.debounce = app.config['SNAPSHOT_DEBOUNCE']
+        self.max_delay = app.config['SNAPSHOT_MAX_DELAY']
+        self._manifest = None
+        self._manifest_mtime = None
+        app.extensions['snapshot_writer'] = self
+        
+        register_periodic_task(app, 'snapshot-writer', app.config['SNAPSHOT_CHECK_INTERVAL'], self.refresh)
+    
+    def manifest(self) -> Optional[Dict[str, Any]]:
+        path = os.path.join(self.directory, 'manifest.json')
+        
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+        
+        if mtime != self._manifest_mtime:
+            with open(path) as handle:
+                self._manifest = json.load(handle)
+            self._manifest_mtime = mtime
+        
+        return self._manifest
+    
+    def file_path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+    
+    def is_stale(self, now: Optional[datetime] = None) -> bool:
+        manifest = self.manifest()
+        version, changed_at = db.session.query(
+            func.max(StationChange.version),
+            func.max(StationChange.changed_at)
+        ).one()
+        
+        if manifest is None:
+            return True
+        
+        if (version or 0) == manifest['version']:
+            return False
+        
+        now = now or datetime.utcnow()
+        generated_at = datetime.fromisoformat(manifest['generated_at'])
+        
+        return (
+            (now - changed_at).total_seconds() >= self.debounce
+            or (now - generated_at).total_seconds() >= self.max_delay
+        )
+    
+    def refresh(self) -> bool:
+        if not self.is_stale():
+            return False
+        
+        self.write()
+        return True
+    
+    def ensure(self) -> Dict[str, Any]:
+        manifest = self.manifest()
+        if manifest is not None:
+            return manifest
+        
+        with self._lock:
+            return self.manifest() or self._write()
+    
+    def write(self) -> Dict[str, Any]:
+        with self._lock:
+            return self._write()
+    
+    def _write(self) -> Dict[str, Any]:
+        os.makedirs(self.directory, exist_ok=True)
+            
+        version = db.session.query(func.max(StationChange.version)).scalar() or 0
+        generated_at = datetime.utcnow()
+        header = f'{{"version":{version},"generated_at":"{generated_at.isoformat()}","stations":'.encode('utf-8')
+            
+        files = {shape: _SnapshotFile(self.directory, shape) for shape in SNAPSHOT_SHAPES}
+        spools: Dict[str, Any] = {}
+        count = 0
+                
+        try:
+            files['rows'].write(header + b'[')
+            
+            result = db.session.execute(
+                select(*StationRow.columns()).order_by(ChargingStation.id),
+                execution_options={'yield_per': 1000}
+            )
+            
+            for row in result:
+                station = StationRow(*row).to_dict()
+                separator = b',' if count else b''
+                files['rows'].write(separator + _dumps(station))
+                
+                for key, value in station.items():
+                    if key not in spools:
+                        spools[key] = tempfile.TemporaryFile(dir=self.directory)
+                    spools[key].write(separator + _dumps(value))
+                
+                count += 1
+            
+            footer = f',"count":{count}}}'.encode('utf-8')
+            files['rows'].write(b']' + footer)
+            
+            files['columnar'].write(header + b'{')
+            for index, (key, spool) in enumerate(spools.items()):
+                files['columnar'].write((b',' if index else b'') + _dumps(key) + b':[')
+                spool.seek(0)
+                shutil.copyfileobj(spool, files['columnar'])
+                files['columnar'].write(b']')
+            files['columnar'].write(b'}' + footer)
+            
+            manifest = {
+                'version': version,
+                'generated_at': generated_at.isoformat(),
+                'count': count,
+                'files': {shape: snapshot_file.finish(version) for shape, snapshot_file in files.items()}
+            }
+        except Exception:
+            for snapshot_file in files.values():
+                snapshot_file.discard()
+            raise
+        finally:
+            for spool in spools.values():
+                spool.close()
+            
+        previous = self.manifest()
+        self._replace(os.path.join(self.directory, 'manifest.json'), json.dumps(manifest).encode('utf-8'))
+        self._remove_files(manifest, previous)
+            
+        return manifest
+    
+    def _replace(self, path: str, data: bytes) -> None:
+        temporary_path = f'{path}.{os.getpid()}.tmp'
+        
+        with open(temporary_path, 'wb') as handle:
+            handle.write(data)
+        
+        os.replace(temporary_path, path)
+    
+    def _remove_files(self, *manifests: Optional[Dict[str, Any]]) -> None:
+        keep = {
+            variant['name']
+            for manifest in manifests if manifest
+            for files in manifest['files'].values()
+            for variant in files.values()
+        }
+        
+        for name in os.listdir(self.directory):
+            if name.startswith('stations-') and name not in keep:
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except FileNotFoundError:
+                    pass
+
+
+class _SnapshotFile:
+    
+    def __init__(self, directory: str, shape: str):
+        self.directory = directory
+        self.shape = shape
+        self._digest = hashlib.blake2b(digest_size=12)
+        self._path = os.path.join(directory, f'.{shape}.{os.getpid()}.tmp')
+        self._plain = open(self._path, 'wb')
+        self._gzip_handle = open(f'{self._path}.gz', 'wb')
+        self._gzip = gzip.GzipFile(fileobj=self._gzip_handle, mode='wb', compresslevel=6, mtime=0)
+    
+    def write(self, data: bytes) -> None:
+        self._digest.update(data)
+        self._plain.write(data)
+        self._gzip.write(data)
+    
+    def finish(self, version: int) -> Dict[str, Any]:
+        self._close()
+        
+        digest = self._digest.hexdigest()
+        name = f'stations-{self.shape}-{version}-{digest}.json'
+        
+        os.replace(self._path, os.path.join(self.directory, name))
+        os.replace(f'{self._path}.gz', os.path.join(self.directory, f'{name}.gz'))
+        
+        return {
+            'plain': {'name': name, 'etag': f'{digest}-{self.shape}'},
+            'gzip': {'name': f'{name}.gz', 'etag': f'{digest}-{self.shape}-gz'}
+        }
+    
+    def discard(self) -> None:
+        self._close()
+        
+        for path in (self._path, f'{self._path}.gz'):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+    
+    def _close(self) -> None:
+        self._gzip.close()
+        self._gzip_handle.close()
+        self._plain.close()
+
+
+def _dumps(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+snapshot_writer = SnapshotWriter()
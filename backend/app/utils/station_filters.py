@@ -0,0 +1,324 @@
+import operator
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import bindparam, func, select
+
+from app.models.charging_station import ChargingStation, StationRow
+from app.utils.database import db
+
+LIST_FILTERS = {
+    'type': ChargingStation.charger_type,
+    'status': ChargingStation.status,
+    'state': ChargingStation.state
+}
+
+RANGE_FILTERS = {
+    'min_power': (ChargingStation.power_kw, float, operator.ge),
+    'max_power': (ChargingStation.power_kw, float, operator.le),
+    'min_spots': (ChargingStation.num_spots, int, operator.ge),
+    'max_spots': (ChargingStation.num_spots, int, operator.le)
+}
+
+DATE_FILTERS = {
+    'created_after': ChargingStation.created_at,
+    'updated_after': ChargingStation.updated_at
+}
+
+SORT_COLUMNS = {
+    'id': ChargingStation.id,
+    'name': ChargingStation.name,
+    'power_kw': ChargingStation.power_kw,
+    'num_spots': ChargingStation.num_spots,
+    'available_spots': ChargingStation.available_spots,
+    'state': ChargingStation.state,
+    'city': ChargingStation.city_key,
+    'created_at': ChargingStation.created_at,
+    'updated_at': ChargingStation.updated_at
+}
+
+
+def split_filter_values(value: Optional[str]) -> List[str]:
+    if not value:
+        return []
+    
+    return list(dict.fromkeys(item.strip().upper() for item in value.split(',') if item.strip()))
+
+
+def parse_filter_datetime(name: str, value: str) -> datetime:
+    try:
+        parsed = datetime.fromisoformat(value.strip().replace('Z', '+00:00'))
+    except ValueError:
+        raise ValueError(f'{name} must be an ISO 8601 date or datetime')
+    
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    
+    return parsed
+
+
+def parse_sort(sort: Optional[str]) -> Tuple[Tuple[str, bool], ...]:
+    fields = {}
+    
+    for item in (sort or '').split(','):
+        item = item.strip()
+        if not item:
+            continue
+        
+        field = item.lstrip('+-')
+        if field not in SORT_COLUMNS:
+            raise ValueError(f"Unknown sort field: {field}. Valid fields: {', '.join(SORT_COLUMNS)}")
+        
+        fields.setdefault(field, item.startswith('-'))
+    
+    fields.setdefault('id', False)
+    return tuple(fields.items())
+
+
+class StatementCache:
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._statements: 'OrderedDict[Tuple, Any]' = OrderedDict()
+        self.max_size = 512
+        self.hits = 0
+        self.misses = 0
+    
+    def init_app(self, app):
+        self.max_size = app.config['STATEMENT_CACHE_SIZE']
+        self.clear()
+        app.extensions['station_statement_cache'] = self
+    
+    def clear(self):
+        with self._lock:
+            self._statements = OrderedDict()
+            self.hits = 0
+            self.misses = 0
+    
+    def get(self, key: Tuple, build: Callable[[], Any]):
+        with self._lock:
+            statement = self._statements.get(key)
+            
+            if statement is not None:
+                self.hits += 1
+                self._statements.move_to_end(key)
+                return statement
+            
+            self.misses += 1
+        
+        statement = build()
+        
+        with self._lock:
+            self._statements[key] = statement
+            while len(self._statements) > self.max_size:
+                self._statements.popitem(last=False)
+        
+        return statement
+    
+    def stats(self) -> Dict[str, int]:
+        return {
+            'size': len(self._statements),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+
+station_statement_cache = StatementCache()
+
+
+class StationFilterSpec:
+    
+    def __init__(self, filters: Optional[Dict[str, str]] = None, sort: Optional[str] = None,
+                 after_id: Optional[int] = None, ids: Optional[List[int]] = None):
+        filters = filters or {}
+        shape = []
+        self.values: Dict[str, Any] = {}
+        
+        if ids is not None:
+            self.values['ids'] = ids
+            shape.append('ids')
+        
+        if after_id is not None:
+            self.values['after_id'] = after_id
+            shape.append('after_id')
+        
+        for name in LIST_FILTERS:
+            values = split_filter_values(filters.get(name))
+            if values:
+                shape.append(name)
+                self.values[name] = values
+        
+        if filters.get('city'):
+            key = ChargingStation.compute_city_key(filters['city']) or ''
+            match = filters.get('city_match', 'contains')
+            escaped = key.replace('/', '//').replace('%', '/%').replace('_', '/_')
+            
+            if match == 'exact':
+                self.values['city_key'] = key
+            elif match == 'prefix' and key and db.session.get_bind().dialect.name == 'postgresql':
+                self.values['city_pattern'] = f'{escaped}%'
+            elif match == 'prefix' and key:
+                self.values['city_low'] = key
+                self.values['city_high'] = key[:-1] + chr(ord(key[-1]) + 1)
+            else:
+                match = 'contains'
+                self.values['city_pattern'] = f'%{escaped}%'
+            
+            shape.append(('city', match))
+        
+        available = (filters.get('available') or '').lower()
+        if available in ('true', '1', 'yes'):
+            shape.append(('available', True))
+        elif available in ('false', '0', 'no'):
+            shape.append(('available', False))
+        elif available:
+            raise ValueError('available must be true or false')
+        
+        for name, (_, value_type, _) in RANGE_FILTERS.items():
+            if filters.get(name):
+                try:
+                    self.values[name] = value_type(filters[name])
+                except ValueError:
+                    kind = 'an integer' if value_type is int else 'a number'
+                    raise ValueError(f'{name} must be {kind}')
+                shape.append(name)
+        
+        for name in DATE_FILTERS:
+            if filters.get(name):
+                self.values[name] = parse_filter_datetime(name, filters[name])
+                shape.append(name)
+        
+        self.sort = parse_sort(sort)
+        self.shape = tuple(shape)
+    
+    def criteria(self, exclude: Optional[str] = None, bound: bool = False) -> list:
+        def param(name):
+            expanding = name in LIST_FILTERS or name == 'ids'
+            if bound:
+                return bindparam(f'filter_{name}', value=self.values[name], expanding=expanding)
+            return bindparam(f'filter_{name}', expanding=expanding)
+        
+        criteria = []
+        
+        for item in self.shape:
+            name, option = item if isinstance(item, tuple) else (item, None)
+            
+            if name == exclude:
+                continue
+            
+            if name == 'ids':
+                criteria.append(ChargingStation.id.in_(param(name)))
+            elif name == 'after_id':
+                criteria.append(ChargingStation.id > param(name))
+            elif name in LIST_FILTERS:
+                criteria.append(LIST_FILTERS[name].in_(param(name)))
+            elif name == 'city' and option == 'exact':
+                criteria.append(ChargingStation.city_key == param('city_key'))
+            elif name == 'city' and option == 'prefix' and 'city_low' in self.values:
+                criteria.append(ChargingStation.city_key >= param('city_low'))
+                criteria.append(ChargingStation.city_key < param('city_high'))
+            elif name == 'city':
+                criteria.append(ChargingStation.city_key.like(param('city_pattern'), escape='/'))
+            elif name == 'available':
+                criteria.append(ChargingStation.available_spots > 0 if option else ChargingStation.available_spots == 0)
+            elif name in RANGE_FILTERS:
+                column, _, compare = RANGE_FILTERS[name]
+                criteria.append(compare(column, param(name)))
+            elif name in DATE_FILTERS:
+                criteria.append(DATE_FILTERS[name] > param(name))
+        
+        return criteria
+    
+    @property
+    def params(self) -> Dict[str, Any]:
+        return {f'filter_{name}': value for name, value in self.values.items()}
+    
+    def order_by(self) -> list:
+        return [
+            SORT_COLUMNS[field].desc() if descending else SORT_COLUMNS[field].asc()
+            for field, descending in self.sort
+        ]
+    
+    def apply(self, query):
+        return query.filter(*self.criteria(bound=True))
+    
+    def count(self) -> int:
+        statement = station_statement_cache.get(
+            ('count', self.shape),
+            lambda: select(func.count(ChargingStation.id)).where(*self.criteria())
+        )
+        return db.session.execute(statement, self.params).scalar()
+    
+    def fetch(self, limit: int, offset: int = 0) -> List[StationRow]:
+        statement = self._page_statement()
+        params = dict(self.params, page_limit=limit, page_offset=offset)
+        return [StationRow(*row) for row in db.session.execute(statement, params)]
+        
+    def stream(self, limit: int, fetch_size: int) -> 'StationStream':
+        statement = self._page_statement()
+        params = dict(self.params, page_limit=limit + 1, page_offset=0)
+        return StationStream(statement, params, limit, fetch_size)
+    
+    def _page_statement(self):
+        return station_statement_cache.get(
+            ('page', self.shape, self.sort),
+            lambda: (
+                select(*StationRow.columns())
+                .where(*self.criteria())
+                .order_by(*self.order_by())
+                .limit(bindparam('page_limit'))
+                .offset(bindparam('page_offset'))
+            )
+        )
+    
+    def facet_counts(self, facet_columns: Dict[str, Any], facets: List[str]) -> List[Tuple[str, Any, int]]:
+        def build():
+            queries = [
+                select(
+                    db.literal(facet).label('facet'),
+                    db.cast(facet_columns[facet], db.String).label('value'),
+                    func.count(ChargingStation.id).label('count')
+                )
+                .where(*self.criteria(exclude=facet))
+                .group_by(facet_columns[facet])
+                for facet in facets
+            ]
+            return queries[0] if len(queries) == 1 else db.union_all(*queries)
+        
+        statement = station_statement_cache.get(('facets', self.shape, tuple(facets)), build)
+        return db.session.execute(statement, self.params).all()
+
+
+class StationStream:
+    
+    def __init__(self, statement, params: Dict[str, Any], limit: int, fetch_size: int):
+        self.statement = statement
+        self.params = params
+        self.limit = limit
+        self.fetch_size = fetch_size
+        self.count = 0
+        self.next_cursor: Optional[int] = None
+    
+    def __iter__(self) -> Iterator[StationRow]:
+        result = db.session.execute(
+            self.statement,
+            self.params,
+            execution_options={'yield_per': self.fetch_size}
+        )
+        last_id = None
+        
+        try:
+            for row in result:
+                if self.count == self.limit:
+                    self.next_cursor = last_id
+                    break
+                
+                self.count += 1
+                last_id = row.id
+                yield StationRow(*row)
+        finally:
+            result.close()
+
@@ -0,0 +1,92 @@
+import atexit
+import threading
+import time
+from typing import Any, Dict, List
+
+from sqlalchemy import insert
+
+from app.models.charging_station import ChargingStation
+from app.models.meter_reading import MeterReading, MeterRollup, MeterRollupMark
+from app.utils.background import register_periodic_task
+from app.utils.database import db
+from app.utils.helpers import chunked
+
+
+class TelemetryBuffer:
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending: List[Dict[str, Any]] = []
+        self._last_flush = time.monotonic()
+        self.flush_interval = 2.0
+        self.max_pending = 10000
+    
+    def init_app(self, app):
+        self.flush_interval = app.config['TELEMETRY_FLUSH_INTERVAL']
+        self.max_pending = app.config['TELEMETRY_MAX_PENDING']
+        self._pending = []
+        app.extensions['telemetry_buffer'] = self
+        
+        register_periodic_task(app, 'telemetry-flush', self.flush_interval, self.flush)
+        
+        if app.config.get('BACKGROUND_TASKS_ENABLED'):
+            atexit.register(self._flush_on_exit, app)
+    
+    def record(self, rows: List[Dict[str, Any]]) -> bool:
+        with self._lock:
+            self._pending.extend(rows)
+            
+            return (
+                len(self._pending) >= self.max_pending
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            )
+    
+    def pending_count(self) -> int:
+        return len(self._pending)
+    
+    def flush(self) -> int:
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, []
+                self._last_flush = time.monotonic()
+            
+            if not pending:
+                return 0
+            
+            try:
+                written = self._write(pending)
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                with self._lock:
+                    self._pending[:0] = pending
+                raise
+            
+            return written
+    
+    def _write(self, pending: List[Dict[str, Any]]) -> int:
+        station_ids = {row['station_id'] for row in pending}
+        existing = {
+            station_id for station_id, in
+            db.session.query(ChargingStation.id).filter(ChargingStation.id.in_(station_ids))
+        }
+        
+        rows = [row for row in pending if row['station_id'] in existing]
+        
+        for batch in chunked(rows, self.max_pending):
+            db.session.execute(insert(MeterReading), batch)
+        
+        width = MeterRollup.resolutions['1m']
+        MeterRollupMark.mark(db.session, '1m', sorted({
+            (row['station_id'], row['recorded_at'] - row['recorded_at'] % width) for row in rows
+        }))
+        
+        return len(rows)
+    
+    def _flush_on_exit(self, app):
+        with app.app_context():
+            self.flush()
+
+
+telemetry_buffer = TelemetryBuffer()
@@ -0,0 +1,127 @@
+"""station sync and search columns
+
+Revision ID: 3f2a9c1d7b40
+Revises:
+Create Date: 2026-10-19 18:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f2a9c1d7b40'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+TABLE = 'charging_stations'
+
+COLUMNS = [
+    ('source', sa.String(64)),
+    ('external_id', sa.String(255)),
+    ('content_hash', sa.String(32)),
+    ('city_key', sa.String(255)),
+    ('available_spots', sa.Integer())
+]
+
+INDEXES = [
+    ('ix_charging_stations_city_key', ['city_key']),
+    ('ix_charging_stations_available_spots', ['available_spots']),
+    ('ix_charging_stations_state_charger_type_power_kw', ['state', 'charger_type', 'power_kw']),
+    ('ix_charging_stations_status_charger_type_power_kw', ['status', 'charger_type', 'power_kw']),
+    ('ix_charging_stations_state_city_key', ['state', 'city_key']),
+    ('ix_charging_stations_updated_at', ['updated_at'])
+]
+
+UNIQUE_CONSTRAINT = 'uq_charging_stations_source_external_id'
+
+BACKFILL_BATCH_SIZE = 5000
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    
+    if TABLE not in inspector.get_table_names():
+        return
+    
+    existing_columns = {column['name'] for column in inspector.get_columns(TABLE)}
+    existing_indexes = {index['name'] for index in inspector.get_indexes(TABLE)}
+    existing_constraints = {constraint['name'] for constraint in inspector.get_unique_constraints(TABLE)}
+    
+    with op.batch_alter_table(TABLE) as batch_op:
+        for name, column_type in COLUMNS:
+            if name not in existing_columns:
+                batch_op.add_column(sa.Column(name, column_type, nullable=True))
+        
+        if UNIQUE_CONSTRAINT not in existing_constraints:
+            batch_op.create_unique_constraint(UNIQUE_CONSTRAINT, ['source', 'external_id'])
+    
+    for name, columns in INDEXES:
+        if name not in existing_indexes:
+            op.create_index(name, TABLE, columns)
+    
+    if bind.dialect.name == 'postgresql':
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        op.execute(
+            'CREATE INDEX IF NOT EXISTS ix_charging_stations_city_key_trgm '
+            'ON charging_stations USING gin (city_key gin_trgm_ops)'
+        )
+        op.execute(
+            'CREATE INDEX IF NOT EXISTS ix_charging_stations_city_key_pattern '
+            'ON charging_stations (city_key varchar_pattern_ops)'
+        )
+    
+    _backfill(bind)
+
+
+def downgrade():
+    bind = op.get_bind()
+    
+    if bind.dialect.name == 'postgresql':
+        op.execute('DROP INDEX IF EXISTS ix_charging_stations_city_key_trgm')
+        op.execute('DROP INDEX IF EXISTS ix_charging_stations_city_key_pattern')
+    
+    for name, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=TABLE)
+    
+    with op.batch_alter_table(TABLE) as batch_op:
+        batch_op.drop_constraint(UNIQUE_CONSTRAINT, type_='unique')
+        
+        for name, _ in reversed(COLUMNS):
+            batch_op.drop_column(name)
+
+
+def _backfill(bind):
+    from app.models.charging_station import ChargingStation
+    
+    stations = sa.table(
+        TABLE,
+        *[sa.column(name) for name in ['id', 'city_key', 'content_hash'] + ChargingStation.data_fields]
+    )
+    last_id = 0
+    
+    while True:
+        rows = bind.execute(
+            sa.select(stations)
+            .where(stations.c.id > last_id, sa.or_(stations.c.content_hash.is_(None), stations.c.city_key.is_(None)))
+            .order_by(stations.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).mappings().all()
+        
+        if not rows:
+            return
+        
+        bind.execute(
+            stations.update().where(stations.c.id == sa.bindparam('station_id')),
+            [
+                {
+                    'station_id': row['id'],
+                    'content_hash': ChargingStation.compute_content_hash(row),
+                    'city_key': ChargingStation.compute_city_key(row['city'])
+                }
+                for row in rows
+            ]
+        )
+        last_id = rows[-1]['id']
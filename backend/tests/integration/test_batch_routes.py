@@ -0,0 +1,74 @@
+import pytest
+from app.models.charging_station import ChargingStation
+from app.services.auth_service import AuthService
+from app.services.charging_station_service import ChargingStationService
+from app.utils.database import db
+
+
+class TestBatchRoutes:
+    
+    
+    def test_batch_dispatches_sub_requests(self, client, auth_headers, sample_station, monkeypatch):
+        
+        decoded = []
+        decode_token = AuthService._decode_token
+        monkeypatch.setattr(AuthService, '_decode_token',
+                            classmethod(lambda cls, token: decoded.append(token) or decode_token(token)))
+        
+        response = client.post('/api/batch', json={'requests': [
+            {'path': '/api/cargas', 'query': {'type': 'dc,ac', 'per_page': 5}},
+            {'path': f'/api/cargas/{sample_station.id}'},
+            {'path': '/api/cargas/999999'},
+            {'path': '/auth/permissions'},
+            {'path': '/auth/profile?unused=1'}
+        ]}, headers=auth_headers)
+        responses = response.get_json()['responses']
+        
+        assert response.status_code == 200
+        assert [item['status'] for item in responses] == [200, 200, 404, 200, 200]
+        assert responses[0]['body']['total'] == 1
+        assert responses[1]['body']['name'] == sample_station.name
+        assert responses[3]['body']['role'] == 'user'
+        assert len(decoded) == 1
+    
+    def test_batch_stops_when_budget_is_spent(self, app, client, sample_station):
+        
+        app.config['BATCH_MAX_RESPONSE_BYTES'] = 1
+        
+        responses = client.post('/api/batch', json={'requests': [
+            {'path': '/api/cargas'},
+            {'path': '/api/cargas/stats'}
+        ]}).get_json()['responses']
+        
+        assert responses[0]['status'] == 200
+        assert responses[1]['status'] == 503
+    
+    def test_batch_rolls_back_failed_sub_requests(self, client, sample_station, monkeypatch):
+        
+        def failing_stats(cls):
+            db.session.add(ChargingStation(name=None))
+            db.session.flush()
+        
+        monkeypatch.setattr(ChargingStationService, 'get_station_stats', classmethod(failing_stats))
+        
+        responses = client.post('/api/batch', json={'requests': [
+            {'path': '/api/cargas/stats'},
+            {'path': '/api/cargas'}
+        ]}).get_json()['responses']
+        
+        assert responses[0]['status'] == 500
+        assert responses[1]['status'] == 200
+        assert responses[1]['body']['total'] == 1
+    
+    @pytest.mark.parametrize('body', [
+        {},
+        {'requests': []},
+        {'requests': [{'path': '/api/cargas', 'method': 'DELETE'}]},
+        {'requests': [{'path': '/api/cargas/events'}]},
+        {'requests': [{'path': '/api/batch'}]},
+        {'requests': [{'path': '/health/'}]},
+        {'requests': [{'path': '/api/cargas'}] * 21}
+    ])
+    def test_batch_rejects_invalid_batches(self, client, body):
+        
+        assert client.post('/api/batch', json=body).status_code == 400
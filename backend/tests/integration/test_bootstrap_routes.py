@@ -0,0 +1,55 @@
+import pytest
+from app.services.bootstrap_service import BootstrapService
+
+
+class TestBootstrapRoutes:
+    
+    
+    def test_bootstrap_returns_every_part(self, client, admin_headers, sample_station):
+        
+        response = client.get('/api/bootstrap?type=dc,ac&per_page=10', headers=admin_headers)
+        data = response.get_json()
+        
+        assert response.status_code == 200
+        assert data['stations']['total'] == 1
+        assert data['stations']['stations'][0]['id'] == sample_station.id
+        assert data['stats']['total_stations'] == 1
+        assert data['facets']['state'] == [{'value': 'SP', 'count': 1}]
+        assert data['permissions']['is_admin'] is True
+        assert data['permissions']['role'] == 'admin'
+        assert set(data['timings']['parts']) == {'stations', 'facets', 'stats', 'permissions'}
+        assert 'total;dur=' in response.headers['Server-Timing']
+    
+    def test_bootstrap_without_token_and_with_selected_parts(self, client):
+        
+        data = client.get('/api/bootstrap?include=stations,permissions').get_json()
+        
+        assert data['permissions'] is None
+        assert data['stations']['total'] == 0
+        assert 'stats' not in data
+    
+    def test_bootstrap_runs_parts_concurrently(self, client, sample_station, monkeypatch):
+        
+        monkeypatch.setattr(BootstrapService, 'runs_concurrently', classmethod(lambda cls: True))
+        
+        data = client.get('/api/bootstrap?include=stations,stats').get_json()
+        
+        assert data['timings']['concurrent'] is True
+        assert data['stations']['total'] == 1
+        assert data['stats']['total_stations'] == 1
+    
+    def test_bootstrap_rejects_bad_input(self, client):
+        
+        assert client.get('/api/bootstrap?include=weather').status_code == 400
+    
+    def test_bootstrap_with_invalid_token_serves_anonymous_permissions(self, client, sample_station):
+        
+        response = client.get(
+            '/api/bootstrap?include=stations,permissions',
+            headers={'Authorization': 'Bearer nope'}
+        )
+        data = response.get_json()
+        
+        assert response.status_code == 200
+        assert data['permissions'] is None
+        assert data['stations']['total'] == 1
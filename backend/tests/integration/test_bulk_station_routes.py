@@ -0,0 +1,461 @@
+import gzip
+import json
+import os
+
+import pytest
+from app.models.charging_station import ChargingStation
+from app.services.auth_service import AuthService
+from app.utils.availability import availability_store
+from app.utils.snapshots import snapshot_writer
+
+
+def _station_payload(index=0, **overrides):
+    payload = {
+        'name': f'Bulk Station {index}',
+        'latitude': -23.5505,
+        'longitude': -46.6333,
+        'charger_type': 'dc',
+        'power_kw': 50.0,
+        'num_spots': 2,
+        'status': 'operational',
+        'state': 'sp',
+        'city': 'São Paulo'
+    }
+    payload.update(overrides)
+    return payload
+
+
+class TestBulkCreateRoutes:
+    
+    
+    def test_bulk_create_json_array(self, client, admin_headers):
+        
+        payload = [_station_payload(i) for i in range(5)]
+        
+        response = client.post('/api/cargas/bulk?batch_size=2',
+                             data=json.dumps(payload),
+                             content_type='application/json',
+                             headers=admin_headers)
+        
+        assert response.status_code == 201
+        data = response.get_json()
+        
+        assert data['created'] == 5
+        assert data['failed'] == 0
+        assert data['errors'] == []
+        
+        with client.application.app_context():
+            assert ChargingStation.query.count() == 5
+            assert ChargingStation.query.filter_by(state='SP', charger_type='DC').count() == 5
+    
+    def test_bulk_create_reports_errors_by_index(self, client, admin_headers):
+        
+        payload = [
+            _station_payload(0),
+            _station_payload(1, latitude=120.0),
+            'not a station',
+            _station_payload(3)
+        ]
+        
+        response = client.post('/api/cargas/bulk',
+                             data=json.dumps(payload),
+                             content_type='application/json',
+                             headers=admin_headers)
+        
+        assert response.status_code == 201
+        data = response.get_json()
+        
+        assert data['created'] == 2
+        assert data['failed'] == 2
+        assert [error['index'] for error in data['errors']] == [1, 2]
+        assert data['errors'][0]['errors'][0]['field'] == 'latitude'
+    
+    def test_bulk_create_ndjson_stream(self, client, admin_headers):
+        
+        lines = [json.dumps(_station_payload(i)) for i in range(3)]
+        lines.insert(1, '{broken')
+        
+        response = client.post('/api/cargas/bulk',
+                             data='\n'.join(lines) + '\n',
+                             content_type='application/x-ndjson',
+                             headers=admin_headers)
+        
+        assert response.status_code == 201
+        data = response.get_json()
+        
+        assert data['created'] == 3
+        assert data['errors'][0]['index'] == 1
+    
+    def test_bulk_create_nothing_valid(self, client, admin_headers):
+        
+        response = client.post('/api/cargas/bulk',
+                             data=json.dumps([{'name': 'Incomplete'}]),
+                             content_type='application/json',
+                             headers=admin_headers)
+        
+        assert response.status_code == 400
+        assert response.get_json()['created'] == 0
+    
+    def test_bulk_create_requires_array(self, client, admin_headers):
+        
+        response = client.post('/api/cargas/bulk',
+                             data=json.dumps(_station_payload()),
+                             content_type='application/json',
+                             headers=admin_headers)
+        
+        assert response.status_code == 400
+    
+    def test_bulk_create_forbidden_user(self, client, auth_headers):
+        
+        response = client.post('/api/cargas/bulk',
+                             data=json.dumps([_station_payload()]),
+                             content_type='application/json',
+                             headers=auth_headers)
+        
+        assert response.status_code == 403
+
+
+class TestBulkStatusRoutes:
+    
+    
+    def _create_stations(self, client, admin_headers):
+        
+        payload = [
+            _station_payload(0, state='SP'),
+            _station_payload(1, state='SP', charger_type='AC'),
+            _station_payload(2, state='RJ')
+        ]
+        client.post('/api/cargas/bulk',
+                    data=json.dumps(payload),
+                    content_type='application/json',
+                    headers=admin_headers)
+    
+    def test_bulk_status_by_filter(self, client, admin_headers):
+        
+        self._create_stations(client, admin_headers)
+        
+        response = client.patch('/api/cargas/status',
+                              data=json.dumps({'status': 'maintenance', 'filters': {'state': 'SP'}}),
+                              content_type='application/json',
+                              headers=admin_headers)
+        
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['updated'] == 2
+        assert data['status'] == 'MAINTENANCE'
+        
+        with client.application.app_context():
+            assert ChargingStation.query.filter_by(status='MAINTENANCE').count() == 2
+            assert ChargingStation.query.filter_by(state='RJ', status='OPERATIONAL').count() == 1
+    
+    def test_bulk_status_by_ids(self, client, admin_headers):
+        
+        self._create_stations(client, admin_headers)
+        
+        with client.application.app_context():
+            ids = [station.id for station in ChargingStation.query.filter_by(state='SP')]
+        
+        response = client.patch('/api/cargas/status',
+                              data=json.dumps({'status': 'INACTIVE', 'ids': ids, 'filters': {'type': 'AC'}}),
+                              content_type='application/json',
+                              headers=admin_headers)
+        
+        assert response.status_code == 200
+        assert response.get_json()['updated'] == 1
+    
+    def test_bulk_status_requires_selection(self, client, admin_headers):
+        
+        response = client.patch('/api/cargas/status',
+                              data=json.dumps({'status': 'INACTIVE'}),
+                              content_type='application/json',
+                              headers=admin_headers)
+        
+        assert response.status_code == 400
+    
+    def test_bulk_status_rejects_unusable_filters(self, client, admin_headers):
+        
+        self._create_stations(client, admin_headers)
+        
+        for filters in ({'min_power': 'abc'}, {'available': 'maybe'}, {'city_match': 'exact'},
+                        {'stat': 'SP'}, {'state': ''}):
+            response = client.patch('/api/cargas/status',
+                                  data=json.dumps({'status': 'INACTIVE', 'filters': filters}),
+                                  content_type='application/json',
+                                  headers=admin_headers)
+            
+            assert response.status_code == 400
+        
+        with client.application.app_context():
+            assert ChargingStation.query.filter_by(status='INACTIVE').count() == 0
+    
+    def test_bulk_status_rejects_non_integer_ids(self, client, admin_headers):
+        
+        self._create_stations(client, admin_headers)
+        
+        for ids in ([True], ['1'], [1.0]):
+            response = client.patch('/api/cargas/status',
+                                  data=json.dumps({'status': 'INACTIVE', 'ids': ids}),
+                                  content_type='application/json',
+                                  headers=admin_headers)
+            
+            assert response.status_code == 400
+        
+        with client.application.app_context():
+            assert ChargingStation.query.filter_by(status='INACTIVE').count() == 0
+    
+    def test_bulk_status_forbidden_user(self, client, auth_headers):
+        
+        response = client.patch('/api/cargas/status',
+                              data=json.dumps({'status': 'INACTIVE', 'ids': [1]}),
+                              content_type='application/json',
+                              headers=auth_headers)
+        
+        assert response.status_code == 403
+
+
+class TestUpsertRoutes:
+    
+    
+    def _upsert(self, client, admin_headers, stations, source='registry'):
+        
+        return client.post('/api/cargas/upsert',
+                           data=json.dumps({'source': source, 'stations': stations}),
+                           content_type='application/json',
+                           headers=admin_headers)
+    
+    def test_upsert_inserts_updates_and_skips_unchanged(self, client, admin_headers):
+        
+        stations = [_station_payload(i, external_id=f'ext-{i}') for i in range(3)]
+        
+        response = self._upsert(client, admin_headers, stations)
+        
+        assert response.status_code == 200
+        data = response.get_json()
+        assert (data['inserted'], data['updated'], data['unchanged']) == (3, 0, 0)
+        
+        with client.application.app_context():
+            original = ChargingStation.query.filter_by(external_id='ext-1').one()
+            original_id = original.id
+            original_updated_at = original.updated_at
+        
+        stations[1]['status'] = 'MAINTENANCE'
+        stations.append(_station_payload(3, external_id=3))
+        
+        response = self._upsert(client, admin_headers, stations)
+        
+        data = response.get_json()
+        assert (data['inserted'], data['updated'], data['unchanged']) == (1, 1, 2)
+        
+        with client.application.app_context():
+            assert ChargingStation.query.count() == 4
+            
+            updated = ChargingStation.query.filter_by(external_id='ext-1').one()
+            assert updated.id == original_id
+            assert updated.status == 'MAINTENANCE'
+            assert updated.updated_at >= original_updated_at
+            
+            unchanged = ChargingStation.query.filter_by(external_id='ext-0').one()
+            assert unchanged.updated_at == original_updated_at
+    
+    def test_upsert_scopes_external_id_by_source(self, client, admin_headers):
+        
+        self._upsert(client, admin_headers, [_station_payload(0, external_id='same')], source='a')
+        response = self._upsert(client, admin_headers, [_station_payload(0, external_id='same')], source='b')
+        
+        assert response.get_json()['inserted'] == 1
+        
+        with client.application.app_context():
+            assert ChargingStation.query.filter_by(external_id='same').count() == 2
+    
+    def test_upsert_requires_external_id(self, client, admin_headers):
+        
+        response = self._upsert(client, admin_headers, [_station_payload(0)])
+        
+        data = response.get_json()
+        assert data['failed'] == 1
+        assert data['errors'][0]['errors'][0]['field'] == 'external_id'
+    
+    def test_upsert_reports_duplicate_external_ids(self, client, admin_headers):
+        
+        stations = [
+            _station_payload(0, external_id='dup'),
+            _station_payload(1),
+            _station_payload(2, external_id='dup'),
+            _station_payload(3, external_id='other')
+        ]
+        
+        data = self._upsert(client, admin_headers, stations).get_json()
+        
+        assert (data['inserted'], data['updated'], data['unchanged'], data['failed']) == (2, 0, 0, 2)
+        assert [(error['index'], error['errors'][0]['field']) for error in data['errors']] == [
+            (1, 'external_id'), (2, 'external_id')
+        ]
+        assert data['errors'][1]['errors'][0]['message'] == 'Duplicate external_id in request'
+        
+        with client.application.app_context():
+            assert ChargingStation.query.filter_by(external_id='dup').one().name == _station_payload(0)['name']
+    
+    def test_upsert_requires_source(self, client, admin_headers):
+        
+        response = self._upsert(client, admin_headers, [_station_payload(0, external_id='x')], source='')
+        
+        assert response.status_code == 400
+    
+    def test_sync_dry_run(self, client, admin_headers):
+        
+        stations = [_station_payload(i, external_id=f'ext-{i}') for i in range(2)]
+        self._upsert(client, admin_headers, stations)
+        
+        stations[0]['name'] = 'Renamed'
+        response = client.post('/api/cargas/sync?dry_run=true&delete_missing=true',
+                             data=json.dumps({'source': 'registry', 'stations': stations[:1]}),
+                             content_type='application/json',
+                             headers=admin_headers)
+        
+        assert response.status_code == 200
+        data = response.get_json()
+        assert (data['inserted'], data['updated'], data['deleted']) == (0, 1, 1)
+        assert data['preview']['updates'] == ['ext-0']
+        
+        with client.application.app_context():
+            assert ChargingStation.query.filter_by(external_id='ext-0').one().name == 'Bulk Station 0'
+
+
+class TestStationChangeRoutes:
+    
+    
+    def test_initial_request_asks_for_full_download(self, client):
+        
+        response = client.get('/api/cargas/changes')
+        data = response.get_json()
+        
+        assert response.status_code == 200
+        assert data['reset'] is True
+        assert data['version'] == 0
+    
+    def test_changes_since_version(self, client, admin_headers):
+        
+        client.post('/api/cargas/bulk', data=json.dumps([_station_payload(i) for i in range(3)]),
+                    content_type='application/json', headers=admin_headers)
+        version = client.get('/api/cargas/changes').get_json()['version']
+        
+        stations = ChargingStation.query.order_by(ChargingStation.id).all()
+        client.put(f'/api/cargas/{stations[0].id}', data=json.dumps({'power_kw': 150.0}),
+                   content_type='application/json', headers=admin_headers)
+        client.put(f'/api/cargas/{stations[0].id}', data=json.dumps({'num_spots': 4}),
+                   content_type='application/json', headers=admin_headers)
+        client.delete(f'/api/cargas/{stations[1].id}', headers=admin_headers)
+        
+        data = client.get(f'/api/cargas/changes?since={version}').get_json()
+        
+        assert data['reset'] is False
+        assert [station['id'] for station in data['changes']] == [stations[0].id]
+        assert data['changes'][0]['power_kw'] == 150.0
+        assert data['changes'][0]['num_spots'] == 4
+        assert data['deleted'] == [stations[1].id]
+        
+        data = client.get(f"/api/cargas/changes?since={data['version']}").get_json()
+        assert data['changes'] == [] and data['deleted'] == []
+    
+    def test_changes_are_paged(self, client, admin_headers):
+        
+        client.post('/api/cargas', data=json.dumps(_station_payload(0)),
+                    content_type='application/json', headers=admin_headers)
+        client.post('/api/cargas/bulk', data=json.dumps([_station_payload(i) for i in range(1, 5)]),
+                    content_type='application/json', headers=admin_headers)
+        
+        data = client.get('/api/cargas/changes?since=1&limit=3').get_json()
+        assert len(data['changes']) == 3
+        assert data['has_more'] is True
+        
+        data = client.get(f"/api/cargas/changes?since={data['version']}&limit=3").get_json()
+        assert len(data['changes']) == 1
+        assert data['has_more'] is False
+
+
+class TestSnapshotRoutes:
+    
+    
+    @pytest.fixture(autouse=True)
+    def snapshot_directory(self, tmp_path):
+        
+        snapshot_writer.directory = str(tmp_path)
+    
+    def test_snapshot_is_served_from_disk(self, client, admin_headers):
+        
+        client.post('/api/cargas/bulk', data=json.dumps([_station_payload(i) for i in range(3)]),
+                    content_type='application/json', headers=admin_headers)
+        
+        response = client.get('/api/cargas/snapshot')
+        data = json.loads(response.get_data())
+        
+        assert response.status_code == 200
+        assert response.headers['Content-Length'] == str(len(response.get_data()))
+        assert data['count'] == 3
+        assert data['version'] == int(response.headers['X-Snapshot-Version'])
+        assert [station['name'] for station in data['stations']] == [f'Bulk Station {i}' for i in range(3)]
+        
+        response = client.get('/api/cargas/snapshot?shape=columnar', headers={'Accept-Encoding': 'gzip'})
+        data = json.loads(gzip.decompress(response.get_data()))
+        
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert data['stations']['name'] == [f'Bulk Station {i}' for i in range(3)]
+    
+    def test_conditional_request(self, client):
+        
+        etag = client.get('/api/cargas/snapshot').headers['ETag']
+        response = client.get('/api/cargas/snapshot', headers={'If-None-Match': etag})
+        
+        assert response.status_code == 304
+    
+    def test_snapshot_is_rewritten_after_debounce(self, app, client, admin_headers):
+        
+        first = client.get('/api/cargas/snapshot').headers['ETag']
+        
+        client.post('/api/cargas', data=json.dumps(_station_payload()),
+                    content_type='application/json', headers=admin_headers)
+        
+        assert snapshot_writer.refresh() is False
+        
+        snapshot_writer.debounce = 0
+        assert snapshot_writer.refresh() is True
+        
+        response = client.get('/api/cargas/snapshot')
+        assert response.headers['ETag'] != first
+        assert json.loads(response.get_data())['count'] == 1
+
+    def test_previous_generation_is_kept_until_next_write(self, client, admin_headers, tmp_path):
+        
+        first = snapshot_writer.write()
+        
+        client.post('/api/cargas', data=json.dumps(_station_payload()),
+                    content_type='application/json', headers=admin_headers)
+        second = snapshot_writer.write()
+        
+        assert os.path.exists(tmp_path / first['files']['rows']['plain']['name'])
+        
+        client.post('/api/cargas', data=json.dumps(_station_payload(1)),
+                    content_type='application/json', headers=admin_headers)
+        snapshot_writer.write()
+        
+        assert not os.path.exists(tmp_path / first['files']['rows']['plain']['name'])
+        assert os.path.exists(tmp_path / second['files']['rows']['gzip']['name'])
+        assert len([name for name in os.listdir(tmp_path) if name.startswith('stations-')]) == 8
+    
+    def test_availability_changes_make_snapshot_stale(self, client, sample_station):
+        
+        snapshot_writer.write()
+        snapshot_writer.debounce = 0
+        assert snapshot_writer.is_stale() is False
+        
+        client.post(f'/api/cargas/{sample_station.id}/spots/1/state',
+                    data=json.dumps({'state': 'AVAILABLE'}),
+                    content_type='application/json',
+                    headers={'X-Station-Key': AuthService.generate_station_key(sample_station.id)})
+        availability_store.flush()
+        
+        assert snapshot_writer.is_stale() is True
+        assert json.loads(client.get('/api/cargas/snapshot').get_data())['stations'][0]['available_spots'] is None
+        
+        snapshot_writer.refresh()
+        assert json.loads(client.get('/api/cargas/snapshot').get_data())['stations'][0]['available_spots'] == 1
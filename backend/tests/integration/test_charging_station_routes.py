@@ -3,6 +3,7 @@ import pytest
 import json
 from app.models.charging_station import ChargingStation
 from app.utils.database import db
+from app.utils.search import station_suggest_index
 
 
 class TestChargingStationRoutes:
@@ -318,3 +319,287 @@ class TestChargingStationRoutes:
             assert station['charger_type'] == 'AC'
             assert station['status'] == 'OPERATIONAL'
 
+    
+    def test_get_stations_columnar_shape(self, client, sample_station):
+        
+        response = client.get('/api/cargas?shape=columnar')
+        
+        assert response.status_code == 200
+        data = response.get_json()
+        
+        assert isinstance(data['stations'], dict)
+        assert data['stations']['id'] == [sample_station.id]
+        assert data['stations']['state'] == ['SP']
+        assert data['total'] == 1
+    
+    def test_get_stations_msgpack(self, client, sample_station):
+        
+        msgpack = pytest.importorskip('msgpack')
+        
+        response = client.get('/api/cargas', headers={'Accept': 'application/msgpack'})
+        
+        assert response.status_code == 200
+        assert response.mimetype == 'application/msgpack'
+        
+        data = msgpack.unpackb(response.data, raw=False)
+        assert data['total'] == 1
+        assert data['stations'][0]['name'] == sample_station.name
+    
+    def test_list_routes_negotiate_msgpack_and_columnar(self, client, sample_station):
+        
+        msgpack = pytest.importorskip('msgpack')
+        
+        response = client.get('/api/cargas/by-status/operational', headers={'Accept': 'application/msgpack'})
+        
+        assert response.status_code == 200
+        assert response.mimetype == 'application/msgpack'
+        
+        data = msgpack.unpackb(response.data, raw=False)
+        assert data['count'] == 1
+        assert data['status'] == 'OPERATIONAL'
+        assert data['stations'][0]['name'] == sample_station.name
+        
+        response = client.get('/api/cargas/by-type/ac?shape=columnar')
+        
+        assert response.status_code == 200
+        assert response.get_json()['stations']['id'] == [sample_station.id]
+    
+    def test_get_stations_defaults_to_json(self, client):
+        
+        response = client.get('/api/cargas', headers={'Accept': 'text/html'})
+        
+        assert response.status_code == 200
+        assert response.mimetype == 'application/json'
+
+    def test_city_filter_matches_unaccented_input(self, client, sample_station):
+        
+        response = client.get('/api/cargas?city=sao%20paulo')
+        assert response.get_json()['total'] == 1
+        
+        response = client.get('/api/cargas?city=SAO&city_match=prefix')
+        assert response.get_json()['total'] == 1
+        
+        response = client.get('/api/cargas/by-location?city=sao&city_match=exact')
+        assert response.get_json()['count'] == 0
+
+
+    def test_get_stations_with_facets(self, client):
+        
+        db.session.add_all([
+            ChargingStation(
+                name=f'Facet Station {index}', latitude=-23.55, longitude=-46.63,
+                charger_type=charger_type, power_kw=50.0, num_spots=2,
+                status=status, state=state, city=city
+            )
+            for index, (charger_type, status, state, city) in enumerate([
+                ('AC', 'OPERATIONAL', 'SP', 'São Paulo'),
+                ('DC', 'OPERATIONAL', 'SP', 'Campinas'),
+                ('DC', 'MAINTENANCE', 'SP', 'São Paulo'),
+                ('DC', 'OPERATIONAL', 'RJ', 'Rio de Janeiro')
+            ])
+        ])
+        db.session.commit()
+        
+        response = client.get('/api/cargas?type=DC&state=SP&facets=type,state,status')
+        data = response.get_json()
+        
+        assert response.status_code == 200
+        assert data['total'] == 2
+        assert data['facets']['type'] == [{'value': 'DC', 'count': 2}, {'value': 'AC', 'count': 1}]
+        assert data['facets']['state'] == [{'value': 'SP', 'count': 2}, {'value': 'RJ', 'count': 1}]
+        assert data['facets']['status'] == [{'value': 'MAINTENANCE', 'count': 1}, {'value': 'OPERATIONAL', 'count': 1}]
+        
+        data = client.get('/api/cargas?facets=city').get_json()
+        assert data['facets']['city'][0] == {'value': 'São Paulo', 'count': 2}
+    
+    def test_get_stations_with_unknown_facet(self, client):
+        
+        response = client.get('/api/cargas?facets=color')
+        
+        assert response.status_code == 400
+
+    def test_get_stations_with_multi_value_and_range_filters(self, client):
+        
+        db.session.add_all([
+            ChargingStation(
+                name=f'Grammar Station {index}', latitude=-23.55, longitude=-46.63,
+                charger_type=charger_type, power_kw=power_kw, num_spots=num_spots,
+                status='OPERATIONAL', state=state, city='Cidade'
+            )
+            for index, (charger_type, state, power_kw, num_spots) in enumerate([
+                ('AC', 'SP', 22.0, 2),
+                ('DC', 'SP', 150.0, 6),
+                ('BOTH', 'RJ', 50.0, 4),
+                ('DC', 'MG', 350.0, 8),
+                ('DC', 'BA', 150.0, 6)
+            ])
+        ])
+        db.session.commit()
+        
+        data = client.get('/api/cargas?type=DC,BOTH&state=SP,RJ,MG').get_json()
+        assert data['total'] == 3
+        
+        data = client.get('/api/cargas?type=dc&min_spots=5&max_spots=7&sort=-power_kw,state').get_json()
+        assert [station['state'] for station in data['stations']] == ['BA', 'SP']
+        
+        data = client.get('/api/cargas?sort=-num_spots,name').get_json()
+        assert [station['num_spots'] for station in data['stations']] == [8, 6, 6, 4, 2]
+    
+    def test_get_stations_updated_after(self, client, sample_station):
+        
+        data = client.get('/api/cargas?updated_after=2000-01-01T00:00:00Z').get_json()
+        assert data['total'] == 1
+        
+        data = client.get('/api/cargas?created_after=2999-01-01').get_json()
+        assert data['total'] == 0
+    
+    def test_get_stations_rejects_invalid_sort_and_dates(self, client):
+        
+        assert client.get('/api/cargas?sort=color').status_code == 400
+        assert client.get('/api/cargas?updated_after=yesterday').status_code == 400
+
+    def test_list_routes_stream_with_limit_and_cursor(self, app, client):
+        
+        db.session.add_all([
+            ChargingStation(
+                name=f'Stream Station {index}', latitude=-23.55, longitude=-46.63,
+                charger_type='DC', power_kw=50.0, num_spots=2,
+                status='OPERATIONAL', state='SP', city='São Paulo'
+            )
+            for index in range(5)
+        ])
+        db.session.commit()
+        
+        data = client.get('/api/cargas/by-status/operational').get_json()
+        assert data['count'] == 5
+        assert data['next_cursor'] is None
+        assert data['status'] == 'OPERATIONAL'
+        
+        first = client.get('/api/cargas/by-type/dc?limit=3').get_json()
+        second = client.get(f"/api/cargas/by-type/dc?limit=3&cursor={first['next_cursor']}").get_json()
+        
+        assert first['count'] == 3
+        assert second['count'] == 2
+        assert second['next_cursor'] is None
+        assert [station['name'] for station in first['stations'] + second['stations']] == [
+            f'Stream Station {index}' for index in range(5)
+        ]
+        
+        app.config['STATION_LIST_MAX_ROWS'] = 2
+        data = client.get('/api/cargas/by-location?state=SP&limit=50').get_json()
+        assert data['count'] == 2
+        assert data['next_cursor'] == data['stations'][-1]['id']
+    
+    def test_list_routes_reject_invalid_window(self, client):
+        
+        assert client.get('/api/cargas/by-status/operational?limit=0').status_code == 400
+        assert client.get('/api/cargas/by-type/dc?cursor=-1').status_code == 400
+
+    def test_get_stations_by_ids(self, client, sample_station):
+        
+        other = ChargingStation(
+            name='Second Station', latitude=-22.9, longitude=-43.2,
+            charger_type='AC', power_kw=22.0, num_spots=2,
+            status='OPERATIONAL', state='RJ', city='Rio de Janeiro'
+        )
+        db.session.add(other)
+        db.session.commit()
+        
+        data = client.get(f'/api/cargas?ids={other.id},999,{sample_station.id},{other.id}').get_json()
+        
+        assert [station['id'] for station in data['stations']] == [other.id, sample_station.id]
+        assert data['missing'] == [999]
+        assert data['count'] == 2
+        
+        response = client.post('/api/cargas/batch-get', data=json.dumps({'ids': [sample_station.id]}),
+                               content_type='application/json')
+        
+        assert response.status_code == 200
+        assert response.get_json()['stations'][0]['name'] == sample_station.name
+    
+    def test_get_stations_by_ids_validation(self, app, client):
+        
+        app.config['STATION_BATCH_GET_MAX_IDS'] = 2
+        
+        assert client.get('/api/cargas?ids=1,two').status_code == 400
+        assert client.get('/api/cargas?ids=1,2,3').status_code == 400
+        assert client.post('/api/cargas/batch-get', data=json.dumps({'ids': []}),
+                           content_type='application/json').status_code == 400
+        assert client.post('/api/cargas/batch-get', data='[1]',
+                           content_type='application/json').status_code == 400
+
+
+class TestStationSearchRoutes:
+    
+    
+    @pytest.fixture
+    def stations(self, app):
+        
+        stations = [
+            ChargingStation(
+                name='Shopping Ibirapuera', latitude=-23.61, longitude=-46.66,
+                charger_type='AC', power_kw=22.0, num_spots=4,
+                status='OPERATIONAL', state='SP', city='São Paulo'
+            ),
+            ChargingStation(
+                name='Aeroporto de Brasília', latitude=-15.87, longitude=-47.92,
+                charger_type='DC', power_kw=150.0, num_spots=6,
+                status='OPERATIONAL', state='DF', city='Brasília'
+            ),
+            ChargingStation(
+                name='Posto Brasil', latitude=-16.68, longitude=-49.26,
+                charger_type='DC', power_kw=50.0, num_spots=2,
+                status='OPERATIONAL', state='GO', city='Goiânia'
+            )
+        ]
+        db.session.add_all(stations)
+        db.session.commit()
+        return stations
+    
+    def test_search_is_ranked_and_typo_tolerant(self, client, stations):
+        
+        response = client.get('/api/cargas/search?q=aeroprto brasilia')
+        data = response.get_json()
+        
+        assert response.status_code == 200
+        assert data['results'][0]['name'] == 'Aeroporto de Brasília'
+        
+        data = client.get('/api/cargas/search?q=shopping ibirapuera').get_json()
+        assert [station['name'] for station in data['results']] == ['Shopping Ibirapuera']
+    
+    def test_search_follows_station_writes(self, client, admin_headers, stations):
+        
+        assert client.get('/api/cargas/search?q=goiania').get_json()['count'] == 1
+        
+        client.put(f'/api/cargas/{stations[2].id}', data=json.dumps({'name': 'Eletroposto Cerrado'}),
+                   content_type='application/json', headers=admin_headers)
+        
+        data = client.get('/api/cargas/search?q=cerrado').get_json()
+        assert [station['id'] for station in data['results']] == [stations[2].id]
+        
+        client.delete(f'/api/cargas/{stations[2].id}', headers=admin_headers)
+        assert client.get('/api/cargas/search?q=cerrado').get_json()['count'] == 0
+    
+    def test_search_requires_query(self, client):
+        
+        response = client.get('/api/cargas/search')
+        
+        assert response.status_code == 400
+
+    def test_suggest_follows_station_writes(self, client, admin_headers, stations):
+        
+        station_suggest_index.sync_interval = 0
+        
+        data = client.get('/api/cargas/suggest?prefix=bras').get_json()
+        assert [(item['text'], item['field'], item['count']) for item in data['suggestions']] == [
+            ('Brasil', 'name', 1), ('Brasília', 'city', 1), ('Brasília', 'name', 1)
+        ]
+        
+        client.put(f'/api/cargas/{stations[2].id}', data=json.dumps({'city': 'Brasília', 'state': 'DF'}),
+                   content_type='application/json', headers=admin_headers)
+        
+        data = client.get('/api/cargas/suggest?prefix=bras&field=city').get_json()
+        assert data['suggestions'] == [{'text': 'Brasília', 'field': 'city', 'count': 2}]
+        
+        response = client.get('/api/cargas/suggest?prefix=bras&field=state')
+        assert response.status_code == 400
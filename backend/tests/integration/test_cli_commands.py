@@ -0,0 +1,220 @@
+import json
+
+import pytest
+from app.models.charging_station import ChargingStation
+from app.models.import_checkpoint import ImportCheckpoint
+from app.utils.database import db
+
+
+CSV_HEADER = 'name,latitude,longitude,charger_type,power_kw,num_spots,status,state,city\n'
+
+
+def _csv_line(index, **overrides):
+    row = {
+        'name': f'Imported {index}',
+        'latitude': '-23.55',
+        'longitude': '-46.63',
+        'charger_type': 'DC',
+        'power_kw': '50',
+        'num_spots': '2',
+        'status': 'OPERATIONAL',
+        'state': 'SP',
+        'city': '"São Paulo, Centro"'
+    }
+    row.update(overrides)
+    return ','.join(row.values()) + '\n'
+
+
+class TestStationImportCommand:
+    
+    
+    def test_import_csv(self, app, runner, tmp_path):
+        
+        path = tmp_path / 'stations.csv'
+        lines = [_csv_line(i) for i in range(7)]
+        lines[3] = _csv_line(3, latitude='north')
+        path.write_text(CSV_HEADER + ''.join(lines), encoding='utf-8')
+        
+        result = runner.invoke(args=['stations', 'import', str(path), '--chunk-size', '2'])
+        
+        assert result.exit_code == 0, result.output
+        assert 'Import finished: 6 created, 1 failed' in result.output
+        assert 'Row 3:' in result.output
+        assert ChargingStation.query.count() == 6
+        assert ChargingStation.query.first().city == 'São Paulo, Centro'
+        assert ImportCheckpoint.query.count() == 0
+    
+    def test_import_csv_with_worker_pool(self, app, runner, tmp_path):
+        
+        path = tmp_path / 'stations.csv'
+        lines = [_csv_line(i) for i in range(11)]
+        lines[3] = _csv_line(3, latitude='north')
+        lines[8] = _csv_line(8, charger_type='XX')
+        path.write_text(CSV_HEADER + ''.join(lines), encoding='utf-8')
+        
+        result = runner.invoke(args=['stations', 'import', str(path), '--chunk-size', '2', '--workers', '2'])
+        
+        assert result.exit_code == 0, result.output
+        assert 'Import finished: 9 created, 2 failed' in result.output
+        assert result.output.index('Row 3:') < result.output.index('Row 8:')
+        assert [station.name for station in ChargingStation.query.order_by(ChargingStation.id)] == [
+            f'Imported {i}' for i in range(11) if i not in (3, 8)
+        ]
+        assert ImportCheckpoint.query.count() == 0
+    
+    def test_import_geojson(self, app, runner, tmp_path):
+        
+        features = [
+            {
+                'type': 'Feature',
+                'geometry': {'type': 'Point', 'coordinates': [-43.18, -22.97]},
+                'properties': {
+                    'name': f'Geo {i} {{braces}} [brackets]',
+                    'charger_type': 'ac',
+                    'power_kw': 22,
+                    'num_spots': 3,
+                    'status': 'operational',
+                    'state': 'RJ',
+                    'city': 'Rio de Janeiro'
+                }
+            }
+            for i in range(5)
+        ]
+        path = tmp_path / 'stations.geojson'
+        path.write_text(json.dumps({'type': 'FeatureCollection', 'features': features}), encoding='utf-8')
+        
+        result = runner.invoke(args=['stations', 'import', str(path), '--chunk-size', '2'])
+        
+        assert result.exit_code == 0, result.output
+        assert 'Import finished: 5 created, 0 failed' in result.output
+        
+        station = ChargingStation.query.first()
+        assert station.latitude == -22.97
+        assert station.longitude == -43.18
+        assert station.charger_type == 'AC'
+    
+    def test_import_resumes_from_checkpoint(self, app, runner, tmp_path):
+        
+        path = tmp_path / 'stations.csv'
+        header_and_first = CSV_HEADER + _csv_line(0) + _csv_line(1)
+        path.write_text(header_and_first + _csv_line(2) + _csv_line(3), encoding='utf-8')
+        
+        db.session.add(ImportCheckpoint(
+            source=str(path.resolve()),
+            byte_offset=len(header_and_first.encode('utf-8')),
+            rows=2,
+            created=2,
+            failed=0
+        ))
+        db.session.commit()
+        
+        result = runner.invoke(args=['stations', 'import', str(path)])
+        
+        assert result.exit_code == 0, result.output
+        assert 'Resuming' in result.output
+        assert 'Import finished: 4 created, 0 failed' in result.output
+        assert [station.name for station in ChargingStation.query.order_by(ChargingStation.id)] == [
+            'Imported 2', 'Imported 3'
+        ]
+    
+    def test_import_csv_multiline_fields_and_invalid_utf8(self, app, runner, tmp_path):
+        
+        path = tmp_path / 'stations.csv'
+        content = CSV_HEADER + _csv_line(0, name='"Imported\n0"') + _csv_line(1) + _csv_line(2)
+        path.write_bytes(content.encode('utf-8').replace(b'Imported 1', b'Imported \xff'))
+        
+        result = runner.invoke(args=['stations', 'import', str(path), '--chunk-size', '1'])
+        
+        assert result.exit_code == 0, result.output
+        assert 'Import finished: 2 created, 1 failed' in result.output
+        assert 'Row 1: Row is not valid UTF-8 text' in result.output
+        assert [station.name for station in ChargingStation.query.order_by(ChargingStation.id)] == [
+            'Imported\n0', 'Imported 2'
+        ]
+    
+    def test_import_unknown_extension(self, app, runner, tmp_path):
+        
+        path = tmp_path / 'stations.txt'
+        path.write_text('nothing', encoding='utf-8')
+        
+        result = runner.invoke(args=['stations', 'import', str(path)])
+        
+        assert result.exit_code != 0
+        assert 'Cannot detect import format' in result.output
+
+
+class TestStationGenerateCommand:
+    
+    
+    def test_generate_stations(self, app, runner):
+        
+        result = runner.invoke(args=['stations', 'generate', '250', '--seed', '5', '--batch-size', '100'])
+        
+        assert result.exit_code == 0, result.output
+        assert 'Generated 250 stations' in result.output
+        assert ChargingStation.query.count() == 250
+
+    def test_generated_stations_are_searchable_by_city(self, app, runner, client):
+        
+        result = runner.invoke(args=['stations', 'generate', '200', '--seed', '3'])
+        
+        assert result.exit_code == 0, result.output
+        assert ChargingStation.query.filter(ChargingStation.city_key.is_(None)).count() == 0
+        assert ChargingStation.query.filter(ChargingStation.content_hash.is_(None)).count() == 0
+        
+        expected = ChargingStation.query.filter_by(city='São Paulo').count()
+        data = client.get('/api/cargas?city=sao paulo&city_match=exact&per_page=1').get_json()
+        
+        assert expected > 0
+        assert data['total'] == expected
+
+
+class TestStationSyncCommand:
+    
+    
+    def test_sync_csv(self, app, runner, tmp_path):
+        
+        path = tmp_path / 'registry.csv'
+        header = CSV_HEADER.rstrip('\n') + ',external_id\n'
+        path.write_text(header + ''.join(_csv_line(i).rstrip('\n') + f',ext-{i}\n' for i in range(3)),
+                        encoding='utf-8')
+        
+        result = runner.invoke(args=['stations', 'sync', str(path), '--source', 'registry'])
+        assert result.exit_code == 0, result.output
+        assert 'Applied: 3 inserts, 0 updates, 0 deletes, 0 unchanged, 0 failed' in result.output
+        
+        result = runner.invoke(args=['stations', 'sync', str(path), '--source', 'registry', '--dry-run'])
+        assert 'Planned: 0 inserts, 0 updates, 0 deletes, 3 unchanged, 0 failed' in result.output
+
+
+class TestStationRefreshKeysCommand:
+    
+    
+    def test_refresh_keys(self, app, runner, sample_station):
+        
+        db.session.execute(ChargingStation.__table__.update().values(city_key=None))
+        db.session.commit()
+        
+        result = runner.invoke(args=['stations', 'refresh-keys', '--batch-size', '1'])
+        
+        assert result.exit_code == 0, result.output
+        assert 'Refreshed search keys of 1 stations' in result.output
+        assert db.session.get(ChargingStation, sample_station.id).city_key == 'sao paulo'
+
+
+class TestStationBenchReadsCommand:
+    
+    
+    def test_bench_reads(self, app, runner):
+        
+        runner.invoke(args=['stations', 'generate', '50'])
+        
+        result = runner.invoke(args=['stations', 'bench-reads', '--rows', '50'])
+        assert result.exit_code == 0, result.output
+        assert 'orm:' in result.output
+        assert 'dto:' in result.output
+        
+        result = runner.invoke(args=['stations', 'bench-reads', '--rows', '500'])
+        assert result.exit_code != 0
+        assert 'Only 50 stations stored' in result.output
+
@@ -0,0 +1,340 @@
+import json
+import time
+
+import pytest
+from app.models.charging_station import ChargingStation
+from app.models.meter_reading import MeterReading
+from app.models.station_spot import StationSpot
+from app.services.auth_service import AuthService
+from app.services.charging_station_service import ChargingStationService
+from app.services.telemetry_service import TelemetryService
+from app.utils.availability import availability_store
+from app.utils.database import db
+from app.utils.events import event_broadcaster
+from app.utils.heartbeats import heartbeat_monitor
+from app.utils.telemetry import telemetry_buffer
+
+
+class TestSpotStateRoutes:
+    
+    
+    def _post_state(self, client, station_id, spot_number, state, station_key=None):
+        
+        return client.post(f'/api/cargas/{station_id}/spots/{spot_number}/state',
+                           data=json.dumps({'state': state}),
+                           content_type='application/json',
+                           headers={'X-Station-Key': station_key or AuthService.generate_station_key(station_id)})
+    
+    def test_spot_states_are_buffered_and_flushed(self, client, sample_station):
+        
+        for spot_number in range(1, 5):
+            response = self._post_state(client, sample_station.id, spot_number, 'available')
+            assert response.status_code == 202
+        
+        self._post_state(client, sample_station.id, 2, 'OCCUPIED')
+        self._post_state(client, sample_station.id, 2, 'OCCUPIED')
+        
+        availability_store.flush()
+        assert availability_store.pending_count() == 0
+        assert StationSpot.query.filter_by(station_id=sample_station.id).count() == 4
+        
+        data = client.get(f'/api/cargas/{sample_station.id}').get_json()
+        assert data['available_spots'] == 3
+        
+        spot = StationSpot.query.filter_by(station_id=sample_station.id, spot_number=2).one()
+        assert spot.state == 'OCCUPIED'
+    
+    def test_available_filter(self, client, sample_station):
+        
+        other = ChargingStation(
+            name='Full Station', latitude=-22.9, longitude=-43.1,
+            charger_type='DC', power_kw=50.0, num_spots=1,
+            status='OPERATIONAL', state='RJ', city='Rio de Janeiro'
+        )
+        db.session.add(other)
+        db.session.commit()
+        
+        self._post_state(client, sample_station.id, 1, 'AVAILABLE')
+        self._post_state(client, other.id, 1, 'OCCUPIED')
+        availability_store.flush()
+        
+        available = client.get('/api/cargas?available=true').get_json()
+        assert [station['id'] for station in available['stations']] == [sample_station.id]
+        
+        full = client.get('/api/cargas?available=false').get_json()
+        assert [station['id'] for station in full['stations']] == [other.id]
+    
+    def test_spots_outside_station_are_ignored(self, client, sample_station):
+        
+        self._post_state(client, sample_station.id, 9, 'AVAILABLE')
+        self._post_state(client, 99999, 1, 'AVAILABLE')
+        
+        assert availability_store.flush() == 0
+        assert StationSpot.query.count() == 0
+    
+    def test_spot_state_requires_station_key(self, client, sample_station):
+        
+        response = self._post_state(client, sample_station.id, 1, 'AVAILABLE',
+                                    station_key=AuthService.generate_station_key(sample_station.id + 1))
+        
+        assert response.status_code == 401
+        assert availability_store.pending_count() == 0
+    
+    def test_flush_logs_station_changes(self, client, sample_station):
+        
+        version = client.get('/api/cargas/changes').get_json()['version']
+        
+        self._post_state(client, sample_station.id, 1, 'AVAILABLE')
+        availability_store.flush()
+        
+        data = client.get(f'/api/cargas/changes?since={version}').get_json()
+        assert [station['id'] for station in data['changes']] == [sample_station.id]
+        assert data['changes'][0]['available_spots'] == 1
+    
+    def test_invalid_spot_state(self, client, sample_station):
+        
+        response = self._post_state(client, sample_station.id, 1, 'BROKEN')
+        
+        assert response.status_code == 400
+        assert availability_store.pending_count() == 0
+
+
+class TestHeartbeatRoutes:
+    
+    
+    def test_station_key_requires_admin(self, client, auth_headers, admin_headers, sample_station):
+        
+        response = client.get(f'/api/cargas/{sample_station.id}/key', headers=auth_headers)
+        assert response.status_code == 403
+        
+        response = client.get(f'/api/cargas/{sample_station.id}/key', headers=admin_headers)
+        assert response.status_code == 200
+        assert response.get_json()['station_key'] == AuthService.generate_station_key(sample_station.id)
+    
+    def test_heartbeat_requires_station_key(self, client, sample_station):
+        
+        response = client.post(f'/api/cargas/{sample_station.id}/heartbeat')
+        assert response.status_code == 401
+        
+        response = client.post(f'/api/cargas/{sample_station.id}/heartbeat',
+                               headers={'X-Station-Key': AuthService.generate_station_key(sample_station.id + 1)})
+        assert response.status_code == 401
+        assert heartbeat_monitor.tracked_count() == 0
+    
+    def test_heartbeat_is_recorded(self, client, sample_station):
+        
+        response = client.post(f'/api/cargas/{sample_station.id}/heartbeat',
+                               headers={'X-Station-Key': AuthService.generate_station_key(sample_station.id)})
+        
+        assert response.status_code == 204
+        assert heartbeat_monitor.last_seen(sample_station.id) is not None
+    
+    def test_sweep_marks_silent_stations_and_revives_them(self, app, sample_station):
+        
+        heartbeat_monitor.beat(sample_station.id, now=time.monotonic() - heartbeat_monitor.timeout - 1)
+        
+        result = ChargingStationService.sweep_stale_stations()
+        assert result == {'stale': 1, 'revived': 0}
+        assert db.session.get(ChargingStation, sample_station.id).status == 'INACTIVE'
+        
+        heartbeat_monitor.beat(sample_station.id)
+        
+        result = ChargingStationService.sweep_stale_stations()
+        assert result == {'stale': 0, 'revived': 1}
+        assert db.session.get(ChargingStation, sample_station.id).status == 'OPERATIONAL'
+
+
+class TestTelemetryRoutes:
+    
+    
+    def _post_readings(self, client, station_id, readings):
+        
+        return client.post(f'/api/cargas/{station_id}/telemetry',
+                           data=json.dumps({'readings': readings}),
+                           content_type='application/json',
+                           headers={'X-Station-Key': AuthService.generate_station_key(station_id)})
+    
+    def test_readings_are_buffered_and_rolled_up(self, client, auth_headers, sample_station):
+        
+        start = int(time.time()) // 3600 * 3600 - 7200
+        readings = [
+            {'timestamp': start + offset, 'energy_kwh': 0.1, 'power_kw': 6.0 + offset // 60}
+            for offset in range(0, 180, 30)
+        ]
+        
+        response = self._post_readings(client, sample_station.id, readings)
+        assert response.status_code == 202
+        assert response.get_json()['accepted'] == 6
+        
+        telemetry_buffer.flush()
+        assert MeterReading.query.count() == 6
+        
+        TelemetryService.downsample()
+        
+        response = client.get(f'/api/cargas/{sample_station.id}/telemetry?resolution=1m&start={start}',
+                              headers=auth_headers)
+        points = response.get_json()['points']
+        
+        assert response.status_code == 200
+        assert [point['bucket_start'] for point in points] == [start, start + 60, start + 120]
+        assert points[1]['avg_power_kw'] == 7.0
+        assert points[1]['samples'] == 2
+        
+        response = client.get(f'/api/cargas/{sample_station.id}/telemetry?resolution=1h', headers=auth_headers)
+        hourly = response.get_json()['points']
+        
+        assert hourly[0]['bucket_start'] == start
+        assert hourly[0]['energy_kwh'] == pytest.approx(0.6)
+        assert hourly[0]['max_power_kw'] == 8.0
+    
+    def test_invalid_readings_are_rejected(self, client, sample_station):
+        
+        response = self._post_readings(client, sample_station.id, [{'timestamp': 'yesterday', 'energy_kwh': 1, 'power_kw': 1}])
+        assert response.status_code == 400
+        
+        response = self._post_readings(client, sample_station.id, [{'timestamp': 0, 'energy_kwh': -1, 'power_kw': 1}])
+        assert response.status_code == 400
+        
+        response = self._post_readings(client, sample_station.id, [])
+        assert response.status_code == 400
+        assert telemetry_buffer.pending_count() == 0
+    
+    def test_invalid_resolution(self, client, auth_headers, sample_station):
+        
+        response = client.get(f'/api/cargas/{sample_station.id}/telemetry?resolution=5m', headers=auth_headers)
+        
+        assert response.status_code == 400
+
+
+class TestStationEventRoutes:
+    
+    
+    @pytest.fixture(autouse=True)
+    def short_streams(self, app):
+        
+        app.config['EVENTS_STREAM_MAX_DURATION'] = 0.2
+        app.config['EVENTS_HEARTBEAT_INTERVAL'] = 0.05
+    
+    def _station_payload(self, **overrides):
+        
+        payload = {
+            'name': 'Event Station',
+            'latitude': -23.55,
+            'longitude': -46.63,
+            'charger_type': 'AC',
+            'power_kw': 22.0,
+            'num_spots': 2,
+            'status': 'OPERATIONAL',
+            'state': 'SP',
+            'city': 'São Paulo'
+        }
+        payload.update(overrides)
+        return payload
+    
+    def _parse_events(self, body):
+        
+        events = []
+        for block in body.split('\n\n'):
+            lines = dict(line.split(': ', 1) for line in block.split('\n') if ': ' in line and not line.startswith(':'))
+            if 'event' in lines:
+                events.append((lines['event'], json.loads(lines['data']), lines.get('id')))
+        return events
+    
+    def test_service_changes_are_replayed_after_last_event_id(self, client, admin_headers):
+        
+        first_id = event_broadcaster.last_event_id()
+        
+        response = client.post('/api/cargas', data=json.dumps(self._station_payload()),
+                               content_type='application/json', headers=admin_headers)
+        station_id = response.get_json()['station']['id']
+        
+        client.put(f'/api/cargas/{station_id}', data=json.dumps({'power_kw': 50.0}),
+                   content_type='application/json', headers=admin_headers)
+        ChargingStationService.bulk_update_status('MAINTENANCE', ids=[station_id])
+        client.delete(f'/api/cargas/{station_id}', headers=admin_headers)
+        
+        response = client.get('/api/cargas/events', headers={'Last-Event-ID': first_id})
+        events = self._parse_events(response.get_data(as_text=True))
+        
+        assert response.mimetype == 'text/event-stream'
+        assert [event_type for event_type, _, _ in events] == ['created', 'updated', 'batch', 'deleted']
+        assert events[1][1]['power_kw'] == 50.0
+        assert events[2][1]['operation'] == 'status'
+        assert [station['status'] for station in events[2][1]['stations']] == ['MAINTENANCE']
+        assert events[3][1]['id'] == station_id
+    
+    def test_events_are_filtered_per_subscriber(self, client, admin_headers):
+        
+        first_id = event_broadcaster.last_event_id()
+        
+        for payload in (self._station_payload(), self._station_payload(state='RJ', latitude=-22.9, longitude=-43.2)):
+            client.post('/api/cargas', data=json.dumps(payload),
+                        content_type='application/json', headers=admin_headers)
+        
+        response = client.get('/api/cargas/events?state=rj', headers={'Last-Event-ID': first_id})
+        events = self._parse_events(response.get_data(as_text=True))
+        assert [data['state'] for _, data, _ in events] == ['RJ']
+        
+        response = client.get('/api/cargas/events?bbox=-47,-24,-46,-23', headers={'Last-Event-ID': first_id})
+        events = self._parse_events(response.get_data(as_text=True))
+        assert [data['state'] for _, data, _ in events] == ['SP']
+    
+    def test_bulk_paths_publish_batched_events(self, client, admin_headers):
+        
+        first_id = event_broadcaster.last_event_id()
+        
+        rows = [
+            self._station_payload(external_id='a-1'),
+            self._station_payload(external_id='a-2', state='RJ', latitude=-22.9, longitude=-43.2)
+        ]
+        client.post('/api/cargas/bulk', data=json.dumps(rows[:1]),
+                    content_type='application/json', headers=admin_headers)
+        client.post('/api/cargas/upsert', data=json.dumps({'source': 'feed', 'stations': rows}),
+                    content_type='application/json', headers=admin_headers)
+        client.post('/api/cargas/sync?delete_missing=true', data=json.dumps({'source': 'feed', 'stations': rows[1:]}),
+                    content_type='application/json', headers=admin_headers)
+        
+        response = client.get('/api/cargas/events', headers={'Last-Event-ID': first_id})
+        events = self._parse_events(response.get_data(as_text=True))
+        
+        assert [(event_type, data['operation'], data['count']) for event_type, data, _ in events] == [
+            ('batch', 'created', 1), ('batch', 'created', 2), ('batch', 'deleted', 1)
+        ]
+        
+        response = client.get('/api/cargas/events?state=rj', headers={'Last-Event-ID': first_id})
+        events = self._parse_events(response.get_data(as_text=True))
+        
+        assert [(data['operation'], [station['state'] for station in data['stations']]) for _, data, _ in events] == [
+            ('created', ['RJ'])
+        ]
+    
+    def test_replay_buffer_is_capped_by_size(self, client):
+        
+        event_broadcaster.max_bytes = 2000
+        stations = [{'id': index, 'status': 'OPERATIONAL', 'state': 'SP', 'city': 'São Paulo',
+                     'latitude': -23.55, 'longitude': -46.63} for index in range(10)]
+        
+        first_id = event_broadcaster.publish('batch', {'operation': 'created', 'count': 10, 'stations': stations})
+        for _ in range(3):
+            event_broadcaster.publish('batch', {'operation': 'updated', 'count': 10, 'stations': stations})
+        
+        assert sum(event['size'] for event in event_broadcaster._buffer) <= 2000
+        assert event_broadcaster.resume(first_id)[1] is True
+        
+        response = client.get('/api/cargas/events', headers={'Last-Event-ID': first_id})
+        assert self._parse_events(response.get_data(as_text=True))[0][0] == 'reset'
+    
+    def test_unknown_last_event_id_sends_reset(self, client):
+        
+        response = client.get('/api/cargas/events', headers={'Last-Event-ID': 'stale:42'})
+        body = response.get_data(as_text=True)
+        
+        assert self._parse_events(body)[0][0] == 'reset'
+        assert ': heartbeat' in body
+        assert event_broadcaster.connection_count() == 0
+    
+    def test_invalid_bbox(self, client):
+        
+        response = client.get('/api/cargas/events?bbox=1,2,3')
+        
+        assert response.status_code == 400
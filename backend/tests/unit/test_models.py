@@ -1,7 +1,7 @@
 
 import pytest
 from app.models.user import User
-from app.models.charging_station import ChargingStation
+from app.models.charging_station import ChargingStation, StationRow
 from app.utils.database import db
 
 
@@ -154,3 +154,60 @@ class TestChargingStation:
             assert len(sp_city_stations) == 1
             assert sp_city_stations[0].city == 'São Paulo'
 
+    
+    def test_station_content_hash_maintained(self, app):
+        
+        with app.app_context():
+            station = ChargingStation(
+                name='Hash Station', latitude=-23.5505, longitude=-46.6333,
+                charger_type='AC', power_kw=22, num_spots=4,
+                status='OPERATIONAL', state='SP', city='São Paulo'
+            )
+            db.session.add(station)
+            db.session.commit()
+            
+            original_hash = station.content_hash
+            assert original_hash == ChargingStation.compute_content_hash({
+                'name': 'Hash Station', 'latitude': -23.5505, 'longitude': -46.6333,
+                'charger_type': 'AC', 'power_kw': 22.0, 'num_spots': 4,
+                'status': 'OPERATIONAL', 'state': 'SP', 'city': 'São Paulo'
+            })
+            
+            station.status = 'MAINTENANCE'
+            db.session.commit()
+            
+            assert station.content_hash != original_hash
+
+    def test_city_key_search_ignores_accents_and_case(self, app):
+        
+        with app.app_context():
+            db.session.add_all([
+                ChargingStation(
+                    name='SP Station', latitude=-23.5505, longitude=-46.6333,
+                    charger_type='AC', power_kw=22.0, num_spots=4,
+                    status='OPERATIONAL', state='SP', city='São Paulo'
+                ),
+                ChargingStation(
+                    name='GO Station', latitude=-16.6869, longitude=-49.2648,
+                    charger_type='DC', power_kw=50.0, num_spots=2,
+                    status='OPERATIONAL', state='GO', city='Goiânia'
+                )
+            ])
+            db.session.commit()
+            
+            assert ChargingStation.query.filter_by(city='Goiânia').one().city_key == 'goiania'
+            assert ChargingStation.get_by_location(city='GOIANIA', city_match='exact').count() == 1
+            assert ChargingStation.get_by_location(city='sao p', city_match='prefix').count() == 1
+            assert ChargingStation.get_by_location(city='paulo', city_match='prefix').count() == 0
+            assert ChargingStation.get_by_location(city='Paulo').count() == 1
+            assert ChargingStation.get_by_location(city='%').count() == 0
+
+    def test_station_row_matches_entity_dict(self, app, sample_station):
+        
+        row = db.session.execute(
+            db.select(*StationRow.columns()).where(ChargingStation.id == sample_station.id)
+        ).one()
+        
+        assert StationRow(*row).to_dict() == sample_station.to_dict()
+        assert not hasattr(StationRow(*row), '__dict__')
+
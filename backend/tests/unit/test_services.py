@@ -1,11 +1,21 @@
 
+import time
+from datetime import datetime, timedelta
+
 import pytest
 from unittest.mock import Mock, patch
 from app.services.auth_service import AuthService
 from app.services.charging_station_service import ChargingStationService
+from app.services.station_change_service import StationChangeService
+from app.services.telemetry_service import TelemetryService
+from app.utils.columnar import columnar_station_index
+from app.utils.generators import generate_stations
 from app.models.user import User
 from app.models.charging_station import ChargingStation
+from app.models.meter_reading import MeterReading, MeterRollup
+from app.models.station_change import StationChange
 from app.utils.database import db
+from app.utils.telemetry import telemetry_buffer
 
 
 class TestAuthService:
@@ -243,3 +253,307 @@ class TestChargingStationService:
             
             assert station is None
 
+    
+    def test_bulk_create_stations(self, app):
+        
+        with app.app_context():
+            rows = [
+                {
+                    'name': f'Bulk {i}',
+                    'latitude': -23.5,
+                    'longitude': -46.6,
+                    'charger_type': 'ac',
+                    'power_kw': 22.0,
+                    'num_spots': 2,
+                    'status': 'operational',
+                    'state': 'sp',
+                    'city': 'São Paulo'
+                }
+                for i in range(3)
+            ]
+            rows.append({'name': 'Invalid'})
+            
+            result = ChargingStationService.bulk_create_stations(iter(rows), batch_size=2)
+            
+            assert result['created'] == 3
+            assert result['failed'] == 1
+            assert result['errors'][0]['index'] == 3
+            assert ChargingStation.query.filter_by(charger_type='AC', state='SP').count() == 3
+    
+    def test_bulk_update_status(self, app, sample_station):
+        
+        with app.app_context():
+            other = ChargingStation(
+                name='Rio Station',
+                latitude=-22.9,
+                longitude=-43.1,
+                charger_type='DC',
+                power_kw=50.0,
+                num_spots=2,
+                status='OPERATIONAL',
+                state='RJ',
+                city='Rio de Janeiro'
+            )
+            db.session.add(other)
+            db.session.commit()
+            
+            updated = ChargingStationService.bulk_update_status('maintenance', filters={'state': 'SP'})
+            
+            assert updated == 1
+            
+            station = db.session.get(ChargingStation, sample_station.id)
+            db.session.refresh(station)
+            assert station.status == 'MAINTENANCE'
+            assert station.content_hash == ChargingStation.compute_content_hash(
+                {field: getattr(station, field) for field in ChargingStation.data_fields}
+            )
+            assert db.session.get(ChargingStation, other.id).status == 'OPERATIONAL'
+            
+            assert ChargingStationService.bulk_update_status('MAINTENANCE', ids=[sample_station.id]) == 0
+    
+    def test_bulk_update_status_requires_selection(self, app):
+        
+        with app.app_context():
+            with pytest.raises(ValueError, match="filter or a list of station ids"):
+                ChargingStationService.bulk_update_status('MAINTENANCE')
+            
+            with pytest.raises(ValueError, match="status must be one of"):
+                ChargingStationService.bulk_update_status('BROKEN', ids=[1])
+
+
+class TestStationSyncService:
+    
+    
+    def _feed(self, count):
+        
+        return [
+            {
+                'external_id': f'reg-{i}',
+                'name': f'Registry {i}',
+                'latitude': -23.5,
+                'longitude': -46.6,
+                'charger_type': 'AC',
+                'power_kw': 22.0,
+                'num_spots': 2,
+                'status': 'OPERATIONAL',
+                'state': 'SP',
+                'city': 'São Paulo'
+            }
+            for i in range(count)
+        ]
+    
+    def test_sync_plans_minimal_changes(self, app):
+        
+        from app.services.station_sync_service import StationSyncService
+        
+        with app.app_context():
+            result = StationSyncService.sync('registry', self._feed(4))
+            assert (result['inserted'], result['updated'], result['unchanged']) == (4, 0, 0)
+            
+            feed = self._feed(3)
+            feed[0]['power_kw'] = 50.0
+            feed.append(dict(feed[1]))
+            
+            plan = StationSyncService.plan('registry', feed, delete_missing=True)
+            
+            assert [row['external_id'] for row in plan['updates']] == ['reg-0']
+            assert plan['inserts'] == []
+            assert plan['unchanged'] == 2
+            assert plan['errors'][0]['index'] == 3
+            assert len(plan['deletes']) == 1
+            
+            StationSyncService.apply(plan)
+            
+            assert ChargingStation.query.filter_by(source='registry').count() == 3
+            assert ChargingStation.query.filter_by(external_id='reg-0').one().power_kw == 50.0
+            assert ChargingStation.query.filter_by(external_id='reg-3').first() is None
+    
+    def test_sync_dry_run_does_not_write(self, app):
+        
+        from app.services.station_sync_service import StationSyncService
+        
+        with app.app_context():
+            result = StationSyncService.sync('registry', self._feed(2), dry_run=True)
+            
+            assert result['dry_run'] is True
+            assert result['preview']['inserts'] == ['reg-0', 'reg-1']
+            assert ChargingStation.query.count() == 0
+    
+    def test_sync_treats_bulk_status_change_as_update(self, app):
+        
+        from app.services.station_sync_service import StationSyncService
+        
+        with app.app_context():
+            StationSyncService.sync('registry', self._feed(2))
+            ChargingStationService.bulk_update_status('MAINTENANCE', filters={'state': 'SP'})
+            
+            plan = StationSyncService.plan('registry', self._feed(2))
+            
+            assert len(plan['updates']) == 2
+
+
+class TestTelemetryService:
+    
+    
+    def test_parse_timestamp(self, app):
+        
+        assert TelemetryService.parse_timestamp(1700000000.5) == 1700000000
+        assert TelemetryService.parse_timestamp('1700000000') == 1700000000
+        assert TelemetryService.parse_timestamp('2023-11-14T22:13:20Z') == 1700000000
+        assert TelemetryService.parse_timestamp('not a date') is None
+        assert TelemetryService.parse_timestamp(True) is None
+    
+    def test_downsample_respects_grace_and_retention(self, app, sample_station):
+        
+        now = 1700000000 // 86400 * 86400 + 43200
+        telemetry_buffer.record([
+            {'station_id': sample_station.id, 'recorded_at': now - 3 * 86400, 'energy_kwh': 1.0, 'power_kw': 10.0},
+            {'station_id': sample_station.id, 'recorded_at': now - 600, 'energy_kwh': 2.0, 'power_kw': 20.0},
+            {'station_id': sample_station.id, 'recorded_at': now - 30, 'energy_kwh': 4.0, 'power_kw': 40.0}
+        ])
+        telemetry_buffer.flush()
+        
+        result = TelemetryService.downsample(now=now)
+        
+        assert result['rolled'] == {'1m': 2, '1h': 1, '1d': 1}
+        assert result['deleted']['raw'] == 1
+        assert MeterReading.query.count() == 2
+        
+        rollups = MeterRollup.query.filter_by(resolution='1m').order_by(MeterRollup.bucket_start).all()
+        assert [rollup.energy_kwh for rollup in rollups] == [1.0, 2.0]
+        
+        result = TelemetryService.downsample(now=now + 300)
+        assert result['rolled']['1m'] == 1
+        assert MeterRollup.query.filter_by(resolution='1m').count() == 3
+    
+    def test_late_readings_are_rolled_into_existing_buckets(self, app, sample_station):
+        
+        now = 1700000000 // 86400 * 86400 + 43200
+        reading = {'station_id': sample_station.id, 'energy_kwh': 1.0, 'power_kw': 10.0}
+        
+        telemetry_buffer.record([dict(reading, recorded_at=now - 7200), dict(reading, recorded_at=now - 600)])
+        telemetry_buffer.flush()
+        TelemetryService.downsample(now=now)
+        
+        telemetry_buffer.record([dict(reading, recorded_at=now - 7190, power_kw=30.0)])
+        telemetry_buffer.flush()
+        result = TelemetryService.downsample(now=now + 60)
+        
+        assert result['rolled']['1m'] == 1
+        
+        rollup = MeterRollup.query.filter_by(resolution='1m', bucket_start=now - 7200).one()
+        assert (rollup.energy_kwh, rollup.samples, rollup.power_max) == (2.0, 2, 30.0)
+        
+        hourly = MeterRollup.query.filter_by(resolution='1h', bucket_start=now - 7200).one()
+        assert (hourly.energy_kwh, hourly.samples) == (2.0, 2)
+    
+    def test_readings_older_than_raw_retention_are_rejected(self, app, sample_station):
+        
+        old_timestamp = int(time.time()) - app.config['TELEMETRY_RETENTION']['raw'] - 60
+        
+        with pytest.raises(ValueError):
+            TelemetryService.ingest_readings(sample_station.id, [
+                {'timestamp': old_timestamp, 'energy_kwh': 1.0, 'power_kw': 1.0}
+            ])
+
+
+class TestStationChangeService:
+    
+    
+    def test_compact_keeps_latest_entry_per_station(self, app, sample_station):
+        
+        sample_station.power_kw = 50.0
+        db.session.commit()
+        ChargingStationService.bulk_update_status('MAINTENANCE', ids=[sample_station.id])
+        
+        assert StationChange.query.count() == 3
+        
+        version = StationChangeService.current_version()
+        assert StationChangeService.compact() == 2
+        assert StationChangeService.current_version() == version
+        
+        changes = StationChangeService.get_changes(since=1)
+        assert [station['status'] for station in changes['changes']] == ['MAINTENANCE']
+
+    def test_recent_changes_are_held_back_by_commit_lag(self, app, sample_station):
+        
+        app.config['CHANGES_COMMIT_LAG'] = 60.0
+        db.session.query(StationChange).update({'changed_at': datetime.utcnow() - timedelta(minutes=5)})
+        db.session.commit()
+        settled = StationChangeService.current_version()
+        
+        sample_station.power_kw = 50.0
+        db.session.commit()
+        
+        assert StationChangeService.safe_version() == settled
+        assert StationChangeService.get_changes(since=0)['version'] == settled
+        assert StationChangeService.get_changes(since=settled)['changes'] == []
+        
+        app.config['CHANGES_COMMIT_LAG'] = 0.0
+        assert StationChangeService.get_changes(since=settled)['changes'][0]['power_kw'] == 50.0
+
+
+class TestColumnarReadEngine:
+    
+    
+    @pytest.fixture
+    def stations(self, app):
+        
+        pytest.importorskip('numpy')
+        
+        for batch in generate_stations(300, seed=11):
+            ChargingStationService.insert_bulk_rows([ChargingStationService._build_insert_row(row) for row in batch])
+    
+    def _both_engines(self, **kwargs):
+        
+        columnar_station_index.enabled = False
+        expected = ChargingStationService.get_stations_with_filters(**kwargs)
+        
+        columnar_station_index.enabled = True
+        try:
+            actual = ChargingStationService.get_stations_with_filters(**kwargs)
+        finally:
+            columnar_station_index.enabled = False
+        
+        return expected, actual
+    
+    @pytest.mark.parametrize('filters', [
+        None,
+        {'type': 'dc'},
+        {'state': 'SP', 'status': 'OPERATIONAL'},
+        {'city': 'sao', 'city_match': 'prefix'},
+        {'city': 'paulo'},
+        {'min_power': '50', 'max_power': '150', 'type': 'DC'},
+        {'type': 'dc,both', 'state': 'SP,RJ,MG', 'min_spots': '4'},
+        {'state': 'XX'}
+    ])
+    def test_matches_sql_engine(self, app, stations, filters):
+        
+        expected, actual = self._both_engines(page=2, per_page=20, filters=filters,
+                                              facets=['type', 'status', 'state', 'city'])
+        
+        assert actual == expected
+    
+    def test_follows_writes(self, app, stations):
+        
+        columnar_station_index.enabled = True
+        try:
+            before = ChargingStationService.get_stations_with_filters(filters={'state': 'AC'})['total']
+            
+            station = ChargingStation.query.filter(ChargingStation.state != 'AC').first()
+            ChargingStationService.update_station(station.id, {'state': 'AC', 'city': 'Rio Branco'})
+            assert ChargingStationService.get_stations_with_filters(filters={'state': 'AC'})['total'] == before + 1
+            
+            ChargingStationService.delete(station.id)
+            assert ChargingStationService.get_stations_with_filters(filters={'state': 'AC'})['total'] == before
+        finally:
+            columnar_station_index.enabled = False
+    
+    def test_unsupported_filters_use_sql(self, app, stations):
+        
+        columnar_station_index.enabled = True
+        try:
+            assert columnar_station_index.supports({'available': 'true'}) is False
+            assert ChargingStationService.get_stations_with_filters(filters={'available': 'true'})['total'] == 0
+        finally:
+            columnar_station_index.enabled = False
@@ -0,0 +1,301 @@
+import pytest
+from collections import Counter
+from types import SimpleNamespace
+
+from app.models.station_change import StationChange
+from app.schemas.charging_station_schema import ChargingStationCreateSchema
+from app.utils.database import db
+from app.utils.generators import STATE_CITIES, generate_stations
+from app.utils.heartbeats import HeartbeatMonitor
+from app.utils.search import StationSearchIndex, StationSuggestIndex, tokenize
+from app.utils.serializers import ResponseSerializer, get_serializer
+from app.utils.station_filters import StatementCache, StationFilterSpec, station_statement_cache
+
+
+class TestStationGenerator:
+    
+    
+    def test_generator_is_deterministic(self):
+        
+        first = [row for batch in generate_stations(500, seed=7, batch_size=128) for row in batch]
+        second = [row for batch in generate_stations(500, seed=7, batch_size=128) for row in batch]
+        other = [row for batch in generate_stations(500, seed=8, batch_size=128) for row in batch]
+        
+        assert len(first) == 500
+        assert first == second
+        assert first != other
+    
+    def test_generated_rows_are_valid(self):
+        
+        rows = next(generate_stations(200, seed=1))
+        
+        for row in rows:
+            assert ChargingStationCreateSchema(row).is_valid()
+            assert row['state'] in STATE_CITIES
+    
+    def test_generated_distribution(self):
+        
+        rows = [row for batch in generate_stations(20000, seed=3) for row in batch]
+        
+        states = Counter(row['state'] for row in rows)
+        statuses = Counter(row['status'] for row in rows)
+        
+        assert states.most_common(1)[0][0] == 'SP'
+        assert len(states) == len(STATE_CITIES)
+        assert statuses['OPERATIONAL'] > statuses['MAINTENANCE'] > statuses['INACTIVE']
+
+
+class TestAvailabilityStore:
+    
+    
+    def test_record_coalesces_writes_per_spot(self):
+        
+        from app.utils.availability import AvailabilityStore
+        
+        store = AvailabilityStore()
+        store.flush_interval = 3600
+        store.max_pending = 3
+        
+        assert store.record(1, 1, 'OCCUPIED') is False
+        assert store.record(1, 1, 'AVAILABLE') is False
+        assert store.record(1, 2, 'AVAILABLE') is False
+        assert store.pending_count() == 2
+        
+        assert store.record(2, 1, 'AVAILABLE') is True
+
+
+class TestPeriodicTasks:
+    
+    
+    def test_tasks_start_with_the_first_served_request(self, app):
+        
+        app.config['BACKGROUND_TASKS_ENABLED'] = True
+        tasks = app.extensions['periodic_tasks'].values()
+        
+        app.test_cli_runner().invoke(args=['stations', 'refresh-keys'])
+        assert not any(task._thread for task in tasks)
+        
+        try:
+            app.test_client().get('/health/')
+            assert all(task._thread.is_alive() for task in tasks)
+        finally:
+            for task in tasks:
+                task.stop()
+
+
+class TestHeartbeatMonitor:
+    
+    
+    def test_only_silent_stations_expire(self):
+        
+        monitor = HeartbeatMonitor()
+        monitor.timeout = 10
+        
+        monitor.beat(1, now=0)
+        monitor.beat(2, now=0)
+        monitor.beat(1, now=8)
+        
+        assert monitor.collect(now=5) == ([], [])
+        assert monitor.collect(now=12) == ([2], [])
+        assert monitor.collect(now=19) == ([1], [])
+        assert monitor.tracked_count() == 0
+    
+    def test_beat_after_expiry_revives_station(self):
+        
+        monitor = HeartbeatMonitor()
+        monitor.timeout = 10
+        
+        monitor.beat(1, now=0)
+        assert monitor.collect(now=11) == ([1], [])
+        
+        monitor.beat(1, now=12)
+        assert monitor.collect(now=13) == ([], [1])
+        assert monitor.tracked_count() == 1
+    
+    def test_sweep_is_due_after_interval(self):
+        
+        monitor = HeartbeatMonitor()
+        monitor.sweep_interval = 5
+        monitor.collect(now=0)
+        
+        assert monitor.beat(1, now=3) is False
+        assert monitor.beat(1, now=6) is True
+
+
+class TestStationSearchIndex:
+    
+    
+    def test_tokenize_folds_accents_and_drops_stopwords(self):
+        
+        assert tokenize('Estação de São José dos Campos') == ['estacao', 'sao', 'jose', 'campos']
+    
+    def test_index_updates_incrementally(self):
+        
+        index = StationSearchIndex()
+        index.add(1, 'Shopping Eldorado', 'São Paulo')
+        index.add(2, 'Posto Paulista', 'Campinas')
+        
+        assert [station_id for station_id, _ in index.search('eldorado')] == [1]
+        assert [station_id for station_id, _ in index.search('paulo')][0] == 1
+        
+        index.remove(1)
+        
+        assert index.search('eldorado') == []
+        assert index.document_count() == 1
+    
+    def test_name_matches_outrank_city_matches(self):
+        
+        index = StationSearchIndex()
+        index.add(1, 'Posto Centro', 'Campinas')
+        index.add(2, 'Campinas Shopping', 'Sorocaba')
+        
+        assert [station_id for station_id, _ in index.search('campinas')] == [2, 1]
+
+    def test_sync_stops_at_the_commit_lag_watermark(self, app, sample_station):
+        
+        index = StationSearchIndex()
+        assert index.sync() == 1
+        
+        sample_station.name = 'Eletroposto Cerrado'
+        db.session.commit()
+        app.config['CHANGES_COMMIT_LAG'] = 60.0
+        
+        assert index.sync() == 0
+        assert index.search('cerrado') == []
+        
+        app.config['CHANGES_COMMIT_LAG'] = 0.0
+        
+        assert index.sync() == 1
+        assert [station_id for station_id, _ in index.search('cerrado')] == [sample_station.id]
+        assert index.version == StationChange.current_version()
+
+
+class TestStationSuggestIndex:
+    
+    
+    def test_suggestions_are_ranked_by_station_count(self):
+        
+        index = StationSuggestIndex()
+        index.add(1, 'Shopping Santos', 'Santos')
+        index.add(2, 'Posto Santa Cruz', 'São Paulo')
+        index.add(3, 'Estação Sé', 'São Paulo')
+        index.add(4, 'Eletroposto Sao', 'Sao Paulo')
+        
+        assert index.suggest('sa') == [
+            {'text': 'São Paulo', 'field': 'city', 'count': 3},
+            {'text': 'Santa', 'field': 'name', 'count': 1},
+            {'text': 'Santos', 'field': 'city', 'count': 1},
+            {'text': 'Santos', 'field': 'name', 'count': 1},
+            {'text': 'Sao', 'field': 'name', 'count': 1}
+        ]
+        assert index.suggest('SAN', field='city') == [{'text': 'Santos', 'field': 'city', 'count': 1}]
+    
+    def test_name_suggestions_keep_the_most_common_spelling(self):
+        
+        index = StationSuggestIndex()
+        index.add(1, 'Posto São Bento', 'Santos')
+        index.add(2, 'Shopping São Bento', 'Santos')
+        index.add(3, 'Posto Sao Jorge', 'Santos')
+        
+        assert index.suggest('sao', field='name') == [{'text': 'São', 'field': 'name', 'count': 3}]
+        
+        index.remove(1)
+        index.remove(2)
+        
+        assert index.suggest('sao', field='name') == [{'text': 'Sao', 'field': 'name', 'count': 1}]
+    
+    def test_removal_updates_counts(self):
+        
+        index = StationSuggestIndex()
+        index.add(1, 'Posto Centro', 'Campinas')
+        index.add(2, 'Posto Norte', 'Campinas')
+        
+        index.remove(1)
+        assert index.suggest('cam') == [{'text': 'Campinas', 'field': 'city', 'count': 1}]
+        
+        index.remove(2)
+        assert index.suggest('cam') == []
+        assert index.suggest('p') == []
+
+
+class TestResponseSerializers:
+    
+    
+    def test_serializers_must_implement_dumps(self):
+        
+        class IncompleteSerializer(ResponseSerializer):
+            mimetype = 'text/plain'
+        
+        with pytest.raises(TypeError):
+            ResponseSerializer()
+        
+        with pytest.raises(TypeError):
+            IncompleteSerializer()
+        
+        assert get_serializer('application/json').mimetype == 'application/json'
+        assert get_serializer('text/csv') is None
+
+
+class TestStationFilterSpec:
+    
+    
+    def test_same_shape_shares_a_statement(self, app):
+        
+        station_statement_cache.clear()
+        
+        first = StationFilterSpec({'type': 'DC', 'state': 'SP,RJ', 'min_power': '50'})
+        second = StationFilterSpec({'type': 'ac,both', 'state': 'MG', 'min_power': '22'})
+        other = StationFilterSpec({'type': 'DC', 'max_power': '50'})
+        
+        assert first.shape == second.shape != other.shape
+        assert second.params['filter_type'] == ['AC', 'BOTH']
+        
+        first.fetch(limit=10)
+        second.fetch(limit=10, offset=10)
+        other.fetch(limit=10)
+        
+        assert station_statement_cache.stats()['hits'] == 1
+        assert station_statement_cache.stats()['misses'] == 2
+    
+    def test_city_prefix_does_not_depend_on_collation(self, app, monkeypatch):
+        
+        spec = StationFilterSpec({'city': 'São Pa', 'city_match': 'prefix'})
+        assert (spec.values['city_low'], spec.values['city_high']) == ('sao pa', 'sao pb')
+        
+        bind = SimpleNamespace(dialect=SimpleNamespace(name='postgresql'))
+        monkeypatch.setattr(db.session, 'get_bind', lambda *args, **kwargs: bind)
+        spec = StationFilterSpec({'city': 'São_Pa', 'city_match': 'prefix'})
+        
+        assert spec.values == {'city_pattern': 'sao/_pa%'}
+        assert 'LIKE' in str(spec.criteria()[0])
+    
+    def test_invalid_values_and_bad_sorts_rejected(self):
+        
+        assert StationFilterSpec({'city_match': 'exact'}).shape == ()
+        assert StationFilterSpec(sort='-power_kw,name').sort == (('power_kw', True), ('name', False), ('id', False))
+        
+        with pytest.raises(ValueError):
+            StationFilterSpec({'min_spots': 'many'})
+        
+        with pytest.raises(ValueError):
+            StationFilterSpec({'available': 'maybe'})
+        
+        with pytest.raises(ValueError):
+            StationFilterSpec(sort='color')
+        
+        with pytest.raises(ValueError):
+            StationFilterSpec({'created_after': 'last week'})
+    
+    def test_cache_evicts_least_recently_used(self):
+        
+        cache = StatementCache()
+        cache.max_size = 2
+        
+        cache.get('a', lambda: 'A')
+        cache.get('b', lambda: 'B')
+        cache.get('a', lambda: 'A')
+        cache.get('c', lambda: 'C')
+        
+        assert cache.get('a', lambda: 'rebuilt') == 'A'
+        assert cache.get('b', lambda: 'rebuilt') == 'rebuilt'
+
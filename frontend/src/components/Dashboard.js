@@ -61,27 +61,13 @@ export default function Dashboard() {
   
   useEffect(() => {
     fetchStations();
-    fetchUserPermissions();
   }, [filters, pagination.page]);
 
-  const fetchUserPermissions = async () => {
-    try {
-      const token = localStorage.getItem('token');
-      if (token) {
-        const response = await axios.get('http://localhost:5000/auth/permissions', {
-          headers: { Authorization: `Bearer ${token}` }
-        });
-        setUserPermissions(response.data.permissions);
-      }
-    } catch (err) {
-      console.error('Error fetching permissions:', err);
-    }
-  };
-
   const fetchStations = async () => {
     try {
       setLoading(true);
       const params = new URLSearchParams({
+        include: 'stations,permissions',
         page: pagination.page,
         per_page: 50
       });
@@ -90,8 +76,15 @@ export default function Dashboard() {
       if (filters.status) params.append('status', filters.status);
       if (filters.state) params.append('state', filters.state);
 
-      const response = await axios.get(`http://localhost:5000/api/cargas?${params}`);
-      const data = response.data;
+      const token = localStorage.getItem('token');
+      const headers = token ? { Authorization: `Bearer ${token}` } : {};
+
+      const response = await axios.get(`http://localhost:5000/api/bootstrap?${params}`, { headers });
+      const data = response.data.stations;
+
+      if (response.data.permissions) {
+        setUserPermissions(response.data.permissions);
+      }
       
       setStations(data.stations);
       setFilteredStations(data.stations);